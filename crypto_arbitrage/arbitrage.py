@@ -6,8 +6,9 @@ Modul untuk mendeteksi dan menghitung peluang arbitrase
 """
 
 import logging
+import operator
 import threading
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Callable, Dict, List, Set, Tuple, Optional
 from datetime import datetime
 
 from config import (
@@ -30,12 +31,17 @@ class ArbitrageDetector:
         self.kucoin = kucoin_exchange
         self.modal_usd = modal_usd
         self.normalized_pairs = {}
-        self.arbitrage_opportunities = []
+        self.arbitrage_opportunities = ()  # Snapshot immutable, diganti utuh setiap perhitungan
         self.lock = threading.Lock()
         self.min_volume_usd = MIN_VOLUME_USD  # Minimal volume 24 jam dalam USD
         self.max_roi = MAX_PROFIT_THRESHOLD  # Maksimal ROI yang dianggap valid
         self.min_profit_threshold = MIN_PROFIT_THRESHOLD  # Minimal persentase keuntungan
         self.order_book_depth = ORDER_BOOK_DEPTH  # Kedalaman order book untuk perhitungan slippage
+        self.on_opportunities_update = None  # Callback setelah peluang arbitrase diperbarui
+
+    def set_opportunities_update_callback(self, callback: Callable):
+        """Set callback yang dipanggil setiap kali peluang arbitrase diperbarui"""
+        self.on_opportunities_update = callback
 
     def find_common_pairs(self) -> Dict[str, Dict[str, str]]:
         """Menemukan pasangan trading yang ada di kedua bursa"""
@@ -87,6 +93,9 @@ class ArbitrageDetector:
             # Buat salinan untuk menghindari race condition
             pairs_to_check = dict(self.normalized_pairs)
 
+        # Waktu acuan validasi dibaca sekali per scan, bukan per peluang
+        scan_now = datetime.now()
+
         for norm_pair, exchange_pairs in pairs_to_check.items():
             checked_pairs += 1
 
@@ -252,7 +261,7 @@ class ArbitrageDetector:
                     }
 
                     # Validasi peluang
-                    is_valid, reason = validate_arbitrage_opportunity(opportunity, self.max_roi)
+                    is_valid, reason = validate_arbitrage_opportunity(opportunity, self.max_roi, now=scan_now)
 
                     # Validasi tambahan: periksa apakah slippage terlalu tinggi
                     buy_slippage_pct = ((buy_price_with_slippage - buy_price) / buy_price) * 100
@@ -287,11 +296,16 @@ class ArbitrageDetector:
                 logger.error(f"Error menghitung arbitrase untuk {norm_pair}: {e}")
 
         # Urutkan berdasarkan keuntungan bersih (tertinggi ke terendah)
-        opportunities.sort(key=lambda x: x["net_profit_usd"], reverse=True)
+        opportunities.sort(key=operator.itemgetter("net_profit_usd"), reverse=True)
 
-        # Simpan top 10 peluang
+        # Simpan top 10 peluang sebagai tuple: pembaca (UI) bisa memakai snapshot
+        # yang sama tanpa menyalinnya setiap frame
         with self.lock:
-            self.arbitrage_opportunities = opportunities[:10]
+            self.arbitrage_opportunities = tuple(opportunities[:10])
+
+        # Beri tahu pembaca (UI) bahwa ada snapshot baru
+        if self.on_opportunities_update:
+            self.on_opportunities_update()
 
         # Log statistik
         logger.info(
@@ -302,10 +316,10 @@ class ArbitrageDetector:
 
         return opportunities
 
-    def get_opportunities(self) -> List[Dict]:
-        """Mendapatkan peluang arbitrase terkini"""
+    def get_opportunities(self) -> Tuple[Dict, ...]:
+        """Mendapatkan peluang arbitrase terkini (snapshot read-only, tanpa salinan)"""
         with self.lock:
-            return list(self.arbitrage_opportunities)
+            return self.arbitrage_opportunities
 
     async def update(self) -> None:
         """Update peluang arbitrase"""
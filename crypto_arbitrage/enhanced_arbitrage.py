@@ -41,6 +41,9 @@ from utils import (
 # Setup logging
 logger = setup_logging("enhanced_arbitrage.log", logging.INFO, logging.DEBUG)
 
+# Nama bursa untuk ditampilkan, disiapkan sekali alih-alih .upper() per baris setiap frame
+EXCHANGE_DISPLAY_NAMES = {"binance": "BINANCE", "kucoin": "KUCOIN"}
+
 # Variabel global
 running = True
 exchanges_ready = False
@@ -127,28 +130,31 @@ class ArbitrageUI:
                 style="italic"
             )
         else:
+            # Waktu acuan dibaca sekali per frame untuk semua pemeriksaan kedaluwarsa
+            now = datetime.now()
+            
             # Tambahkan baris untuk setiap peluang
             for opp in opportunities[:UI_MAX_OPPORTUNITIES]:
                 # Konversi profit ke IDR
                 profit_idr = opp["net_profit_usd"] * self.idr_rate
                 
                 # Periksa apakah peluang sudah kedaluwarsa
-                if is_opportunity_expired(opp["timestamp"]):
+                if is_opportunity_expired(opp["timestamp"], now=now):
                     continue
                 
                 # Validasi peluang
-                is_valid, _ = validate_arbitrage_opportunity(opp)
+                is_valid, _ = validate_arbitrage_opportunity(opp, now=now)
                 if not is_valid:
                     continue
                 
                 table.add_row(
                     opp["pair"],
-                    opp["buy_exchange"].upper(),
-                    opp["sell_exchange"].upper(),
+                    EXCHANGE_DISPLAY_NAMES[opp["buy_exchange"]],
+                    EXCHANGE_DISPLAY_NAMES[opp["sell_exchange"]],
                     f"{opp['price_diff_pct']:.2f}%",
                     f"{opp['base_asset']}: {opp['base_network']}, {opp['quote_asset']}: {opp['quote_network']}",
-                    format_currency(opp["net_profit_usd"], "USD"),
-                    format_currency(profit_idr, "IDR"),
+                    format_currency(round(opp["net_profit_usd"], 2), "USD"),
+                    format_currency(round(profit_idr, 2), "IDR"),
                     f"{opp['roi']:.2f}%"
                 )
         
@@ -156,8 +162,12 @@ class ArbitrageUI:
     
     def _generate_status_panel(self) -> Panel:
         """Membuat panel status"""
-        binance_status = "✅ Terhubung" if self.binance.is_connected() else "❌ Terputus"
-        kucoin_status = "✅ Terhubung" if self.kucoin.is_connected() else "❌ Terputus"
+        # Status koneksi dibaca sekali per frame dan dipakai untuk teks maupun warna
+        binance_connected = self.binance.is_connected()
+        kucoin_connected = self.kucoin.is_connected()
+        
+        binance_status = "✅ Terhubung" if binance_connected else "❌ Terputus"
+        kucoin_status = "✅ Terhubung" if kucoin_connected else "❌ Terputus"
         
         binance_stale = self.binance.is_stale()
         kucoin_stale = self.kucoin.is_stale()
@@ -171,8 +181,8 @@ class ArbitrageUI:
         
         status_text = Text.assemble(
             Text("Status Koneksi:\n", style="bold"),
-            Text(f"Binance: {binance_status}\n", style="green" if self.binance.is_connected() else "red"),
-            Text(f"KuCoin: {kucoin_status}\n\n", style="green" if self.kucoin.is_connected() else "red"),
+            Text(f"Binance: {binance_status}\n", style="green" if binance_connected else "red"),
+            Text(f"KuCoin: {kucoin_status}\n\n", style="green" if kucoin_connected else "red"),
             
             Text("Status Data:\n", style="bold"),
             Text(f"Binance: {binance_data_status}\n", style="green" if not binance_stale else "red"),
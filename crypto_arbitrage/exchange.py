@@ -12,7 +12,6 @@ import logging
 import websockets
 import requests
 from typing import Dict, List, Set, Optional, Any, Callable
-from datetime import datetime
 
 from utils import safe_float, exponential_backoff, normalize_symbol
 
@@ -27,9 +26,10 @@ class ExchangeBase:
         self.symbols = set()
         self.volumes = {}
         self.order_books = {}  # Cache untuk order book
-        self.order_book_timestamps = {}  # Timestamp untuk order book
+        self.order_book_timestamps = {}  # Timestamp (time.monotonic) untuk order book
         self.running = True
-        self.last_update = datetime.now()
+        # Waktu monotonic: hanya dipakai untuk menghitung umur data, kebal terhadap perubahan jam sistem
+        self.last_update = time.monotonic()
         self.retry_count = 0
         self.max_retries = 10
         self.ws = None
@@ -60,7 +60,7 @@ class ExchangeBase:
         if symbol not in self.order_book_timestamps:
             return True
 
-        age_seconds = (datetime.now() - self.order_book_timestamps[symbol]).total_seconds()
+        age_seconds = time.monotonic() - self.order_book_timestamps[symbol]
         return age_seconds > max_age_seconds
 
     async def connect(self):
@@ -79,7 +79,7 @@ class ExchangeBase:
 
     def is_stale(self, max_seconds: int = 60) -> bool:
         """Memeriksa apakah data sudah kedaluwarsa"""
-        seconds_since_update = (datetime.now() - self.last_update).total_seconds()
+        seconds_since_update = time.monotonic() - self.last_update
         return seconds_since_update > max_seconds
 
 
@@ -109,15 +109,16 @@ class BinanceExchange(ExchangeBase):
             data = response.json()
 
             if "bids" in data and "asks" in data:
-                # Format order book
+                # Format order book; harga dan jumlah dikonversi ke float sekali di sini,
+                # bukan setiap kali order book dari cache dipakai untuk menghitung slippage
                 order_book = {
-                    "bids": [[price, qty] for price, qty in data["bids"]],
-                    "asks": [[price, qty] for price, qty in data["asks"]]
+                    "bids": [[safe_float(price), safe_float(qty)] for price, qty in data["bids"]],
+                    "asks": [[safe_float(price), safe_float(qty)] for price, qty in data["asks"]]
                 }
 
                 # Simpan ke cache
                 self.order_books[symbol] = order_book
-                self.order_book_timestamps[symbol] = datetime.now()
+                self.order_book_timestamps[symbol] = time.monotonic()
 
                 logger.debug(f"Berhasil mengambil order book Binance untuk {symbol}")
                 return order_book
@@ -163,7 +164,7 @@ class BinanceExchange(ExchangeBase):
                 self.volumes[symbol] = volume
                 self.symbols.add(symbol)
 
-            self.last_update = datetime.now()
+            self.last_update = time.monotonic()
             logger.info(f"Berhasil mengambil {len(data)} ticker 24 jam dari Binance REST API")
 
             # Panggil callback jika ada
@@ -240,7 +241,7 @@ class BinanceExchange(ExchangeBase):
                                         update_count += 1
 
                                 if update_count > 0:
-                                    self.last_update = datetime.now()
+                                    self.last_update = time.monotonic()
                                     logger.debug(f"Diperbarui {update_count} harga Binance")
 
                                     # Panggil callback jika ada
@@ -305,15 +306,16 @@ class KuCoinExchange(ExchangeBase):
             data = response.json()
 
             if data["code"] == "200000" and "data" in data:
-                # Format order book
+                # Format order book; harga dan jumlah dikonversi ke float sekali di sini,
+                # bukan setiap kali order book dari cache dipakai untuk menghitung slippage
                 order_book = {
-                    "bids": [[price, qty] for price, qty in data["data"]["bids"]],
-                    "asks": [[price, qty] for price, qty in data["data"]["asks"]]
+                    "bids": [[safe_float(price), safe_float(qty)] for price, qty in data["data"]["bids"]],
+                    "asks": [[safe_float(price), safe_float(qty)] for price, qty in data["data"]["asks"]]
                 }
 
                 # Simpan ke cache
                 self.order_books[symbol] = order_book
-                self.order_book_timestamps[symbol] = datetime.now()
+                self.order_book_timestamps[symbol] = time.monotonic()
 
                 logger.debug(f"Berhasil mengambil order book KuCoin untuk {symbol}")
                 return order_book
@@ -380,7 +382,7 @@ class KuCoinExchange(ExchangeBase):
                     self.volumes[symbol] = volume
                     self.symbols.add(symbol)
 
-                self.last_update = datetime.now()
+                self.last_update = time.monotonic()
                 logger.info(f"Berhasil mengambil {len(data['data']['ticker'])} ticker dari KuCoin REST API")
 
                 # Panggil callback jika ada
@@ -463,7 +465,7 @@ class KuCoinExchange(ExchangeBase):
                                     self.volumes[symbol] = volume
                                     self.symbols.add(symbol)
 
-                                    self.last_update = datetime.now()
+                                    self.last_update = time.monotonic()
                                     logger.debug(f"Diperbarui harga KuCoin untuk {symbol}: {price}")
 
                                     # Panggil callback jika ada
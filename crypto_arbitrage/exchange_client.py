@@ -5,6 +5,7 @@
 Modul untuk menangani koneksi ke bursa cryptocurrency
 """
 
+import sys
 import json
 import time
 import asyncio
@@ -13,26 +14,76 @@ import requests
 import logging
 from typing import Dict, List, Tuple, Optional, Any, Callable
 
+# Pilih parser JSON tercepat yang tersedia: cysimdjson -> orjson -> json standar
+try:
+    import cysimdjson
+
+    _json_parser = cysimdjson.JSONParser()
+
+    def json_loads(data):
+        """Parse JSON dengan simdjson dan kembalikan objek Python biasa"""
+        if isinstance(data, str):
+            data = data.encode()
+        return _json_parser.parse(data).export()
+except ImportError:
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
 logger = logging.getLogger("crypto_arbitrage.exchange")
 
+# Interval minimum (detik) antar log frame tidak valid per bursa
+MALFORMED_FRAME_LOG_INTERVAL = 10
+_last_malformed_log: Dict[str, float] = {}
+
+def _log_malformed_frame(source: str, frame: Any) -> None:
+    """Mencatat frame yang tidak valid di level debug dengan pembatasan frekuensi"""
+    now = time.monotonic()
+    if now - _last_malformed_log.get(source, 0.0) >= MALFORMED_FRAME_LOG_INTERVAL:
+        _last_malformed_log[source] = now
+        logger.debug(f"Frame {source} tidak valid diabaikan: {str(frame)[:200]}")
+
+# Pesan berlangganan Binance diserialisasi sekali saja
+BINANCE_SUBSCRIBE_MSG = json.dumps({
+    "method": "SUBSCRIBE",
+    "params": ["!ticker@arr"],
+    "id": 1
+})
+
 class BinanceClient:
     """Klien untuk koneksi ke Binance WebSocket API"""
     
     def __init__(self):
         self.ws_url = "wss://stream.binance.com:9443/ws"
         self.rest_url = "https://api.binance.com/api/v3"
+        # Session persisten agar koneksi TLS tetap hangat antar request
+        self._session = requests.Session()
+        # Cache simbol ter-intern agar key dict dipakai ulang antar frame
+        self._symbol_intern: Dict[str, str] = {}
         self.prices = {}
-        self.symbols = set()
         self.callbacks = []
     
+    @property
+    def symbols(self):
+        """Simbol yang diketahui; view dari key `prices` tanpa salinan terpisah"""
+        return self.prices.keys()
+    
     def register_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Mendaftarkan callback untuk dijalankan saat data baru diterima"""
         self.callbacks.append(callback)
     
+    def _intern_symbol(self, symbol: str) -> str:
+        """Mengembalikan instance simbol yang sudah di-intern"""
+        interned = self._symbol_intern.get(symbol)
+        if interned is None:
+            interned = self._symbol_intern[symbol] = sys.intern(symbol)
+        return interned
+    
     async def get_exchange_info(self) -> Dict[str, Any]:
         """Mendapatkan informasi bursa dari REST API"""
         try:
-            response = requests.get(f"{self.rest_url}/exchangeInfo")
+            response = self._session.get(f"{self.rest_url}/exchangeInfo")
             return response.json()
         except Exception as e:
             logger.error(f"Error mendapatkan info bursa Binance: {e}")
@@ -41,7 +92,7 @@ class BinanceClient:
     async def get_all_tickers(self) -> List[Dict[str, Any]]:
         """Mendapatkan semua ticker dari REST API"""
         try:
-            response = requests.get(f"{self.rest_url}/ticker/price")
+            response = self._session.get(f"{self.rest_url}/ticker/price")
             return response.json()
         except Exception as e:
             logger.error(f"Error mendapatkan ticker Binance: {e}")
@@ -50,46 +101,43 @@ class BinanceClient:
     async def connect(self):
         """Menghubungkan ke WebSocket Binance"""
         try:
-            # Berlangganan ke semua ticker
-            subscribe_msg = {
-                "method": "SUBSCRIBE",
-                "params": ["!ticker@arr"],
-                "id": 1
-            }
-            
             async with websockets.connect(self.ws_url) as websocket:
                 logger.info("Terhubung ke Binance WebSocket")
                 
                 # Kirim pesan berlangganan
-                await websocket.send(json.dumps(subscribe_msg))
+                await websocket.send(BINANCE_SUBSCRIBE_MSG)
                 
                 while True:
+                    # Error koneksi dari recv() ditangani di luar loop (reconnect)
+                    response = await websocket.recv()
                     try:
-                        response = await websocket.recv()
-                        data = json.loads(response)
-                        
-                        # Periksa apakah ini adalah respons berlangganan
-                        if isinstance(data, dict) and "result" in data:
-                            continue
+                        data = json_loads(response)
+                    except ValueError:
+                        _log_malformed_frame("Binance", response)
+                        continue
+                    
+                    # Jalur utama: array ticker diperiksa lebih dulu
+                    if isinstance(data, list):
+                        for ticker in data:
+                            if not isinstance(ticker, dict):
+                                continue
+                            symbol = ticker.get("s")
+                            price = ticker.get("c")  # Harga penutupan
+                            if symbol is None or price is None:
+                                continue
+                            symbol = self._intern_symbol(symbol)
+                            self.prices[symbol] = price
                         
-                        # Proses data ticker
-                        if isinstance(data, list):
-                            for ticker in data:
-                                symbol = ticker["s"]
-                                price = ticker["c"]  # Harga penutupan
-                                self.prices[symbol] = price
-                                self.symbols.add(symbol)
-                            
-                            # Panggil semua callback
-                            for callback in self.callbacks:
-                                try:
-                                    callback({"prices": self.prices, "symbols": self.symbols})
-                                except Exception as e:
-                                    logger.error(f"Error menjalankan callback Binance: {e}")
+                        # Panggil semua callback
+                        for callback in self.callbacks:
+                            try:
+                                callback({"prices": self.prices, "symbols": self.prices.keys()})
+                            except Exception as e:
+                                logger.error(f"Error menjalankan callback Binance: {e}")
                     
-                    except Exception as e:
-                        logger.error(f"Error memproses data Binance: {e}")
-                        await asyncio.sleep(1)
+                    # Respons berlangganan hanya muncul di awal koneksi
+                    elif not (isinstance(data, dict) and "result" in data):
+                        _log_malformed_frame("Binance", response)
         
         except Exception as e:
             logger.error(f"Error koneksi Binance WebSocket: {e}")
@@ -102,20 +150,44 @@ class KuCoinClient:
     
     def __init__(self):
         self.api_url = "https://api.kucoin.com"
+        # Session persisten agar koneksi TLS tetap hangat antar request
+        self._session = requests.Session()
         self.ws_url = None
         self.ping_interval = 30
+        # Frame ping tetap, cukup diserialisasi sekali (dikirim sebagai text frame)
+        self._PING_FRAME = '{"type":"ping"}'
+        # Template berlangganan; hanya id yang berubah per koneksi
+        self._SUBSCRIBE_TEMPLATE = (
+            '{"id": %d, "type": "subscribe", "topic": "/market/ticker:all", '
+            '"privateChannel": false, "response": true}'
+        )
+        # Antrean pesan keluar, dikuras oleh satu task penulis per koneksi
+        self._send_q: Optional[asyncio.Queue] = None
+        # Cache simbol ter-intern agar key dict dipakai ulang antar frame
+        self._symbol_intern: Dict[str, str] = {}
         self.prices = {}
-        self.symbols = set()
         self.callbacks = []
     
+    @property
+    def symbols(self):
+        """Simbol yang diketahui; view dari key `prices` tanpa salinan terpisah"""
+        return self.prices.keys()
+    
     def register_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Mendaftarkan callback untuk dijalankan saat data baru diterima"""
         self.callbacks.append(callback)
     
+    def _intern_symbol(self, symbol: str) -> str:
+        """Mengembalikan instance simbol yang sudah di-intern"""
+        interned = self._symbol_intern.get(symbol)
+        if interned is None:
+            interned = self._symbol_intern[symbol] = sys.intern(symbol)
+        return interned
+    
     async def get_ws_token(self) -> bool:
         """Mendapatkan token untuk koneksi WebSocket"""
         try:
-            response = requests.post(f"{self.api_url}/api/v1/bullet-public")
+            response = self._session.post(f"{self.api_url}/api/v1/bullet-public")
             data = response.json()
             
             if data["code"] == "200000":
@@ -136,21 +208,47 @@ class KuCoinClient:
     async def get_all_tickers(self) -> Dict[str, Any]:
         """Mendapatkan semua ticker dari REST API"""
         try:
-            response = requests.get(f"{self.api_url}/api/v1/market/allTickers")
+            response = self._session.get(f"{self.api_url}/api/v1/market/allTickers")
             return response.json()
         except Exception as e:
             logger.error(f"Error mendapatkan ticker KuCoin: {e}")
             return {}
     
-    async def ping_loop(self, websocket):
-        """Mengirim ping ke server untuk menjaga koneksi"""
+    def send(self, message: str) -> None:
+        """Memasukkan pesan ke antrean kirim koneksi yang aktif"""
+        if self._send_q is not None:
+            self._send_q.put_nowait(message)
+    
+    async def writer_loop(self, websocket):
+        """Menguras antrean kirim; semua pesan yang tertunda dikirim dalam satu putaran"""
         while True:
             try:
-                await websocket.send(json.dumps({"type": "ping"}))
-                await asyncio.sleep(self.ping_interval)
+                batch = [await self._send_q.get()]
+                while not self._send_q.empty():
+                    batch.append(self._send_q.get_nowait())
+                
+                # Ping yang menumpuk cukup dikirim sekali
+                ping_sent = False
+                for message in batch:
+                    if message == self._PING_FRAME:
+                        if ping_sent:
+                            continue
+                        ping_sent = True
+                    await websocket.send(message)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error mengirim ping ke KuCoin: {e}")
-                break
+                # Tutup koneksi agar recv() gagal dan connect() menjalankan reconnect;
+                # tanpa penulis, ping tidak lagi sampai ke server
+                logger.error(f"Error mengirim pesan ke KuCoin: {e}")
+                await websocket.close()
+                return
+    
+    async def ping_loop(self):
+        """Mengirim ping ke server untuk menjaga koneksi"""
+        while True:
+            self.send(self._PING_FRAME)
+            await asyncio.sleep(self.ping_interval)
     
     async def connect(self):
         """Menghubungkan ke WebSocket KuCoin"""
@@ -166,50 +264,57 @@ class KuCoinClient:
             async with websockets.connect(self.ws_url) as websocket:
                 logger.info("Terhubung ke KuCoin WebSocket")
                 
-                # Mulai task ping
-                ping_task = asyncio.create_task(self.ping_loop(websocket))
-                
-                # Berlangganan ke semua ticker
-                subscribe_msg = {
-                    "id": int(time.time() * 1000),
-                    "type": "subscribe",
-                    "topic": "/market/ticker:all",
-                    "privateChannel": False,
-                    "response": True
-                }
+                # Mulai task penulis dan task ping
+                self._send_q = asyncio.Queue()
+                writer_task = asyncio.create_task(self.writer_loop(websocket))
+                ping_task = asyncio.create_task(self.ping_loop())
                 
-                await websocket.send(json.dumps(subscribe_msg))
-                
-                while True:
-                    try:
+                try:
+                    # Berlangganan ke semua ticker
+                    subscribe_msg = self._SUBSCRIBE_TEMPLATE % int(time.time() * 1000)
+                    self.send(subscribe_msg)
+                    
+                    while True:
+                        # Error koneksi dari recv() ditangani di luar loop (reconnect)
                         response = await websocket.recv()
-                        data = json.loads(response)
+                        try:
+                            data = json_loads(response)
+                        except ValueError:
+                            _log_malformed_frame("KuCoin", response)
+                            continue
+                        
+                        if not isinstance(data, dict):
+                            _log_malformed_frame("KuCoin", response)
+                            continue
                         
                         # Periksa tipe pesan
-                        if data.get("type") == "message" and data.get("topic") == "/market/ticker:all":
-                            symbol = data["subject"]
-                            price = data["data"]["price"]
+                        msg_type = data.get("type")
+                        if msg_type == "message" and data.get("topic") == "/market/ticker:all":
+                            symbol = data.get("subject")
+                            ticker = data.get("data")
+                            price = ticker.get("price") if isinstance(ticker, dict) else None
+                            if symbol is None or price is None:
+                                _log_malformed_frame("KuCoin", response)
+                                continue
+                            symbol = self._intern_symbol(symbol)
                             
                             self.prices[symbol] = price
-                            self.symbols.add(symbol)
                             
                             # Panggil semua callback
                             for callback in self.callbacks:
                                 try:
-                                    callback({"prices": self.prices, "symbols": self.symbols})
+                                    callback({"prices": self.prices, "symbols": self.prices.keys()})
                                 except Exception as e:
                                     logger.error(f"Error menjalankan callback KuCoin: {e}")
                         
-                        elif data.get("type") == "pong":
+                        elif msg_type == "pong":
                             # Respons ping, tidak perlu diproses
                             pass
-                    
-                    except Exception as e:
-                        logger.error(f"Error memproses data KuCoin: {e}")
-                        await asyncio.sleep(1)
-                
-                # Batalkan task ping jika keluar dari loop
-                ping_task.cancel()
+                finally:
+                    # Batalkan task ping dan penulis jika keluar dari loop
+                    ping_task.cancel()
+                    writer_task.cancel()
+                    self._send_q = None
         
         except Exception as e:
             logger.error(f"Error koneksi KuCoin WebSocket: {e}")
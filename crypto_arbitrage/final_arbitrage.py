@@ -8,15 +8,55 @@ Program untuk mendeteksi peluang arbitrase antara Binance dan KuCoin
 dengan validasi dan perhitungan yang akurat.
 """
 
+import argparse
 import asyncio
+import functools
+import importlib.util
 import logging
+import operator
+import os
+import random
+import re
 import signal
 import sys
+import threading
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Literal, Optional, Union
+
+# orjson opsional: parser JSON lebih cepat untuk payload bursa yang besar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgspec opsional: decode ticker bursa langsung ke struct bertipe tanpa dict perantara
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# httpx + h2 opsional: HTTP/2 memultipleks request bersamaan ke host yang sama dalam satu koneksi
+# (h2 hanya diperiksa keberadaannya; httpx sendiri yang mengimpornya untuk http2=True)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+if httpx is not None and importlib.util.find_spec("h2") is None:
+    httpx = None
+
+# uvloop opsional: event loop berbasis libuv dengan dispatch socket lebih cepat
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Konfigurasi
 BINANCE_API_URL = "https://api.binance.com/api/v3"
@@ -31,6 +71,8 @@ MIN_PROFIT_THRESHOLD = 0.5  # Minimal persentase keuntungan
 MAX_PROFIT_THRESHOLD = 100.0  # Maksimal persentase keuntungan
 MIN_VOLUME_USD = 100000  # Minimal volume 24 jam dalam USD
 UPDATE_INTERVAL = 60  # Interval update dalam detik
+FETCH_WORKERS = 16  # Thread untuk request blocking (7 harga + 7 status trading bersamaan)
+SCHEDULE_JITTER = 0.1  # Variasi ±10% pada jadwal agar request ke bursa tidak serempak
 
 # Biaya trading (dalam persentase)
 TRADING_FEES = {
@@ -116,6 +158,24 @@ GAS_FEES = {
     "default": 1.0  # $1 USD
 }
 
+# Tabel biaya datar {(coin, network): biaya} dan {(bursa, tipe order): biaya}, dibentuk sekali
+# saat import agar pencarian biaya di loop scan cukup satu dict.get dengan key tuple
+WITHDRAWAL_FEE_TABLE = {
+    (coin, network): fee
+    for coin, fees in WITHDRAWAL_FEES.items() if coin != "default"
+    for network, fee in fees.items()
+}
+DEFAULT_WITHDRAWAL_FEES = {
+    network: fee for network, fee in WITHDRAWAL_FEES.get("default", {}).items() if network != "default"
+}
+DEFAULT_WITHDRAWAL_FEE = WITHDRAWAL_FEES.get("default", {}).get("default", 5.0)  # $5 USD
+DEFAULT_GAS_FEE = GAS_FEES.get("default", 1.0)  # $1 USD
+TRADING_FEE_TABLE = {
+    (exchange, order_type): fee
+    for exchange, fees in TRADING_FEES.items()
+    for order_type, fee in fees.items()
+}
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -130,34 +190,288 @@ logger = logging.getLogger("final_arbitrage")
 # Variabel global
 running = True
 
-# Cache untuk status trading dan jaringan
-binance_trading_status_cache = {}
-kucoin_trading_status_cache = {}
-bybit_trading_status_cache = {}
-okx_trading_status_cache = {}
-gate_trading_status_cache = {}
-mexc_trading_status_cache = {}
-htx_trading_status_cache = {}
-binance_networks_cache = {}
-kucoin_networks_cache = {}
-bybit_networks_cache = {}
-okx_networks_cache = {}
-gate_networks_cache = {}
-mexc_networks_cache = {}
-htx_networks_cache = {}
-
-# Data harga dan timestamp
-binance_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
-kucoin_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
-bybit_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
-okx_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
-gate_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
-mexc_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
-htx_prices_data = {"prices": {}, "volumes": {}, "timestamp": None}
+# Error gateway sementara diulang seperti error koneksi (berlaku untuk kedua backend HTTP);
+# respons terakhir tetap dikembalikan agar validator per bursa bisa mencatatnya
+HTTP_RETRY_STATUSES = frozenset([500, 502, 503, 504])
+HTTP_STATUS_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.2  # Jeda dasar (detik) antar percobaan ulang, berlipat dua setiap percobaan
+
+if httpx is not None:
+    class StatusRetryTransport(httpx.HTTPTransport):
+        """Transport httpx yang juga mengulang GET dengan status 5xx sementara
+
+        retries bawaan HTTPTransport hanya mengulang error koneksi; ini menyamakan perilakunya
+        dengan Retry(status_forcelist=...) pada backend requests.
+        """
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            response = super().handle_request(request)
+            for attempt in range(HTTP_STATUS_RETRIES):
+                if request.method != "GET" or response.status_code not in HTTP_RETRY_STATUSES:
+                    break
+                response.close()
+                time.sleep(HTTP_RETRY_BACKOFF * (2 ** attempt))
+                response = super().handle_request(request)
+            return response
+
+# Session HTTP bersama: koneksi keep-alive dipakai ulang untuk semua bursa.
+# Dengan httpx tersedia, dipakai klien HTTP/2 (antarmuka get/content/status_code/headers sama).
+if httpx is not None:
+    SESSION = httpx.Client(
+        transport=StatusRetryTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16)
+        ),
+        headers={"Accept-Encoding": "gzip"}
+    )
+else:
+    SESSION = requests.Session()
+    _adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=HTTP_STATUS_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False
+        )
+    )
+    SESSION.mount("https://", _adapter)
+    SESSION.mount("http://", _adapter)
+    SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
 
 # Waktu kedaluwarsa cache dalam detik
 CACHE_EXPIRY = 3600  # 1 jam untuk data jaringan dan status trading
 PRICE_DATA_EXPIRY = 30  # 30 detik untuk data harga
+PRICE_REFRESH_INTERVAL = PRICE_DATA_EXPIRY * 0.8  # Harga disegarkan di background sebelum kedaluwarsa
+STATUS_REFRESH_AGE = CACHE_EXPIRY * 0.8  # Status trading disegarkan di background sebelum kedaluwarsa
+STATUS_RETRY_INTERVAL = 60  # Jeda sebelum mencoba lagi jika refresh status trading gagal
+
+# Batas jumlah entri status trading per bursa (di atas jumlah pasangan spot bursa terbesar)
+TRADING_STATUS_CACHE_SIZE = 8192
+NETWORK_CACHE_SIZE = 4096  # Batas jumlah coin pada cache jaringan per bursa
+
+
+class TTLCache:
+    """Cache LRU berukuran terbatas dengan masa berlaku per entri
+
+    Entri yang kedaluwarsa tidak dikembalikan oleh get, tetapi tetap tersimpan (lihat peek)
+    agar bisa divalidasi ulang; entri paling lama tidak dipakai dibuang saat ukuran
+    melebihi maxsize, sehingga cache tidak tumbuh tanpa batas.
+
+    Dipakai bersamaan oleh thread scan, executor, dan refresher status trading; get juga
+    mengubah urutan LRU, jadi setiap method dijaga satu lock.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, jitter: float = 0.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Variasi ±jitter pada umur tiap entri agar entri yang disimpan bersamaan tidak kedaluwarsa serempak
+        self.jitter = jitter
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _stored_at(self, stored_at: Optional[float]) -> float:
+        stored_at = time.monotonic() if stored_at is None else stored_at
+        if self.jitter:
+            stored_at += self.ttl * random.uniform(-self.jitter, self.jitter)
+        return stored_at
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key: str, default: Any = None, now: Optional[float] = None) -> Any:
+        """Mengambil nilai yang belum kedaluwarsa; now bisa diberikan agar satu loop memakai satu timestamp"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if (time.monotonic() if now is None else now) - entry[0] >= self.ttl:
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Mengambil nilai tanpa memeriksa masa berlaku (mis. untuk conditional GET)"""
+        with self._lock:
+            entry = self._data.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: str, value: Any, stored_at: Optional[float] = None) -> None:
+        """Menyimpan nilai; stored_at memungkinkan data lama (mis. dari disk) kedaluwarsa lebih awal"""
+        stored_at = self._stored_at(stored_at)
+        with self._lock:
+            self._data[key] = (stored_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def update(self, items: Dict[str, Any], stored_at: Optional[float] = None) -> None:
+        """Menyimpan banyak nilai sekaligus dengan timestamp yang sama (ditambah jitter jika aktif)"""
+        stored_at = time.monotonic() if stored_at is None else stored_at
+        with self._lock:
+            data = self._data
+            for key, value in items.items():
+                data[key] = (self._stored_at(stored_at) if self.jitter else stored_at, value)
+                data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Semua pasangan (key, nilai) yang belum kedaluwarsa (snapshot yang diambil di bawah lock)"""
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value) for key, (stored_at, value) in self._data.items() if now - stored_at < self.ttl]
+
+
+if msgspec is not None:
+    class BinanceTicker(msgspec.Struct, gc=False):
+        """Field ticker 24 jam Binance (dan MEXC, skemanya sama) yang dipakai scanner"""
+        symbol: str
+        lastPrice: float
+        quoteVolume: float
+
+    class KucoinTicker(msgspec.Struct, gc=False):
+        """Field ticker KuCoin; harga terakhir bisa null untuk pasangan tanpa transaksi"""
+        symbol: str
+        volValue: float
+        last: Optional[float] = None
+
+    class KucoinTickerList(msgspec.Struct, gc=False):
+        ticker: List[KucoinTicker]
+
+    # Kode status berupa Literal: respons error gagal divalidasi dan ditangani jalur parsing dict
+    class KucoinTickersResponse(msgspec.Struct, gc=False):
+        code: Literal["200000"]
+        data: KucoinTickerList
+
+    class BybitTicker(msgspec.Struct, gc=False):
+        """Field ticker spot ByBit; volume24h dalam base currency"""
+        symbol: str
+        lastPrice: float
+        volume24h: float
+
+    class BybitTickerList(msgspec.Struct, gc=False):
+        list: List[BybitTicker]
+
+    class BybitTickersResponse(msgspec.Struct, gc=False):
+        retCode: Literal[0]
+        result: BybitTickerList
+
+    class OkxTicker(msgspec.Struct, gc=False):
+        """Field ticker spot OKX; vol24h dalam base currency"""
+        instId: str
+        last: float
+        vol24h: float = 0.0
+
+    class OkxTickersResponse(msgspec.Struct, gc=False):
+        code: Literal["0"]
+        data: List[OkxTicker]
+
+    class GateTicker(msgspec.Struct, gc=False):
+        """Field ticker spot Gate.io; quote_volume dalam quote currency"""
+        currency_pair: str
+        last: float
+        quote_volume: float
+
+    class HtxTicker(msgspec.Struct, gc=False):
+        """Field ticker HTX; vol dalam base currency"""
+        symbol: str
+        close: float
+        vol: float
+
+    class HtxTickersResponse(msgspec.Struct, gc=False):
+        status: Literal["ok"]
+        data: List[HtxTicker]
+
+    # strict=False agar harga berbentuk string ("123.45") langsung dikonversi ke float
+    BINANCE_TICKER_DECODER = msgspec.json.Decoder(List[BinanceTicker], strict=False)
+    KUCOIN_TICKER_DECODER = msgspec.json.Decoder(KucoinTickersResponse, strict=False)
+    BYBIT_TICKER_DECODER = msgspec.json.Decoder(BybitTickersResponse, strict=False)
+    OKX_TICKER_DECODER = msgspec.json.Decoder(OkxTickersResponse, strict=False)
+    GATE_TICKER_DECODER = msgspec.json.Decoder(List[GateTicker], strict=False)
+    MEXC_TICKER_DECODER = BINANCE_TICKER_DECODER
+    HTX_TICKER_DECODER = msgspec.json.Decoder(HtxTickersResponse, strict=False)
+else:
+    BINANCE_TICKER_DECODER = KUCOIN_TICKER_DECODER = BYBIT_TICKER_DECODER = None
+    OKX_TICKER_DECODER = GATE_TICKER_DECODER = MEXC_TICKER_DECODER = HTX_TICKER_DECODER = None
+
+
+@dataclass
+class ExchangeState:
+    """Status cache satu bursa: status trading, jaringan, dan data harga terakhir"""
+    trading_status: TTLCache = field(
+        default_factory=lambda: TTLCache(TRADING_STATUS_CACHE_SIZE, CACHE_EXPIRY)
+    )
+    networks: TTLCache = field(
+        default_factory=lambda: TTLCache(NETWORK_CACHE_SIZE, CACHE_EXPIRY, jitter=SCHEDULE_JITTER)
+    )
+    network_validators: Dict[str, Dict[str, Optional[str]]] = field(default_factory=dict)  # ETag/Last-Modified per coin
+    prices: Dict[str, float] = field(default_factory=dict)
+    volumes: Dict[str, float] = field(default_factory=dict)
+    timestamp: Optional[float] = None  # Waktu monotonic pengambilan harga terakhir
+    # (dict harga sumber, {simbol ternormalisasi: simbol asli}); disimpan sebagai satu tuple
+    # agar pembaca di thread lain selalu melihat pasangan yang konsisten
+    normalized_symbols: Optional[Tuple[Dict[str, float], Dict[str, str]]] = None
+    # (parameter request, ETag/Last-Modified) dari respons ticker terakhir untuk conditional GET
+    price_validators: Optional[Tuple[Optional[Dict[str, str]], Dict[str, Optional[str]]]] = None
+    status_timestamp: Optional[float] = None  # Waktu monotonic tabel status trading terakhir
+    ticker_filter: List[str] = field(default_factory=list)  # Filter simbol server-side; kosong = semua
+    ticker_filter_time: Optional[float] = None  # Waktu monotonic filter dibentuk
+    # Parameter request ticker yang menghasilkan harga saat ini (Binance: None = ticker penuh tanpa
+    # filter, list = beberapa request terfilter)
+    price_params: Optional[Union[Dict[str, str], List[Dict[str, str]]]] = None
+    price_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    status_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+@dataclass(slots=True)
+class Opportunity:
+    """Satu peluang arbitrase hasil calculate_arbitrage (slots: tanpa __dict__ per objek)"""
+    pair: str
+    exchanges: Dict[str, Dict[str, Any]]  # Simbol, harga, volume, dan status trading per bursa
+    price_diff_pct: float
+    buy_exchange: str
+    sell_exchange: str
+    buy_price: float  # Sudah termasuk estimasi slippage
+    sell_price: float  # Sudah termasuk estimasi slippage
+    quantity: float
+    gross_profit_usd: float
+    net_profit_usd: float
+    roi: float
+    base_asset: str
+    quote_asset: str
+    base_networks: Dict[str, List[str]]
+    quote_networks: Dict[str, List[str]]
+    best_transfer_network: str
+    withdrawal_fee: float
+    gas_fee: float
+    total_transfer_fee: float
+    buy_trading_fee: float
+    sell_trading_fee: float
+    timestamp: str = field(compare=False)  # Diabaikan saat membandingkan hasil scan
+
+
+# Cache untuk status trading, jaringan, dan harga per bursa
+EXCHANGES: Dict[str, ExchangeState] = {
+    exchange: ExchangeState()
+    for exchange in ("binance", "kucoin", "bybit", "okx", "gate", "mexc", "htx")
+}
+
+# Cache disk untuk data referensi bursa agar restart tidak memicu unduhan ulang
+DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "crypto_arbitrage")
+FORCE_REFRESH = False  # Diatur lewat --force-refresh untuk mengabaikan cache disk
+
+# Jumlah simbol per request terfilter /ticker/24hr Binance. Filter dipecah ke beberapa request
+# agar URL tetap pendek; 21-100 simbol berbobot 40 per request (ticker penuh berbobot 80).
+# Filter dibentuk ulang dari ticker penuh setiap CACHE_EXPIRY agar listing baru ikut terdeteksi.
+# Hanya Binance yang menerima daftar simbol; endpoint ticker MEXC dan Gate.io hanya menerima
+# satu simbol, sedangkan KuCoin, ByBit, OKX, dan HTX tidak punya filter simbol sama sekali.
+BINANCE_TICKER_FILTER_CHUNK = 100
 
 # Jaringan yang umum didukung
 COMMON_NETWORKS = [
@@ -165,6 +479,22 @@ COMMON_NETWORKS = [
     "MATIC", "POLYGON", "ARBITRUM", "OPTIMISM", "AVAX", "AVALANCHE", "BTC"
 ]
 
+# Regex tunggal untuk mengenali jaringan umum; alternatif terpanjang dicek lebih dulu
+# agar mis. "SOLANA" tidak berhenti di "SOL"
+COMMON_NETWORK_PATTERN = re.compile(
+    "|".join(re.escape(network) for network in sorted(COMMON_NETWORKS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Alias jaringan yang dipetakan ke nama kanonik yang dipakai tabel biaya
+NETWORK_ALIASES = {
+    "SOLANA": "SOL",
+    "TRON": "TRC20",
+    "AVALANCHE": "AVAX",
+    "POLYGON": "MATIC",
+    "BSC": "BEP20"
+}
+
 # Data statis untuk jaringan yang didukung oleh koin populer
 STATIC_NETWORK_DATA = {
     "USDT": {
@@ -232,6 +562,56 @@ STATIC_NETWORK_DATA = {
     }
 }
 
+# Indeks data statis per bursa ({bursa: {coin: jaringan}}) agar pencarian cukup satu dict.get
+STATIC_NETWORKS_BY_EXCHANGE: Dict[str, Dict[str, List[str]]] = {
+    exchange: {
+        sys.intern(coin): exchanges[exchange]
+        for coin, exchanges in STATIC_NETWORK_DATA.items()
+        if exchange in exchanges
+    }
+    for exchange in EXCHANGES
+}
+STATIC_NETWORK_COINS = frozenset(STATIC_NETWORK_DATA)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_network_name(network_name: str) -> str:
+    """Menormalisasi nama jaringan dari API bursa ke nama jaringan umum
+
+    Nama chain dari bursa berasal dari himpunan kecil, jadi hasilnya di-memoize
+    dan regex hanya dijalankan sekali per nama chain unik.
+    """
+    match = COMMON_NETWORK_PATTERN.search(network_name)
+    if match is None:
+        return sys.intern(network_name)
+
+    # Kode jaringan berasal dari himpunan kecil, jadi di-intern agar semua cache berbagi objek yang sama
+    network = match.group(0).upper()
+    return sys.intern(NETWORK_ALIASES.get(network, network))
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """Parse body respons JSON langsung dari bytes, memakai orjson jika tersedia"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    # json.loads menerima bytes, jadi dekode teks response.json() tidak diperlukan
+    return json.loads(response.content)
+
+
+def decode_ticker_response(response: requests.Response, decoder: Any) -> Any:
+    """Decode respons ticker dengan decoder msgspec; None jika decoder tidak tersedia atau skema tidak cocok
+
+    Respons error (tanpa field data) atau nilai yang tidak bisa dikonversi gagal divalidasi,
+    sehingga pemanggil kembali ke parsing dict biasa yang menangani kasus tersebut.
+    """
+    if decoder is None:
+        return None
+    try:
+        return decoder.decode(response.content)
+    except msgspec.ValidationError as e:
+        logger.debug(f"Skema ticker tidak cocok, kembali ke parsing JSON biasa: {e}")
+        return None
+
 
 def safe_float(value: Any, default: float = 0.0) -> float:
     """Konversi nilai ke float dengan aman"""
@@ -241,1414 +621,1050 @@ def safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+# Quote asset yang dikenali beserta panjang suffix-nya; dicek dari suffix terpanjang
+BINANCE_QUOTE_SUFFIXES = {"USDT": 4, "BUSD": 4, "BTC": 3, "ETH": 3, "BNB": 3, "USD": 3}
+DEFAULT_QUOTE_SUFFIXES = {"USDT": 4, "BTC": 3, "ETH": 3, "USD": 3}
+_SUFFIX_LENGTHS = (4, 3)
+
+
+def _split_by_quote_suffix(symbol: str, quotes: Dict[str, int]) -> str:
+    """Memisahkan simbol tanpa pemisah (mis. BTCUSDT) menjadi BASE/QUOTE
+
+    Mengembalikan string kosong jika suffix quote tidak dikenali.
+    """
+    for length in _SUFFIX_LENGTHS:
+        tail = symbol[-length:]
+        if quotes.get(tail) == length:
+            return sys.intern(f"{symbol[:-length]}/{tail}")
+    return ""
+
+
+def _split_by_separator(symbol: str, separator: str) -> str:
+    """Mengubah simbol berpemisah (mis. BTC-USDT, BTC_USDT) menjadi BASE/QUOTE
+
+    Simbol tanpa pemisah dikembalikan apa adanya.
+    """
+    if separator in symbol:
+        base, quote = symbol.split(separator)
+        return sys.intern(f"{base}/{quote}")
+    return symbol
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_binance_symbol(symbol: str) -> str:
     """Menormalisasi simbol Binance"""
-    common_quotes = ["USDT", "BUSD", "BTC", "ETH", "BNB", "USD"]
-    for quote in common_quotes:
-        if symbol.endswith(quote):
-            base = symbol[:-len(quote)]
-            return f"{base}/{quote}"
+    normalized = _split_by_quote_suffix(symbol, BINANCE_QUOTE_SUFFIXES)
+    if normalized:
+        return normalized
 
     # Fallback
     if len(symbol) > 3:
         base = symbol[:-4]
         quote = symbol[-4:]
-        return f"{base}/{quote}"
+        return sys.intern(f"{base}/{quote}")
 
     return symbol
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_kucoin_symbol(symbol: str) -> str:
     """Menormalisasi simbol KuCoin"""
-    if "-" in symbol:
-        base, quote = symbol.split("-")
-        return f"{base}/{quote}"
-
-    return symbol
+    return _split_by_separator(symbol, "-")
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_bybit_symbol(symbol: str) -> str:
     """Menormalisasi simbol ByBit"""
-    if symbol.endswith("USDT"):
-        base = symbol[:-4]
-        return f"{base}/USDT"
-    elif symbol.endswith("BTC"):
-        base = symbol[:-3]
-        return f"{base}/BTC"
-    elif symbol.endswith("ETH"):
-        base = symbol[:-3]
-        return f"{base}/ETH"
-    elif symbol.endswith("USD"):
-        base = symbol[:-3]
-        return f"{base}/USD"
-
-    # Jika format tidak dikenali, coba split dengan pemisah
-    if "/" in symbol:
-        return symbol
-
-    return symbol
+    # Jika format tidak dikenali, kembalikan simbol apa adanya
+    return _split_by_quote_suffix(symbol, DEFAULT_QUOTE_SUFFIXES) or symbol
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_okx_symbol(symbol: str) -> str:
     """Menormalisasi simbol OKX"""
-    if "-" in symbol:
-        base, quote = symbol.split("-")
-        return f"{base}/{quote}"
-
-    # Jika format tidak dikenali, coba split dengan pemisah
-    if "/" in symbol:
-        return symbol
-
-    return symbol
+    return _split_by_separator(symbol, "-")
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_gate_symbol(symbol: str) -> str:
     """Menormalisasi simbol Gate.io"""
-    if "_" in symbol:
-        base, quote = symbol.split("_")
-        return f"{base}/{quote}"
-
-    # Jika format tidak dikenali, coba split dengan pemisah
-    if "/" in symbol:
-        return symbol
-
-    return symbol
+    return _split_by_separator(symbol, "_")
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_mexc_symbol(symbol: str) -> str:
     """Menormalisasi simbol MEXC"""
     # MEXC menggunakan format yang sama dengan Binance (BTCUSDT)
-    if symbol.endswith("USDT"):
-        base = symbol[:-4]
-        return f"{base}/USDT"
-    elif symbol.endswith("BTC"):
-        base = symbol[:-3]
-        return f"{base}/BTC"
-    elif symbol.endswith("ETH"):
-        base = symbol[:-3]
-        return f"{base}/ETH"
-    elif symbol.endswith("USD"):
-        base = symbol[:-3]
-        return f"{base}/USD"
-
-    # Jika format tidak dikenali, coba split dengan pemisah
-    if "/" in symbol:
-        return symbol
-
-    return symbol
+    return _split_by_quote_suffix(symbol, DEFAULT_QUOTE_SUFFIXES) or symbol
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_htx_symbol(symbol: str) -> str:
     """Menormalisasi simbol HTX (Huobi)"""
     # HTX menggunakan format seperti btcusdt (lowercase)
     symbol = symbol.upper()
+    return _split_by_quote_suffix(symbol, DEFAULT_QUOTE_SUFFIXES) or symbol
+
+
+# Normalizer simbol per bursa, dipakai untuk mencocokkan pasangan antar bursa.
+# Hasilnya di-intern sehingga simbol yang sama dari tujuh bursa berbagi satu objek string
+# dan pencocokan key di find_common_pairs cukup membandingkan identitas objek.
+SYMBOL_NORMALIZERS = {
+    "binance": normalize_binance_symbol,
+    "kucoin": normalize_kucoin_symbol,
+    "bybit": normalize_bybit_symbol,
+    "okx": normalize_okx_symbol,
+    "gate": normalize_gate_symbol,
+    "mexc": normalize_mexc_symbol,
+    "htx": normalize_htx_symbol,
+}
 
-    if symbol.endswith("USDT"):
-        base = symbol[:-4]
-        return f"{base}/USDT"
-    elif symbol.endswith("BTC"):
-        base = symbol[:-3]
-        return f"{base}/BTC"
-    elif symbol.endswith("ETH"):
-        base = symbol[:-3]
-        return f"{base}/ETH"
-    elif symbol.endswith("USD"):
-        base = symbol[:-3]
-        return f"{base}/USD"
-
-    # Jika format tidak dikenali, coba split dengan pemisah
-    if "/" in symbol:
-        return symbol
-
-    return symbol
 
+# Konfigurasi endpoint status trading per bursa
+TRADING_STATUS_CONFIG = {
+    "binance": {
+        "name": "Binance",
+        "url": f"{BINANCE_API_URL}/exchangeInfo",
+        "params": None,
+        "is_valid": lambda data: "symbols" in data,
+        "path": ("symbols",),
+        "symbol_field": "symbol",
+        "status_field": "status",
+        "tradable_value": "TRADING"
+    },
+    "kucoin": {
+        "name": "KuCoin",
+        "url": f"{KUCOIN_API_URL}/api/v1/symbols",
+        "params": None,
+        "is_valid": lambda data: data["code"] == "200000" and "data" in data,
+        "path": ("data",),
+        "symbol_field": "symbol",
+        "status_field": "enableTrading",
+        "tradable_value": True
+    },
+    "bybit": {
+        "name": "ByBit",
+        "url": f"{BYBIT_API_URL}/market/instruments-info",
+        "params": {"category": "spot"},
+        "is_valid": lambda data: data["retCode"] == 0 and "result" in data and "list" in data["result"],
+        "path": ("result", "list"),
+        "symbol_field": "symbol",
+        "status_field": "status",
+        "tradable_value": "Trading"
+    },
+    "okx": {
+        "name": "OKX",
+        "url": f"{OKX_API_URL}/public/instruments",
+        "params": {"instType": "SPOT"},
+        "is_valid": lambda data: data["code"] == "0" and "data" in data,
+        "path": ("data",),
+        "symbol_field": "instId",
+        "status_field": "state",
+        "tradable_value": "live"
+    },
+    "gate": {
+        "name": "Gate.io",
+        "url": f"{GATE_API_URL}/spot/currency_pairs",
+        "params": None,
+        "is_valid": lambda data: isinstance(data, list),
+        "path": (),
+        "symbol_field": "id",  # Format: BTC_USDT
+        "status_field": "trade_status",
+        "tradable_value": "tradable"
+    },
+    "mexc": {
+        "name": "MEXC",
+        "url": f"{MEXC_API_URL}/exchangeInfo",
+        "params": None,
+        "is_valid": lambda data: "symbols" in data,
+        "path": ("symbols",),
+        "symbol_field": "symbol",  # Format: BTCUSDT
+        "status_field": "status",
+        "tradable_value": "ENABLED"
+    },
+    "htx": {
+        "name": "HTX",
+        "url": "https://api.huobi.pro/v1/common/symbols",
+        "params": None,
+        "is_valid": lambda data: data["status"] == "ok" and "data" in data,
+        "path": ("data",),
+        "symbol_field": "symbol",  # Format: btcusdt
+        "status_field": "state",
+        "tradable_value": "online",
+        "lowercase_symbols": True  # HTX menggunakan simbol lowercase
+    }
+}
 
-def get_binance_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol Binance sekaligus"""
-    global binance_trading_status_cache
-    result = {}
-    symbols_to_check = []
+# Jaringan deposit default jika bursa tidak memberikan informasi jaringan
+DEFAULT_DEPOSIT_NETWORKS = ["ERC20", "TRC20"]
+# Jaringan withdraw default Binance jika coin tidak ada di konfigurasi wallet
+# (keduanya dibagikan ke semua entri cache, jadi tidak boleh dimutasi)
+DEFAULT_BINANCE_NETWORKS = ["BEP20", "ERC20"]
 
-    # Jika tidak ada simbol yang diberikan, kembalikan cache
-    if not symbols:
-        return {s: status for s, (_, status) in binance_trading_status_cache.items()}
+def get_htx_deposit_chains(currencies: List[Dict[str, Any]], coin: str) -> List[str]:
+    """Nama chain HTX yang menerima deposit untuk coin (sudah uppercase)
 
-    # Cek cache terlebih dahulu
-    for symbol in symbols:
-        if symbol in binance_trading_status_cache:
-            cache_time, is_tradable = binance_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
-            else:
-                symbols_to_check.append(symbol)
-        else:
-            symbols_to_check.append(symbol)
+    Request sudah difilter dengan parameter currency, jadi entri pertama yang cocok
+    langsung dipakai tanpa memindai sisa daftar.
+    """
+    for coin_info in currencies:
+        if coin_info["currency"].upper() == coin:
+            return [chain_info["chain"] for chain_info in coin_info["chains"] if chain_info["depositStatus"] == "allowed"]
+    return []
 
-    # Jika semua simbol sudah ada di cache, kembalikan hasil
-    if not symbols_to_check:
-        return result
 
-    try:
-        # Dapatkan informasi semua simbol dari Binance
-        response = requests.get(
-            f"{BINANCE_API_URL}/exchangeInfo",
-            timeout=10
+# Konfigurasi endpoint jaringan deposit per bursa (Binance memakai konfigurasi wallet, lihat get_binance_networks)
+NETWORK_CONFIG = {
+    "kucoin": {
+        "name": "KuCoin",
+        "url": f"{KUCOIN_API_URL}/api/v1/currencies/{{coin}}",
+        "coin_param": None,
+        "is_valid": lambda data: data["code"] == "200000" and "data" in data,
+        "chains": lambda data, coin: (
+            chain_info["chainName"] for chain_info in data["data"]["chains"] if chain_info["isDepositEnabled"]
         )
-        data = response.json()
-
-        # Buat dictionary untuk mempercepat pencarian
-        symbol_status = {}
-        if "symbols" in data:
-            for symbol_info in data["symbols"]:
-                symbol_name = symbol_info["symbol"]
-                is_tradable = symbol_info["status"] == "TRADING"
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                binance_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-        # Periksa status trading untuk setiap simbol yang diminta
-        for symbol in symbols_to_check:
-            if symbol in symbol_status:
-                result[symbol] = symbol_status[symbol]
-            else:
-                # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                result[symbol] = False
-                binance_trading_status_cache[symbol] = (datetime.now(), False)
-
-        return result
-
-    except Exception as e:
-        logger.error(f"Error mendapatkan status trading Binance: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-        for symbol in symbols_to_check:
-            result[symbol] = True
-        return result
-
-
-def is_binance_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di Binance"""
-    result = get_binance_trading_status([symbol])
-    return result.get(symbol, True)
-
-
-def get_binance_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk withdraw dari Binance"""
-    global binance_networks_cache
-
-    # Normalisasi nama coin
-    coin = coin.upper()
-
-    # Cek cache terlebih dahulu
-    if coin in binance_networks_cache:
-        cache_time, networks = binance_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
-
-    # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["binance"]
-        binance_networks_cache[coin] = (datetime.now(), networks)
-        return networks
-
-    # Jika tidak ada data statis, coba dapatkan dari API
-    try:
-        # Dapatkan informasi jaringan dari Binance
-        response = requests.get(
-            f"{BINANCE_API_URL}/capital/config/getall",
-            timeout=10
+    },
+    "bybit": {
+        "name": "ByBit",
+        "url": None  # ByBit tidak memiliki API publik untuk informasi jaringan
+    },
+    "okx": {
+        "name": "OKX",
+        "url": f"{OKX_API_URL}/asset/deposit-address",
+        "coin_param": "ccy",
+        "is_valid": lambda data: data["code"] == "0" and "data" in data,
+        "chains": lambda data, coin: (
+            chain_info["chain"] for chain_info in data["data"] if chain_info["chain"]
         )
-        data = response.json()
-
-        # Cari coin dalam daftar
-        networks = []
-        for coin_info in data:
-            if coin_info["coin"] == coin:
-                # Dapatkan jaringan yang didukung
-                for network_info in coin_info["networkList"]:
-                    if network_info["withdrawEnable"]:
-                        network_name = network_info["network"]
-                        # Normalisasi nama jaringan
-                        for common_network in COMMON_NETWORKS:
-                            if common_network.lower() in network_name.lower():
-                                networks.append(common_network)
-                                break
-                        else:
-                            networks.append(network_name)
-
-                # Simpan ke cache
-                binance_networks_cache[coin] = (datetime.now(), networks)
-                return networks
-
-        # Jika coin tidak ditemukan, gunakan data default
-        default_networks = ["BEP20", "ERC20"]
-        binance_networks_cache[coin] = (datetime.now(), default_networks)
-        return default_networks
-
-    except Exception as e:
-        logger.debug(f"Error mendapatkan jaringan Binance untuk {coin}: {e}")
-        # Gunakan data default jika terjadi error
-        default_networks = ["BEP20", "ERC20"]
-        binance_networks_cache[coin] = (datetime.now(), default_networks)
-        return default_networks
-
-
-def get_binance_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari Binance"""
-    global binance_prices_data
-
-    # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
-    data_age_seconds = float('inf')  # Default ke nilai tak terhingga
-
-    if binance_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - binance_prices_data["timestamp"]).total_seconds()
+    },
+    "gate": {
+        "name": "Gate.io",
+        "url": f"{GATE_API_URL}/wallet/currency_chains",
+        "coin_param": "currency",
+        "is_valid": lambda data: isinstance(data, list),
+        "chains": lambda data, coin: (
+            chain_info["chain"] for chain_info in data if chain_info["chain"]
+        )
+    },
+    "mexc": {
+        "name": "MEXC",
+        "url": None  # MEXC tidak memiliki API publik untuk informasi jaringan
+    },
+    "htx": {
+        "name": "HTX",
+        "url": "https://api.huobi.pro/v2/reference/currencies",
+        "coin_param": "currency",
+        "is_valid": lambda data: data["code"] == 200 and "data" in data,
+        "chains": lambda data, coin: get_htx_deposit_chains(data["data"], coin)
+    }
+}
 
-    # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and binance_prices_data["prices"]:
-        logger.debug(f"Menggunakan data Binance dari cache (umur: {data_age_seconds:.1f} detik)")
-        return binance_prices_data["prices"], binance_prices_data["volumes"]
+def load_disk_cache(name: str, max_age: float = CACHE_EXPIRY) -> Tuple[Any, float]:
+    """Memuat data dari cache disk jika umurnya (berdasarkan mtime) masih di bawah max_age
 
-    # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
+    Returns:
+        Tuple (data, umur dalam detik); data bernilai None jika cache tidak ada atau kedaluwarsa
+    """
+    path = os.path.join(DISK_CACHE_DIR, f"{name}.json")
     try:
-        logger.info("Mengambil data harga terbaru dari Binance...")
-        response = requests.get(f"{BINANCE_API_URL}/ticker/24hr", timeout=10)
-        data = response.json()
-
-        prices = {}
-        volumes = {}
-        for ticker in data:
-            symbol = ticker["symbol"]
-            price = safe_float(ticker["lastPrice"])
-            volume = safe_float(ticker["quoteVolume"])  # Volume dalam mata uang quote
-
-            prices[symbol] = price
-            volumes[symbol] = volume
-
-        # Update data global dengan timestamp
-        binance_prices_data["prices"] = prices
-        binance_prices_data["volumes"] = volumes
-        binance_prices_data["timestamp"] = current_time
-
-        logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari Binance")
-        return prices, volumes
-
-    except Exception as e:
-        logger.error(f"Error mendapatkan harga Binance: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if binance_prices_data["prices"]:
-            logger.warning(f"Menggunakan data Binance lama (umur: {data_age_seconds:.1f} detik)")
-            return binance_prices_data["prices"], binance_prices_data["volumes"]
-        return {}, {}
-
-
-def get_kucoin_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol KuCoin sekaligus"""
-    global kucoin_trading_status_cache
-    result = {}
-    symbols_to_check = []
-
-    # Jika tidak ada simbol yang diberikan, kembalikan cache
-    if not symbols:
-        return {s: status for s, (_, status) in kucoin_trading_status_cache.items()}
-
-    # Cek cache terlebih dahulu
-    for symbol in symbols:
-        if symbol in kucoin_trading_status_cache:
-            cache_time, is_tradable = kucoin_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
-            else:
-                symbols_to_check.append(symbol)
-        else:
-            symbols_to_check.append(symbol)
-
-    # Jika semua simbol sudah ada di cache, kembalikan hasil
-    if not symbols_to_check:
-        return result
-
+        age = time.time() - os.path.getmtime(path)
+        if age >= max_age:
+            return None, age
+        with open(path, "rb") as f:
+            raw = f.read()
+        return (orjson.loads(raw) if orjson is not None else json.loads(raw)), age
+    except (OSError, ValueError):
+        return None, float('inf')
+
+
+def save_disk_cache(name: str, data: Any) -> None:
+    """Menyimpan data ke cache disk secara atomik (tulis ke file sementara lalu os.replace)"""
+    path = os.path.join(DISK_CACHE_DIR, f"{name}.json")
+    tmp_path = f"{path}.tmp"
     try:
-        # Dapatkan informasi semua simbol dari KuCoin
-        response = requests.get(
-            f"{KUCOIN_API_URL}/api/v1/symbols",
-            timeout=10
-        )
-        data = response.json()
-
-        if data["code"] == "200000" and "data" in data:
-            # Buat dictionary untuk mempercepat pencarian
-            symbol_status = {}
-            for symbol_info in data["data"]:
-                symbol_name = symbol_info["symbol"]
-                is_tradable = symbol_info["enableTrading"]
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                kucoin_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-            # Periksa status trading untuk setiap simbol yang diminta
-            for symbol in symbols_to_check:
-                if symbol in symbol_status:
-                    result[symbol] = symbol_status[symbol]
-                else:
-                    # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                    result[symbol] = False
-                    kucoin_trading_status_cache[symbol] = (datetime.now(), False)
-
-            return result
-        else:
-            logger.error(f"Gagal mendapatkan informasi simbol KuCoin: {data}")
-            # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-            for symbol in symbols_to_check:
-                result[symbol] = True
-            return result
-
-    except Exception as e:
-        logger.error(f"Error mendapatkan status trading KuCoin: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-        for symbol in symbols_to_check:
-            result[symbol] = True
-        return result
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode())
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Gagal menyimpan cache disk {name}: {e}")
 
 
-def is_kucoin_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di KuCoin"""
-    result = get_kucoin_trading_status([symbol])
-    return result.get(symbol, True)
+def remove_disk_cache(name: str) -> None:
+    """Menghapus cache disk sehingga tidak dimuat lagi saat restart"""
+    try:
+        os.remove(os.path.join(DISK_CACHE_DIR, f"{name}.json"))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Gagal menghapus cache disk {name}: {e}")
 
 
-def get_bybit_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol ByBit sekaligus"""
-    global bybit_trading_status_cache
-    result = {}
-    symbols_to_check = []
+def touch_disk_cache(name: str) -> None:
+    """Memperbarui mtime cache disk sehingga isinya dianggap segar kembali"""
+    try:
+        os.utime(os.path.join(DISK_CACHE_DIR, f"{name}.json"))
+    except OSError as e:
+        logger.debug(f"Gagal memperbarui cache disk {name}: {e}")
 
-    # Jika tidak ada simbol yang diberikan, kembalikan cache
-    if not symbols:
-        return {s: status for s, (_, status) in bybit_trading_status_cache.items()}
 
-    # Cek cache terlebih dahulu
-    for symbol in symbols:
-        if symbol in bybit_trading_status_cache:
-            cache_time, is_tradable = bybit_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
-            else:
-                symbols_to_check.append(symbol)
-        else:
-            symbols_to_check.append(symbol)
+def response_validators(response: requests.Response) -> Optional[Dict[str, Optional[str]]]:
+    """Mengambil ETag/Last-Modified dari respons, atau None jika bursa tidak mengirimkannya"""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        return {"etag": etag, "last_modified": last_modified}
+    return None
 
-    # Jika semua simbol sudah ada di cache, kembalikan hasil
-    if not symbols_to_check:
-        return result
 
-    try:
-        # Dapatkan informasi semua simbol dari ByBit
-        response = requests.get(
-            f"{BYBIT_API_URL}/market/instruments-info",
-            params={"category": "spot"},
-            timeout=10
-        )
-        data = response.json()
-
-        if data["retCode"] == 0 and "result" in data and "list" in data["result"]:
-            # Buat dictionary untuk mempercepat pencarian
-            symbol_status = {}
-            for symbol_info in data["result"]["list"]:
-                symbol_name = symbol_info["symbol"]
-                is_tradable = symbol_info["status"] == "Trading"
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                bybit_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-            # Periksa status trading untuk setiap simbol yang diminta
-            for symbol in symbols_to_check:
-                if symbol in symbol_status:
-                    result[symbol] = symbol_status[symbol]
-                else:
-                    # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                    result[symbol] = False
-                    bybit_trading_status_cache[symbol] = (datetime.now(), False)
+def conditional_headers(validators: Optional[Dict[str, Optional[str]]]) -> Dict[str, str]:
+    """Membuat header conditional GET dari validator respons sebelumnya"""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
 
-            return result
-        else:
-            logger.error(f"Gagal mendapatkan informasi simbol ByBit: {data}")
-            # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-            for symbol in symbols_to_check:
-                result[symbol] = True
-            return result
-
-    except Exception as e:
-        logger.error(f"Error mendapatkan status trading ByBit: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-        for symbol in symbols_to_check:
-            result[symbol] = True
-        return result
 
+def fetch_symbol_status(exchange: str) -> Tuple[Optional[Dict[str, bool]], bool]:
+    """Mengambil status trading semua simbol dari API bursa
 
-def is_bybit_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di ByBit"""
-    result = get_bybit_trading_status([symbol])
-    return result.get(symbol, True)
+    Jika ada salinan di disk beserta ETag/Last-Modified-nya, request dikirim sebagai
+    conditional GET; balasan 304 berarti salinan disk masih berlaku tanpa unduh ulang.
 
+    Returns:
+        Tuple (dictionary simbol -> dapat diperdagangkan atau None jika respons tidak valid,
+        True jika tabel berubah dibanding salinan disk)
+    """
+    config = TRADING_STATUS_CONFIG[exchange]
+
+    headers = {}
+    stale_status = None
+    if not FORCE_REFRESH:
+        validators, _ = load_disk_cache(f"{exchange}_status_validators", max_age=float('inf'))
+        if validators:
+            stale_status, _ = load_disk_cache(f"{exchange}_status", max_age=float('inf'))
+        if stale_status is not None:
+            headers = conditional_headers(validators)
+
+    # Dapatkan informasi semua simbol dari bursa
+    response = SESSION.get(config["url"], params=config["params"], headers=headers or None, timeout=10)
+    if response.status_code == 304 and stale_status is not None:
+        logger.debug(f"Status trading {config['name']} tidak berubah (304), memakai salinan disk")
+        return stale_status, False
+
+    data = parse_json_response(response)
+
+    if not config["is_valid"](data):
+        logger.error(f"Gagal mendapatkan informasi simbol {config['name']}: {data}")
+        return None, False
+
+    symbol_field = config["symbol_field"]
+    status_field = config["status_field"]
+    tradable_value = config["tradable_value"]
+
+    # Klasifikasi status semua simbol dalam satu comprehension
+    symbol_status = {
+        sys.intern(symbol_info[symbol_field]): symbol_info[status_field] == tradable_value
+        for symbol_info in functools.reduce(operator.getitem, config["path"], data)
+    }
 
-def get_okx_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol OKX sekaligus"""
-    global okx_trading_status_cache
-    result = {}
-    symbols_to_check = []
+    # Simpan validator untuk conditional GET berikutnya (tidak semua bursa mengirimkannya)
+    validators = response_validators(response)
+    if validators:
+        save_disk_cache(f"{exchange}_status_validators", validators)
 
-    # Jika tidak ada simbol yang diberikan, kembalikan cache
-    if not symbols:
-        return {s: status for s, (_, status) in okx_trading_status_cache.items()}
+    return symbol_status, symbol_status != stale_status
 
-    # Cek cache terlebih dahulu
-    for symbol in symbols:
-        if symbol in okx_trading_status_cache:
-            cache_time, is_tradable = okx_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
-            else:
-                symbols_to_check.append(symbol)
-        else:
-            symbols_to_check.append(symbol)
 
-    # Jika semua simbol sudah ada di cache, kembalikan hasil
-    if not symbols_to_check:
-        return result
+def refresh_trading_status(exchange: str, max_disk_age: float = CACHE_EXPIRY) -> Tuple[Optional[Dict[str, bool]], float]:
+    """Memuat tabel status trading lengkap suatu bursa ke cache (dari disk atau API)
 
-    try:
-        # Dapatkan informasi semua simbol dari OKX
-        response = requests.get(
-            f"{OKX_API_URL}/public/instruments",
-            params={"instType": "SPOT"},
-            timeout=10
-        )
-        data = response.json()
-
-        if data["code"] == "0" and "data" in data:
-            # Buat dictionary untuk mempercepat pencarian
-            symbol_status = {}
-            for symbol_info in data["data"]:
-                symbol_name = symbol_info["instId"]
-                is_tradable = symbol_info["state"] == "live"
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                okx_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-            # Periksa status trading untuk setiap simbol yang diminta
-            for symbol in symbols_to_check:
-                if symbol in symbol_status:
-                    result[symbol] = symbol_status[symbol]
-                else:
-                    # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                    result[symbol] = False
-                    okx_trading_status_cache[symbol] = (datetime.now(), False)
+    Args:
+        max_disk_age: Umur maksimal salinan disk yang boleh dipakai tanpa menghubungi API
 
-            return result
+    Returns:
+        Tuple (status per simbol atau None jika gagal, waktu monotonic data diambil)
+    """
+    state = EXCHANGES[exchange]
+
+    # Single-flight: pemanggil bersamaan menunggu di sini, lalu membaca salinan disk
+    # yang baru saja ditulis pemanggil pertama alih-alih mengirim request sendiri
+    with state.status_lock:
+        # Gunakan salinan di disk jika masih segar (mis. setelah program di-restart)
+        symbol_status, disk_age = (None, 0.0) if FORCE_REFRESH else load_disk_cache(f"{exchange}_status", max_disk_age)
+        if symbol_status is not None:
+            # Entri dari disk kedaluwarsa bersamaan dengan file cache-nya
+            fetched_at = time.monotonic() - disk_age
         else:
-            logger.error(f"Gagal mendapatkan informasi simbol OKX: {data}")
-            # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-            for symbol in symbols_to_check:
-                result[symbol] = True
-            return result
-
-    except Exception as e:
-        logger.error(f"Error mendapatkan status trading OKX: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-        for symbol in symbols_to_check:
-            result[symbol] = True
-        return result
+            symbol_status, changed = fetch_symbol_status(exchange)
+            fetched_at = time.monotonic()
+            if symbol_status is None:
+                return None, fetched_at
+            # Tabel yang tidak berubah cukup diperbarui mtime-nya, tanpa serialisasi ulang
+            if changed:
+                save_disk_cache(f"{exchange}_status", symbol_status)
+            else:
+                touch_disk_cache(f"{exchange}_status")
 
+        state.trading_status.update(symbol_status, stored_at=fetched_at)
+        state.status_timestamp = fetched_at
+        return symbol_status, fetched_at
 
-def is_okx_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di OKX"""
-    result = get_okx_trading_status([symbol])
-    return result.get(symbol, True)
 
+def get_stale_trading_status(exchange: str, symbols: List[str]) -> Dict[str, bool]:
+    """Status trading terakhir yang diketahui (stale-if-error), tanpa memeriksa masa berlaku cache
 
-def get_gate_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol Gate.io sekaligus"""
-    global gate_trading_status_cache
+    Dipakai saat refresh gagal agar simbol yang terakhir diketahui suspend tidak dianggap
+    dapat diperdagangkan; hanya simbol yang belum pernah dimuat yang dianggap True.
+    """
+    cache = EXCHANGES[exchange].trading_status
+    lowercase_symbols = TRADING_STATUS_CONFIG[exchange].get("lowercase_symbols", False)
     result = {}
-    symbols_to_check = []
-
-    # Jika tidak ada simbol yang diberikan, kembalikan cache
-    if not symbols:
-        return {s: status for s, (_, status) in gate_trading_status_cache.items()}
-
-    # Cek cache terlebih dahulu
+    stale_count = 0
     for symbol in symbols:
-        if symbol in gate_trading_status_cache:
-            cache_time, is_tradable = gate_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
-            else:
-                symbols_to_check.append(symbol)
-        else:
-            symbols_to_check.append(symbol)
-
-    # Jika semua simbol sudah ada di cache, kembalikan hasil
-    if not symbols_to_check:
-        return result
-
-    try:
-        # Dapatkan informasi semua simbol dari Gate.io
-        response = requests.get(
-            f"{GATE_API_URL}/spot/currency_pairs",
-            timeout=10
-        )
-        data = response.json()
-
-        if isinstance(data, list):
-            # Buat dictionary untuk mempercepat pencarian
-            symbol_status = {}
-            for symbol_info in data:
-                symbol_name = symbol_info["id"]  # Format: BTC_USDT
-                is_tradable = symbol_info["trade_status"] == "tradable"
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                gate_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-            # Periksa status trading untuk setiap simbol yang diminta
-            for symbol in symbols_to_check:
-                if symbol in symbol_status:
-                    result[symbol] = symbol_status[symbol]
-                else:
-                    # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                    result[symbol] = False
-                    gate_trading_status_cache[symbol] = (datetime.now(), False)
-
-            return result
-        else:
-            logger.error(f"Gagal mendapatkan informasi simbol Gate.io: {data}")
-            # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-            for symbol in symbols_to_check:
-                result[symbol] = True
-            return result
-
-    except Exception as e:
-        logger.error(f"Error mendapatkan status trading Gate.io: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-        for symbol in symbols_to_check:
+        is_tradable = cache.peek(symbol.lower() if lowercase_symbols else symbol)
+        if is_tradable is None:
             result[symbol] = True
-        return result
-
-
-def is_gate_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di Gate.io"""
-    result = get_gate_trading_status([symbol])
-    return result.get(symbol, True)
+        else:
+            result[symbol] = is_tradable
+            stale_count += 1
+    if stale_count:
+        logger.debug(f"Menggunakan status trading lama {exchange} untuk {stale_count} simbol")
+    return result
 
 
-def get_mexc_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol MEXC sekaligus"""
-    global mexc_trading_status_cache
+def get_trading_status(exchange: str, symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol di suatu bursa sekaligus"""
+    config = TRADING_STATUS_CONFIG[exchange]
+    cache = EXCHANGES[exchange].trading_status
+    exchange_name = config["name"]
     result = {}
     symbols_to_check = []
 
     # Jika tidak ada simbol yang diberikan, kembalikan cache
     if not symbols:
-        return {s: status for s, (_, status) in mexc_trading_status_cache.items()}
+        return dict(cache.items())
 
-    # Cek cache terlebih dahulu
+    # Cek cache terlebih dahulu (satu timestamp untuk seluruh loop)
+    now = time.monotonic()
     for symbol in symbols:
-        if symbol in mexc_trading_status_cache:
-            cache_time, is_tradable = mexc_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
-            else:
-                symbols_to_check.append(symbol)
-        else:
+        is_tradable = cache.get(symbol, now=now)
+        if is_tradable is None:
             symbols_to_check.append(symbol)
+        else:
+            result[symbol] = is_tradable
 
     # Jika semua simbol sudah ada di cache, kembalikan hasil
     if not symbols_to_check:
         return result
 
     try:
-        # Dapatkan informasi semua simbol dari MEXC
-        response = requests.get(
-            f"{MEXC_API_URL}/exchangeInfo",
-            timeout=10
-        )
-        data = response.json()
-
-        if "symbols" in data:
-            # Buat dictionary untuk mempercepat pencarian
-            symbol_status = {}
-            for symbol_info in data["symbols"]:
-                symbol_name = symbol_info["symbol"]  # Format: BTCUSDT
-                is_tradable = symbol_info["status"] == "ENABLED"
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                mexc_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-            # Periksa status trading untuk setiap simbol yang diminta
-            for symbol in symbols_to_check:
-                if symbol in symbol_status:
-                    result[symbol] = symbol_status[symbol]
-                else:
-                    # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                    result[symbol] = False
-                    mexc_trading_status_cache[symbol] = (datetime.now(), False)
-
-            return result
-        else:
-            logger.error(f"Gagal mendapatkan informasi simbol MEXC: {data}")
-            # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-            for symbol in symbols_to_check:
-                result[symbol] = True
+        symbol_status, fetched_at = refresh_trading_status(exchange)
+        if symbol_status is None:
+            # Jika terjadi error, gunakan status terakhir yang diketahui
+            result.update(get_stale_trading_status(exchange, symbols_to_check))
             return result
 
-    except Exception as e:
-        logger.error(f"Error mendapatkan status trading MEXC: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
+        # Periksa status trading untuk setiap simbol yang diminta
+        lowercase_symbols = config.get("lowercase_symbols", False)
         for symbol in symbols_to_check:
-            result[symbol] = True
-        return result
-
-
-def is_mexc_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di MEXC"""
-    result = get_mexc_trading_status([symbol])
-    return result.get(symbol, True)
-
-
-def get_htx_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
-    """Mendapatkan status trading untuk beberapa simbol HTX (Huobi) sekaligus"""
-    global htx_trading_status_cache
-    result = {}
-    symbols_to_check = []
-
-    # Jika tidak ada simbol yang diberikan, kembalikan cache
-    if not symbols:
-        return {s: status for s, (_, status) in htx_trading_status_cache.items()}
-
-    # Cek cache terlebih dahulu
-    for symbol in symbols:
-        if symbol in htx_trading_status_cache:
-            cache_time, is_tradable = htx_trading_status_cache[symbol]
-            # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-            if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-                result[symbol] = is_tradable
+            lookup_symbol = symbol.lower() if lowercase_symbols else symbol
+            if lookup_symbol in symbol_status:
+                result[symbol] = symbol_status[lookup_symbol]
             else:
-                symbols_to_check.append(symbol)
-        else:
-            symbols_to_check.append(symbol)
+                # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
+                result[symbol] = False
+                cache.set(symbol, False, stored_at=fetched_at)
 
-    # Jika semua simbol sudah ada di cache, kembalikan hasil
-    if not symbols_to_check:
         return result
 
-    try:
-        # Dapatkan informasi semua simbol dari HTX (Huobi)
-        response = requests.get(
-            "https://api.huobi.pro/v1/common/symbols",
-            timeout=10
-        )
-        data = response.json()
-
-        if data["status"] == "ok" and "data" in data:
-            # Buat dictionary untuk mempercepat pencarian
-            symbol_status = {}
-            for symbol_info in data["data"]:
-                symbol_name = symbol_info["symbol"]  # Format: btcusdt
-                is_tradable = symbol_info["state"] == "online"
-                symbol_status[symbol_name] = is_tradable
-
-                # Update cache
-                htx_trading_status_cache[symbol_name] = (datetime.now(), is_tradable)
-
-            # Periksa status trading untuk setiap simbol yang diminta
-            for symbol in symbols_to_check:
-                # HTX menggunakan simbol lowercase
-                symbol_lower = symbol.lower()
-                if symbol_lower in symbol_status:
-                    result[symbol] = symbol_status[symbol_lower]
-                else:
-                    # Jika simbol tidak ditemukan, anggap tidak dapat diperdagangkan
-                    result[symbol] = False
-                    htx_trading_status_cache[symbol] = (datetime.now(), False)
-
-            return result
-        else:
-            logger.error(f"Gagal mendapatkan informasi simbol HTX: {data}")
-            # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-            for symbol in symbols_to_check:
-                result[symbol] = True
-            return result
-
     except Exception as e:
-        logger.error(f"Error mendapatkan status trading HTX: {e}")
-        # Jika terjadi error, anggap semua simbol masih dapat diperdagangkan
-        for symbol in symbols_to_check:
-            result[symbol] = True
+        logger.error(f"Error mendapatkan status trading {exchange_name}: {e}")
+        # Jika terjadi error, gunakan status terakhir yang diketahui
+        result.update(get_stale_trading_status(exchange, symbols_to_check))
         return result
 
 
-def is_htx_symbol_tradable(symbol: str) -> bool:
-    """Memeriksa apakah simbol masih dapat diperdagangkan di HTX (Huobi)"""
-    result = get_htx_trading_status([symbol])
-    return result.get(symbol, True)
-
-
-def get_kucoin_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk deposit ke KuCoin"""
-    global kucoin_networks_cache
-
-    # Normalisasi nama coin
-    coin = coin.upper()
-
-    # Cek cache terlebih dahulu
-    if coin in kucoin_networks_cache:
-        cache_time, networks = kucoin_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
-
-    # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["kucoin"]
-        kucoin_networks_cache[coin] = (datetime.now(), networks)
-        return networks
-
-    # Jika tidak ada data statis, coba dapatkan dari API
-    try:
-        # Dapatkan informasi jaringan dari KuCoin
-        response = requests.get(
-            f"{KUCOIN_API_URL}/api/v1/currencies/{coin}",
-            timeout=10
-        )
-        data = response.json()
-
-        if data["code"] == "200000" and "data" in data:
-            # Dapatkan jaringan yang didukung
-            networks = []
-            for chain_info in data["data"]["chains"]:
-                if chain_info["isDepositEnabled"]:
-                    chain_name = chain_info["chainName"]
-                    # Normalisasi nama jaringan
-                    for common_network in COMMON_NETWORKS:
-                        if common_network.lower() in chain_name.lower():
-                            networks.append(common_network)
-                            break
-                    else:
-                        networks.append(chain_name)
-
-            # Simpan ke cache
-            kucoin_networks_cache[coin] = (datetime.now(), networks)
-            return networks
-        else:
-            logger.debug(f"Gagal mendapatkan informasi jaringan KuCoin untuk {coin}: {data}")
-            # Gunakan data default jika gagal
-            default_networks = ["ERC20", "TRC20"]
-            kucoin_networks_cache[coin] = (datetime.now(), default_networks)
-            return default_networks
-
-    except Exception as e:
-        logger.debug(f"Error mendapatkan jaringan KuCoin untuk {coin}: {e}")
-        # Gunakan data default jika terjadi error
-        default_networks = ["ERC20", "TRC20"]
-        kucoin_networks_cache[coin] = (datetime.now(), default_networks)
-        return default_networks
+def preload_trading_status(exchange_symbols: Dict[str, List[str]]) -> Dict[str, Dict[str, bool]]:
+    """Memuat status trading semua simbol per bursa dalam satu pass per siklus
 
+    Setelah dipanggil, is_symbol_tradable cukup membaca cache tanpa request jaringan.
+    Bursa yang cache-nya kedaluwarsa mengambil tabel statusnya secara paralel, sehingga
+    waktu tunggu terlama adalah satu round-trip, bukan jumlah round-trip ketujuh bursa.
+    """
+    for exchange, symbols in exchange_symbols.items():
+        logger.info(f"Memeriksa status trading untuk {len(symbols)} simbol {TRADING_STATUS_CONFIG[exchange]['name']}...")
 
-def get_bybit_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk deposit ke ByBit"""
-    global bybit_networks_cache
+    with ThreadPoolExecutor(max_workers=max(len(exchange_symbols), 1), thread_name_prefix="status") as executor:
+        futures = {
+            exchange: executor.submit(get_trading_status, exchange, symbols)
+            for exchange, symbols in exchange_symbols.items()
+        }
+    return {exchange: future.result() for exchange, future in futures.items()}
 
-    # Normalisasi nama coin
-    coin = coin.upper()
 
-    # Cek cache terlebih dahulu
-    if coin in bybit_networks_cache:
-        cache_time, networks = bybit_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
+def is_symbol_tradable(exchange: str, symbol: str) -> bool:
+    """Membaca status trading satu simbol dari cache tanpa request jaringan"""
+    if TRADING_STATUS_CONFIG[exchange].get("lowercase_symbols", False):
+        symbol = symbol.lower()
 
-    # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["bybit"]
-        bybit_networks_cache[coin] = (datetime.now(), networks)
-        return networks
+    # Sama seperti saat error: status terakhir yang diketahui tetap dipakai meski sudah kedaluwarsa
+    is_tradable = EXCHANGES[exchange].trading_status.peek(symbol)
+    if is_tradable is None:
+        logger.debug(f"Status trading {symbol} di {exchange} belum dimuat, jalankan preload_trading_status terlebih dahulu")
+        return True
+    return is_tradable
 
-    # Jika tidak ada data statis, gunakan data default
-    # ByBit tidak memiliki API publik untuk mendapatkan informasi jaringan
-    # Jadi kita gunakan data default
-    default_networks = ["ERC20", "TRC20"]
-    bybit_networks_cache[coin] = (datetime.now(), default_networks)
-    return default_networks
 
+def get_binance_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol Binance sekaligus"""
+    return get_trading_status("binance", symbols)
 
-def get_okx_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk deposit ke OKX"""
-    global okx_networks_cache
 
-    # Normalisasi nama coin
-    coin = coin.upper()
+def get_networks(exchange: str, coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke suatu bursa (berdasarkan NETWORK_CONFIG)"""
+    config = NETWORK_CONFIG[exchange]
+    state = EXCHANGES[exchange]
+    cache = state.networks
 
-    # Cek cache terlebih dahulu
-    if coin in okx_networks_cache:
-        cache_time, networks = okx_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
+    # Normalisasi nama coin (isupper() murah, salinan upper() hanya jika perlu);
+    # di-intern agar hash dan perbandingan key cache murah
+    if not coin.isupper():
+        coin = coin.upper()
+    coin = sys.intern(coin)
 
-    # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["okx"]
-        okx_networks_cache[coin] = (datetime.now(), networks)
+    # Cek cache terlebih dahulu (entri kedaluwarsa tidak dikembalikan)
+    now = time.monotonic()
+    networks = cache.get(coin, now=now)
+    if networks is not None:
         return networks
 
-    # Jika tidak ada data statis, coba dapatkan dari API
-    try:
-        # Dapatkan informasi jaringan dari OKX
-        response = requests.get(
-            f"{OKX_API_URL}/asset/deposit-address",
-            params={"ccy": coin},
-            timeout=10
-        )
-        data = response.json()
-
-        if data["code"] == "0" and "data" in data:
-            # Dapatkan jaringan yang didukung
-            networks = []
-            for chain_info in data["data"]:
-                if chain_info["chain"]:
-                    chain_name = chain_info["chain"]
-                    # Normalisasi nama jaringan
-                    for common_network in COMMON_NETWORKS:
-                        if common_network.lower() in chain_name.lower():
-                            networks.append(common_network)
-                            break
-                    else:
-                        networks.append(chain_name)
-
-            # Simpan ke cache
-            okx_networks_cache[coin] = (datetime.now(), networks)
-            return networks
-        else:
-            logger.debug(f"Gagal mendapatkan informasi jaringan OKX untuk {coin}: {data}")
-            # Gunakan data default jika gagal
-            default_networks = ["ERC20", "TRC20"]
-            okx_networks_cache[coin] = (datetime.now(), default_networks)
-            return default_networks
-
-    except Exception as e:
-        logger.debug(f"Error mendapatkan jaringan OKX untuk {coin}: {e}")
-        # Gunakan data default jika terjadi error
-        default_networks = ["ERC20", "TRC20"]
-        okx_networks_cache[coin] = (datetime.now(), default_networks)
-        return default_networks
-
-
-def get_gate_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk deposit ke Gate.io"""
-    global gate_networks_cache
-
-    # Normalisasi nama coin
-    coin = coin.upper()
-
-    # Cek cache terlebih dahulu
-    if coin in gate_networks_cache:
-        cache_time, networks = gate_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
-
     # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["gate"]
-        gate_networks_cache[coin] = (datetime.now(), networks)
+    networks = STATIC_NETWORKS_BY_EXCHANGE[exchange].get(coin)
+    if networks is not None:
+        cache.set(coin, networks, stored_at=now)
         return networks
 
-    # Jika tidak ada data statis, coba dapatkan dari API
-    try:
-        # Dapatkan informasi jaringan dari Gate.io
-        response = requests.get(
-            f"{GATE_API_URL}/wallet/currency_chains",
-            params={"currency": coin},
-            timeout=10
-        )
-        data = response.json()
-
-        if isinstance(data, list):
-            # Dapatkan jaringan yang didukung
-            networks = []
-            for chain_info in data:
-                if chain_info["chain"]:
-                    chain_name = chain_info["chain"]
-                    # Normalisasi nama jaringan
-                    for common_network in COMMON_NETWORKS:
-                        if common_network.lower() in chain_name.lower():
-                            networks.append(common_network)
-                            break
-                    else:
-                        networks.append(chain_name)
-
-            # Simpan ke cache
-            gate_networks_cache[coin] = (datetime.now(), networks)
-            return networks
-        else:
-            logger.debug(f"Gagal mendapatkan informasi jaringan Gate.io untuk {coin}: {data}")
-            # Gunakan data default jika gagal
-            default_networks = ["ERC20", "TRC20"]
-            gate_networks_cache[coin] = (datetime.now(), default_networks)
-            return default_networks
-
-    except Exception as e:
-        logger.debug(f"Error mendapatkan jaringan Gate.io untuk {coin}: {e}")
-        # Gunakan data default jika terjadi error
-        default_networks = ["ERC20", "TRC20"]
-        gate_networks_cache[coin] = (datetime.now(), default_networks)
-        return default_networks
-
-
-def get_mexc_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk deposit ke MEXC"""
-    global mexc_networks_cache
-
-    # Normalisasi nama coin
-    coin = coin.upper()
-
-    # Cek cache terlebih dahulu
-    if coin in mexc_networks_cache:
-        cache_time, networks = mexc_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
+    # Bursa tanpa API publik untuk informasi jaringan langsung memakai data default
+    if config["url"] is not None:
+        try:
+            # Validator hanya ada jika entri cache berasal dari respons API yang berhasil
+            validators = state.network_validators.get(coin)
+            stale_networks = cache.peek(coin) if validators else None
+            coin_param = config["coin_param"]
+            response = SESSION.get(
+                config["url"].format(coin=coin),
+                params={coin_param: coin} if coin_param else None,
+                headers=conditional_headers(validators) or None,
+                timeout=10
+            )
+            if response.status_code == 304 and stale_networks is not None:
+                # Tidak berubah: perpanjang umur entri cache tanpa parse ulang
+                cache.set(coin, stale_networks)
+                return stale_networks
+
+            data = parse_json_response(response)
+
+            if config["is_valid"](data):
+                networks = [normalize_network_name(chain_name) for chain_name in config["chains"](data, coin)]
+                cache.set(coin, networks)
+                validators = response_validators(response)
+                if validators:
+                    state.network_validators[coin] = validators
+                else:
+                    state.network_validators.pop(coin, None)
+                return networks
 
-    # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["mexc"]
-        mexc_networks_cache[coin] = (datetime.now(), networks)
-        return networks
+            logger.debug(f"Gagal mendapatkan informasi jaringan {config['name']} untuk {coin}: {data}")
+        except Exception as e:
+            logger.debug(f"Error mendapatkan jaringan {config['name']} untuk {coin}: {e}")
 
-    # MEXC tidak memiliki API publik untuk mendapatkan informasi jaringan
-    # Jadi kita gunakan data default
-    default_networks = ["ERC20", "TRC20"]
-    mexc_networks_cache[coin] = (datetime.now(), default_networks)
-    return default_networks
+    # Gunakan data default jika gagal atau tidak ada API
+    state.network_validators.pop(coin, None)
+    cache.set(coin, DEFAULT_DEPOSIT_NETWORKS, stored_at=now)
+    return DEFAULT_DEPOSIT_NETWORKS
 
 
-def get_htx_networks(coin: str) -> List[str]:
-    """Mendapatkan jaringan yang didukung untuk deposit ke HTX (Huobi)"""
-    global htx_networks_cache
+def load_binance_wallet_config() -> Dict[str, List[str]]:
+    """Mengambil konfigurasi wallet Binance dan mengindeks jaringan withdraw per coin dalam satu pass"""
+    response = SESSION.get(
+        f"{BINANCE_API_URL}/capital/config/getall",
+        timeout=10
+    )
+    data = parse_json_response(response)
 
-    # Normalisasi nama coin
-    coin = coin.upper()
+    return {
+        coin_info["coin"]: [
+            normalize_network_name(network_info["network"])
+            for network_info in coin_info["networkList"]
+            if network_info["withdrawEnable"]
+        ]
+        for coin_info in data
+    }
 
-    # Cek cache terlebih dahulu
-    if coin in htx_networks_cache:
-        cache_time, networks = htx_networks_cache[coin]
-        # Jika cache belum kedaluwarsa, gunakan nilai dari cache
-        if (datetime.now() - cache_time).total_seconds() < CACHE_EXPIRY:
-            return networks
+
+def get_binance_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk withdraw dari Binance"""
+    cache = EXCHANGES["binance"].networks
+
+    # Normalisasi nama coin (isupper() murah, salinan upper() hanya jika perlu);
+    # di-intern agar hash dan perbandingan key cache murah
+    if not coin.isupper():
+        coin = coin.upper()
+    coin = sys.intern(coin)
+
+    # Cek cache terlebih dahulu (entri kedaluwarsa tidak dikembalikan)
+    now = time.monotonic()
+    networks = cache.get(coin, now=now)
+    if networks is not None:
+        return networks
 
     # Cek data statis
-    if coin in STATIC_NETWORK_DATA:
-        networks = STATIC_NETWORK_DATA[coin]["htx"]
-        htx_networks_cache[coin] = (datetime.now(), networks)
+    networks = STATIC_NETWORKS_BY_EXCHANGE["binance"].get(coin)
+    if networks is not None:
+        cache.set(coin, networks, stored_at=now)
         return networks
 
     # Jika tidak ada data statis, coba dapatkan dari API
     try:
-        # Dapatkan informasi jaringan dari HTX (Huobi)
-        response = requests.get(
-            "https://api.huobi.pro/v2/reference/currencies",
-            params={"currency": coin},
-            timeout=10
-        )
-        data = response.json()
-
-        if data["code"] == 200 and "data" in data:
-            # Dapatkan jaringan yang didukung
-            networks = []
-            for coin_info in data["data"]:
-                if coin_info["currency"].upper() == coin.upper():
-                    for chain_info in coin_info["chains"]:
-                        if chain_info["depositStatus"] == "allowed":
-                            chain_name = chain_info["chain"]
-                            # Normalisasi nama jaringan
-                            for common_network in COMMON_NETWORKS:
-                                if common_network.lower() in chain_name.lower():
-                                    networks.append(common_network)
-                                    break
-                            else:
-                                networks.append(chain_name)
-
-            # Simpan ke cache
-            htx_networks_cache[coin] = (datetime.now(), networks)
-            return networks
-        else:
-            logger.debug(f"Gagal mendapatkan informasi jaringan HTX untuk {coin}: {data}")
-            # Gunakan data default jika gagal
-            default_networks = ["ERC20", "TRC20"]
-            htx_networks_cache[coin] = (datetime.now(), default_networks)
-            return default_networks
+        wallet_config = load_binance_wallet_config()
 
-    except Exception as e:
-        logger.debug(f"Error mendapatkan jaringan HTX untuk {coin}: {e}")
-        # Gunakan data default jika terjadi error
-        default_networks = ["ERC20", "TRC20"]
-        htx_networks_cache[coin] = (datetime.now(), default_networks)
-        return default_networks
+        # Isi cache untuk semua coin sekaligus agar coin lain tidak memicu request ulang
+        # (coin dengan data statis tetap memakai data statis)
+        cache.update({
+            coin_name: networks
+            for coin_name, networks in wallet_config.items()
+            if coin_name not in STATIC_NETWORK_COINS
+        })
 
+        if coin in wallet_config:
+            return wallet_config[coin]
 
-def get_kucoin_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari KuCoin"""
-    global kucoin_prices_data
+        # Jika coin tidak ditemukan, gunakan data default
+        cache.set(coin, DEFAULT_BINANCE_NETWORKS)
+        return DEFAULT_BINANCE_NETWORKS
 
-    # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
-    data_age_seconds = float('inf')  # Default ke nilai tak terhingga
+    except Exception as e:
+        logger.debug(f"Error mendapatkan jaringan Binance untuk {coin}: {e}")
+        # Gunakan data default jika terjadi error
+        cache.set(coin, DEFAULT_BINANCE_NETWORKS, stored_at=now)
+        return DEFAULT_BINANCE_NETWORKS
 
-    if kucoin_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - kucoin_prices_data["timestamp"]).total_seconds()
 
-    # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and kucoin_prices_data["prices"]:
-        logger.debug(f"Menggunakan data KuCoin dari cache (umur: {data_age_seconds:.1f} detik)")
-        return kucoin_prices_data["prices"], kucoin_prices_data["volumes"]
+def get_binance_ticker_filter() -> List[str]:
+    """Mendapatkan daftar simbol untuk filter server-side ticker Binance
 
-    # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
-    try:
-        logger.info("Mengambil data harga terbaru dari KuCoin...")
-        response = requests.get(f"{KUCOIN_API_URL}/api/v1/market/allTickers", timeout=10)
-        data = response.json()
+    Returns:
+        List simbol, atau list kosong jika ticker harus diambil penuh (bootstrap atau filter kedaluwarsa)
+    """
+    state = EXCHANGES["binance"]
+    now = time.monotonic()
 
-        if data["code"] == "200000":
-            prices = {}
-            volumes = {}
-            for ticker in data["data"]["ticker"]:
-                symbol = ticker["symbol"]
-                price = safe_float(ticker["last"])
-                volume = safe_float(ticker["volValue"])  # Volume dalam USD
+    # Saat startup, gunakan filter dari cache disk agar siklus pertama pun sudah terfilter
+    if state.ticker_filter_time is None and not FORCE_REFRESH:
+        cached, age = load_disk_cache("binance_ticker_filter")
+        if cached:
+            state.ticker_filter = cached
+            state.ticker_filter_time = now - age
 
-                prices[symbol] = price
-                volumes[symbol] = volume
+    if state.ticker_filter_time is None or now - state.ticker_filter_time >= CACHE_EXPIRY:
+        return []
+    return state.ticker_filter
 
-            # Update data global dengan timestamp
-            kucoin_prices_data["prices"] = prices
-            kucoin_prices_data["volumes"] = volumes
-            kucoin_prices_data["timestamp"] = current_time
 
-            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari KuCoin")
-            return prices, volumes
-        else:
-            logger.error(f"Gagal mengambil harga KuCoin: {data}")
-            # Jika gagal dan ada data lama, gunakan data lama
-            if kucoin_prices_data["prices"]:
-                logger.warning(f"Menggunakan data KuCoin lama (umur: {data_age_seconds:.1f} detik)")
-                return kucoin_prices_data["prices"], kucoin_prices_data["volumes"]
-            return {}, {}
+def update_binance_ticker_filter(common_pairs: Dict[str, Dict[str, str]]) -> None:
+    """Membentuk filter ticker Binance dari pasangan yang juga ada di bursa lain
 
-    except Exception as e:
-        logger.error(f"Error mendapatkan harga KuCoin: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if kucoin_prices_data["prices"]:
-            logger.warning(f"Menggunakan data KuCoin lama (umur: {data_age_seconds:.1f} detik)")
-            return kucoin_prices_data["prices"], kucoin_prices_data["volumes"]
-        return {}, {}
+    Hanya dibentuk ulang saat filter kosong atau kedaluwarsa, dan hanya dari harga hasil
+    ticker penuh; filter yang dibentuk dari data terfilter hanya akan menyusut.
+    """
+    state = EXCHANGES["binance"]
+    now = time.monotonic()
+    if state.ticker_filter_time is not None and now - state.ticker_filter_time < CACHE_EXPIRY:
+        return
+    if state.price_params is not None:
+        # Harga saat ini masih berasal dari request terfilter; tunggu ticker penuh berikutnya
+        return
 
+    symbols = sorted(
+        exchanges["binance"] for exchanges in common_pairs.values() if "binance" in exchanges
+    )
+    state.ticker_filter = symbols
+    state.ticker_filter_time = now
+    save_disk_cache("binance_ticker_filter", state.ticker_filter)
+    logger.debug(f"Filter ticker Binance diperbarui: {len(state.ticker_filter)} simbol")
 
-def get_bybit_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari ByBit"""
-    global bybit_prices_data
 
-    # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
-    data_age_seconds = float('inf')  # Default ke nilai tak terhingga
+def reset_binance_ticker_filter() -> None:
+    """Membuang filter ticker Binance (di memori dan di disk) setelah request terfilter ditolak
 
-    if bybit_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - bybit_prices_data["timestamp"]).total_seconds()
+    Mis. simbol yang sudah delisting membuat Binance menolak seluruh request (400 "Invalid
+    symbol"); request berikutnya mengambil ticker penuh dan filter dibentuk ulang darinya.
+    """
+    state = EXCHANGES["binance"]
+    state.ticker_filter = []
+    state.ticker_filter_time = None
+    remove_disk_cache("binance_ticker_filter")
+
+
+def get_binance_ticker_params() -> Optional[List[Dict[str, str]]]:
+    """Parameter request ticker Binance: satu dict per potongan filter simbol server-side, atau None"""
+    symbol_filter = get_binance_ticker_filter()
+    if not symbol_filter:
+        return None
+    return [
+        {"symbols": json.dumps(symbol_filter[i:i + BINANCE_TICKER_FILTER_CHUNK], separators=(",", ":"))}
+        for i in range(0, len(symbol_filter), BINANCE_TICKER_FILTER_CHUNK)
+    ]
 
-    # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and bybit_prices_data["prices"]:
-        logger.debug(f"Menggunakan data ByBit dari cache (umur: {data_age_seconds:.1f} detik)")
-        return bybit_prices_data["prices"], bybit_prices_data["volumes"]
 
-    # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
-    try:
-        logger.info("Mengambil data harga terbaru dari ByBit...")
-        response = requests.get(f"{BYBIT_API_URL}/market/tickers", params={"category": "spot"}, timeout=10)
-        data = response.json()
+HTX_TICKER_FIELDS = operator.itemgetter("symbol", "close", "vol")
 
-        if data["retCode"] == 0 and "result" in data and "list" in data["result"]:
-            prices = {}
-            volumes = {}
-            for ticker in data["result"]["list"]:
-                symbol = ticker["symbol"]
-                price = safe_float(ticker["lastPrice"])
-                volume = safe_float(ticker["volume24h"]) * price  # Konversi volume ke USD
 
-                prices[symbol] = price
-                volumes[symbol] = volume
+# Konfigurasi endpoint ticker per bursa. Setiap bursa memetakan respons ke tuple
+# (simbol, harga terakhir, volume) lewat "structs" (hasil decode msgspec) atau "tickers" (dict JSON);
+# base_volume=True berarti volume dalam base currency dan dikalikan harga untuk mendapat nilai USD.
+PRICE_CONFIG = {
+    "binance": {
+        "name": "Binance",
+        "url": f"{BINANCE_API_URL}/ticker/24hr",
+        "params": get_binance_ticker_params,
+        "reset_params": reset_binance_ticker_filter,  # Dipanggil jika request terfilter ditolak
+        "decoder": BINANCE_TICKER_DECODER,
+        "base_volume": False,
+        "is_valid": lambda data: isinstance(data, list),
+        "tickers": lambda data: (
+            (ticker["symbol"], safe_float(ticker["lastPrice"]), safe_float(ticker["quoteVolume"])) for ticker in data
+        ),
+        "structs": lambda data: ((ticker.symbol, ticker.lastPrice, ticker.quoteVolume) for ticker in data)
+    },
+    "kucoin": {
+        "name": "KuCoin",
+        "url": f"{KUCOIN_API_URL}/api/v1/market/allTickers",
+        "params": None,
+        "decoder": KUCOIN_TICKER_DECODER,
+        "base_volume": False,  # volValue sudah dalam USD
+        "is_valid": lambda data: data["code"] == "200000",
+        "tickers": lambda data: (
+            (ticker["symbol"], safe_float(ticker["last"]), safe_float(ticker["volValue"]))
+            for ticker in data["data"]["ticker"]
+        ),
+        "structs": lambda data: ((ticker.symbol, ticker.last or 0.0, ticker.volValue) for ticker in data.data.ticker)
+    },
+    "bybit": {
+        "name": "ByBit",
+        "url": f"{BYBIT_API_URL}/market/tickers",
+        "params": {"category": "spot"},
+        "decoder": BYBIT_TICKER_DECODER,
+        "base_volume": True,
+        "is_valid": lambda data: data["retCode"] == 0 and "result" in data and "list" in data["result"],
+        "tickers": lambda data: (
+            (ticker["symbol"], safe_float(ticker["lastPrice"]), safe_float(ticker["volume24h"]))
+            for ticker in data["result"]["list"]
+        ),
+        "structs": lambda data: ((ticker.symbol, ticker.lastPrice, ticker.volume24h) for ticker in data.result.list)
+    },
+    "okx": {
+        "name": "OKX",
+        "url": f"{OKX_API_URL}/market/tickers",
+        "params": {"instType": "SPOT"},
+        "decoder": OKX_TICKER_DECODER,
+        # OKX API menggunakan vol24h untuk volume dalam base currency dan volCcy24h untuk volume dalam quote currency
+        "base_volume": True,
+        "is_valid": lambda data: data["code"] == "0" and "data" in data,
+        "tickers": lambda data: (
+            (ticker["instId"], safe_float(ticker["last"]), safe_float(ticker.get("vol24h", 0)))
+            for ticker in data["data"]
+        ),
+        "structs": lambda data: ((ticker.instId, ticker.last, ticker.vol24h) for ticker in data.data)
+    },
+    "gate": {
+        "name": "Gate.io",
+        "url": f"{GATE_API_URL}/spot/tickers",
+        "params": None,
+        "decoder": GATE_TICKER_DECODER,
+        "base_volume": False,  # quote_volume dalam quote currency (USDT)
+        "is_valid": lambda data: isinstance(data, list),
+        "tickers": lambda data: (
+            (ticker["currency_pair"], safe_float(ticker["last"]), safe_float(ticker["quote_volume"])) for ticker in data
+        ),
+        "structs": lambda data: ((ticker.currency_pair, ticker.last, ticker.quote_volume) for ticker in data)
+    },
+    "mexc": {
+        "name": "MEXC",
+        "url": f"{MEXC_API_URL}/ticker/24hr",
+        "params": None,
+        "decoder": MEXC_TICKER_DECODER,
+        "base_volume": False,  # quoteVolume dalam quote currency (USDT)
+        "is_valid": lambda data: isinstance(data, list),
+        "tickers": lambda data: (
+            (ticker["symbol"], safe_float(ticker["lastPrice"]), safe_float(ticker["quoteVolume"])) for ticker in data
+        ),
+        "structs": lambda data: ((ticker.symbol, ticker.lastPrice, ticker.quoteVolume) for ticker in data)
+    },
+    "htx": {
+        "name": "HTX",
+        "url": f"{HTX_API_URL}/tickers",
+        "params": None,
+        "decoder": HTX_TICKER_DECODER,
+        "base_volume": True,
+        "is_valid": lambda data: data["status"] == "ok" and "data" in data,
+        # Harga dan volume HTX sudah berupa angka JSON, jadi field diambil dengan itemgetter (C)
+        # tanpa konversi per field; baris dengan nilai null dilewati
+        "tickers": lambda data: (
+            ticker for ticker in map(HTX_TICKER_FIELDS, data["data"]) if None not in ticker
+        ),
+        "structs": lambda data: ((ticker.symbol, ticker.close, ticker.vol) for ticker in data.data)
+    }
+}
 
-            # Update data global dengan timestamp
-            bybit_prices_data["prices"] = prices
-            bybit_prices_data["volumes"] = volumes
-            bybit_prices_data["timestamp"] = current_time
 
-            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari ByBit")
-            return prices, volumes
-        else:
-            logger.error(f"Gagal mengambil harga ByBit: {data}")
-            # Jika gagal dan ada data lama, gunakan data lama
-            if bybit_prices_data["prices"]:
-                logger.warning(f"Menggunakan data ByBit lama (umur: {data_age_seconds:.1f} detik)")
-                return bybit_prices_data["prices"], bybit_prices_data["volumes"]
-            return {}, {}
+def parse_price_response(exchange: str, response: requests.Response) -> Optional[Tuple[Dict[str, float], Dict[str, float]]]:
+    """Mengubah body respons ticker menjadi tabel harga dan volume (USD) suatu bursa
 
-    except Exception as e:
-        logger.error(f"Error mendapatkan harga ByBit: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if bybit_prices_data["prices"]:
-            logger.warning(f"Menggunakan data ByBit lama (umur: {data_age_seconds:.1f} detik)")
-            return bybit_prices_data["prices"], bybit_prices_data["volumes"]
-        return {}, {}
+    Terpisah dari get_prices (cache, fallback data lama, dan request) sehingga cara
+    pengambilan respons bisa diganti tanpa menyentuh parsing.
 
+    Returns:
+        Tuple (harga, volume), atau None jika respons menandakan kegagalan
+    """
+    config = PRICE_CONFIG[exchange]
 
-def get_okx_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari OKX"""
-    global okx_prices_data
+    # Struct msgspec hanya lolos validasi untuk respons sukses; selain itu parse sebagai dict
+    data = decode_ticker_response(response, config["decoder"])
+    if data is not None:
+        tickers = config["structs"](data)
+    else:
+        data = parse_json_response(response)
+        if not config["is_valid"](data):
+            logger.error(f"Gagal mengambil harga {config['name']}: {data}")
+            return None
+        tickers = config["tickers"](data)
+
+    base_volume = config["base_volume"]
+    prices = {}
+    volumes = {}
+    for symbol, price, volume in tickers:
+        if base_volume:
+            volume *= price  # Konversi volume ke USD
+        # Pasangan bervolume rendah atau tanpa harga (mis. harga terakhir null) tidak akan
+        # lolos filter arbitrase, buang lebih awal agar tabel harga tetap kecil
+        if volume < MIN_VOLUME_USD or price <= 0:
+            continue
+
+        symbol = sys.intern(symbol)
+        prices[symbol] = price
+        volumes[symbol] = volume
+
+    return prices, volumes
+
+
+def fetch_price_batches(
+    exchange: str, param_batches: List[Dict[str, str]]
+) -> Optional[Tuple[Dict[str, float], Dict[str, float]]]:
+    """Mengambil ticker terfilter dalam beberapa request paralel lalu menggabungkan hasilnya
+
+    Returns:
+        Tuple (harga, volume), atau None jika salah satu request gagal
+    """
+    url = PRICE_CONFIG[exchange]["url"]
+    with ThreadPoolExecutor(max_workers=len(param_batches), thread_name_prefix="ticker") as executor:
+        responses = list(executor.map(
+            lambda batch_params: SESSION.get(url, params=batch_params, timeout=10), param_batches
+        ))
+
+    prices = {}
+    volumes = {}
+    for response in responses:
+        parsed = parse_price_response(exchange, response)
+        if parsed is None:
+            return None
+        prices.update(parsed[0])
+        volumes.update(parsed[1])
+    return prices, volumes
+
+
+def get_prices(exchange: str, force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari suatu bursa (berdasarkan PRICE_CONFIG)"""
+    config = PRICE_CONFIG[exchange]
+    name = config["name"]
+    state = EXCHANGES[exchange]
 
     # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
+    current_time = time.monotonic()
     data_age_seconds = float('inf')  # Default ke nilai tak terhingga
 
-    if okx_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - okx_prices_data["timestamp"]).total_seconds()
+    if state.timestamp is not None:
+        data_age_seconds = current_time - state.timestamp
 
     # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and okx_prices_data["prices"]:
-        logger.debug(f"Menggunakan data OKX dari cache (umur: {data_age_seconds:.1f} detik)")
-        return okx_prices_data["prices"], okx_prices_data["volumes"]
+    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and state.prices:
+        logger.debug(f"Menggunakan data {name} dari cache (umur: {data_age_seconds:.1f} detik)")
+        return state.prices, state.volumes
 
     # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
     try:
-        logger.info("Mengambil data harga terbaru dari OKX...")
-        response = requests.get(f"{OKX_API_URL}/market/tickers", params={"instType": "SPOT"}, timeout=10)
-        data = response.json()
-
-        if data["code"] == "0" and "data" in data:
-            prices = {}
-            volumes = {}
-            for ticker in data["data"]:
-                symbol = ticker["instId"]  # Format: BTC-USDT
-                price = safe_float(ticker["last"])
-                # OKX API menggunakan vol24h untuk volume dalam base currency dan volCcy24h untuk volume dalam quote currency
-                volume = safe_float(ticker.get("vol24h", 0)) * price  # Konversi volume ke USD
-
-                prices[symbol] = price
-                volumes[symbol] = volume
+        logger.info(f"Mengambil data harga terbaru dari {name}...")
+        for attempt in range(2):
+            params = config["params"]
+            if callable(params):
+                params = params()
+            if isinstance(params, list):
+                # Filter simbol dipecah ke beberapa request; conditional GET hanya untuk request tunggal
+                response = None
+                parsed = fetch_price_batches(exchange, params)
+            else:
+                # Validator hanya berlaku untuk request yang sama dan selama data lama masih ada
+                # untuk dipakai ulang
+                validators = None
+                if state.price_validators is not None and state.prices and state.price_validators[0] == params:
+                    validators = state.price_validators[1]
+                response = SESSION.get(
+                    config["url"], params=params, headers=conditional_headers(validators) or None, timeout=10
+                )
 
-            # Update data global dengan timestamp
-            okx_prices_data["prices"] = prices
-            okx_prices_data["volumes"] = volumes
-            okx_prices_data["timestamp"] = current_time
+                if response.status_code == 304 and validators is not None:
+                    # Ticker tidak berubah: perpanjang umur data lama tanpa parse ulang
+                    state.timestamp = current_time
+                    logger.info(f"Data harga {name} tidak berubah (304), memakai data sebelumnya")
+                    return state.prices, state.volumes
+
+                parsed = parse_price_response(exchange, response)
+            if parsed is None:
+                # Filter simbol server-side bisa membuat seluruh request ditolak; buang filter
+                # lalu ulangi sekali tanpa filter
+                reset_params = config.get("reset_params")
+                if attempt == 0 and params and reset_params is not None:
+                    logger.warning(f"Request ticker {name} dengan filter simbol ditolak, mengulang tanpa filter")
+                    reset_params()
+                    continue
+                break
+
+            prices, volumes = parsed
 
-            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari OKX")
+            # Normalisasi simbol dilakukan di sini (thread refresh) agar find_common_pairs
+            # tidak perlu menormalisasi ulang seluruh simbol pada setiap siklus scan
+            normalize = SYMBOL_NORMALIZERS[exchange]
+            state.normalized_symbols = (prices, {normalize(symbol): symbol for symbol in prices})
+
+            # Update data global dengan timestamp
+            state.prices = prices
+            state.volumes = volumes
+            state.timestamp = current_time
+            state.price_params = params
+            # Bursa yang tidak mengirim ETag/Last-Modified tetap memakai pemeriksaan umur cache saja
+            new_validators = response_validators(response) if response is not None else None
+            state.price_validators = (params, new_validators) if new_validators else None
+
+            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari {name}")
             return prices, volumes
-        else:
-            logger.error(f"Gagal mengambil harga OKX: {data}")
-            # Jika gagal dan ada data lama, gunakan data lama
-            if okx_prices_data["prices"]:
-                logger.warning(f"Menggunakan data OKX lama (umur: {data_age_seconds:.1f} detik)")
-                return okx_prices_data["prices"], okx_prices_data["volumes"]
-            return {}, {}
 
     except Exception as e:
-        logger.error(f"Error mendapatkan harga OKX: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if okx_prices_data["prices"]:
-            logger.warning(f"Menggunakan data OKX lama (umur: {data_age_seconds:.1f} detik)")
-            return okx_prices_data["prices"], okx_prices_data["volumes"]
-        return {}, {}
+        logger.error(f"Error mendapatkan harga {name}: {e}")
 
+    # Jika gagal dan ada data lama, gunakan data lama
+    if state.prices:
+        logger.warning(f"Menggunakan data {name} lama (umur: {data_age_seconds:.1f} detik)")
+        return state.prices, state.volumes
+    return {}, {}
 
-def get_gate_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari Gate.io"""
-    global gate_prices_data
 
-    # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
-    data_age_seconds = float('inf')  # Default ke nilai tak terhingga
+def get_binance_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari Binance"""
+    return get_prices("binance", force_refresh)
 
-    if gate_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - gate_prices_data["timestamp"]).total_seconds()
 
-    # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and gate_prices_data["prices"]:
-        logger.debug(f"Menggunakan data Gate.io dari cache (umur: {data_age_seconds:.1f} detik)")
-        return gate_prices_data["prices"], gate_prices_data["volumes"]
+def get_kucoin_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol KuCoin sekaligus"""
+    return get_trading_status("kucoin", symbols)
 
-    # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
-    try:
-        logger.info("Mengambil data harga terbaru dari Gate.io...")
-        response = requests.get(f"{GATE_API_URL}/spot/tickers", timeout=10)
-        data = response.json()
 
-        if isinstance(data, list):
-            prices = {}
-            volumes = {}
-            for ticker in data:
-                symbol = ticker["currency_pair"]  # Format: BTC_USDT
-                price = safe_float(ticker["last"])
-                volume = safe_float(ticker["quote_volume"])  # Volume dalam quote currency (USDT)
+def get_bybit_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol ByBit sekaligus"""
+    return get_trading_status("bybit", symbols)
 
-                prices[symbol] = price
-                volumes[symbol] = volume
 
-            # Update data global dengan timestamp
-            gate_prices_data["prices"] = prices
-            gate_prices_data["volumes"] = volumes
-            gate_prices_data["timestamp"] = current_time
+def get_okx_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol OKX sekaligus"""
+    return get_trading_status("okx", symbols)
 
-            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari Gate.io")
-            return prices, volumes
-        else:
-            logger.error(f"Gagal mengambil harga Gate.io: {data}")
-            # Jika gagal dan ada data lama, gunakan data lama
-            if gate_prices_data["prices"]:
-                logger.warning(f"Menggunakan data Gate.io lama (umur: {data_age_seconds:.1f} detik)")
-                return gate_prices_data["prices"], gate_prices_data["volumes"]
-            return {}, {}
 
-    except Exception as e:
-        logger.error(f"Error mendapatkan harga Gate.io: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if gate_prices_data["prices"]:
-            logger.warning(f"Menggunakan data Gate.io lama (umur: {data_age_seconds:.1f} detik)")
-            return gate_prices_data["prices"], gate_prices_data["volumes"]
-        return {}, {}
+def get_gate_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol Gate.io sekaligus"""
+    return get_trading_status("gate", symbols)
 
 
-def get_mexc_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari MEXC"""
-    global mexc_prices_data
+def get_mexc_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol MEXC sekaligus"""
+    return get_trading_status("mexc", symbols)
 
-    # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
-    data_age_seconds = float('inf')  # Default ke nilai tak terhingga
 
-    if mexc_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - mexc_prices_data["timestamp"]).total_seconds()
+def get_htx_trading_status(symbols: List[str] = None) -> Dict[str, bool]:
+    """Mendapatkan status trading untuk beberapa simbol HTX (Huobi) sekaligus"""
+    return get_trading_status("htx", symbols)
 
-    # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and mexc_prices_data["prices"]:
-        logger.debug(f"Menggunakan data MEXC dari cache (umur: {data_age_seconds:.1f} detik)")
-        return mexc_prices_data["prices"], mexc_prices_data["volumes"]
 
-    # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
-    try:
-        logger.info("Mengambil data harga terbaru dari MEXC...")
-        response = requests.get(f"{MEXC_API_URL}/ticker/24hr", timeout=10)
-        data = response.json()
+def get_kucoin_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke KuCoin"""
+    return get_networks("kucoin", coin)
 
-        if isinstance(data, list):
-            prices = {}
-            volumes = {}
-            for ticker in data:
-                symbol = ticker["symbol"]  # Format: BTCUSDT
-                price = safe_float(ticker["lastPrice"])
-                volume = safe_float(ticker["quoteVolume"])  # Volume dalam quote currency (USDT)
 
-                prices[symbol] = price
-                volumes[symbol] = volume
+def get_bybit_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke ByBit"""
+    return get_networks("bybit", coin)
 
-            # Update data global dengan timestamp
-            mexc_prices_data["prices"] = prices
-            mexc_prices_data["volumes"] = volumes
-            mexc_prices_data["timestamp"] = current_time
 
-            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari MEXC")
-            return prices, volumes
-        else:
-            logger.error(f"Gagal mengambil harga MEXC: {data}")
-            # Jika gagal dan ada data lama, gunakan data lama
-            if mexc_prices_data["prices"]:
-                logger.warning(f"Menggunakan data MEXC lama (umur: {data_age_seconds:.1f} detik)")
-                return mexc_prices_data["prices"], mexc_prices_data["volumes"]
-            return {}, {}
+def get_okx_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke OKX"""
+    return get_networks("okx", coin)
 
-    except Exception as e:
-        logger.error(f"Error mendapatkan harga MEXC: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if mexc_prices_data["prices"]:
-            logger.warning(f"Menggunakan data MEXC lama (umur: {data_age_seconds:.1f} detik)")
-            return mexc_prices_data["prices"], mexc_prices_data["volumes"]
-        return {}, {}
 
+def get_gate_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke Gate.io"""
+    return get_networks("gate", coin)
 
-def get_htx_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Mendapatkan harga dan volume dari HTX (Huobi)"""
-    global htx_prices_data
 
-    # Cek apakah data masih valid atau perlu refresh
-    current_time = datetime.now()
-    data_age_seconds = float('inf')  # Default ke nilai tak terhingga
+def get_mexc_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke MEXC"""
+    return get_networks("mexc", coin)
 
-    if htx_prices_data["timestamp"] is not None:
-        data_age_seconds = (current_time - htx_prices_data["timestamp"]).total_seconds()
 
-    # Jika data masih valid dan tidak dipaksa refresh, gunakan data yang ada
-    if not force_refresh and data_age_seconds < PRICE_DATA_EXPIRY and htx_prices_data["prices"]:
-        logger.debug(f"Menggunakan data HTX dari cache (umur: {data_age_seconds:.1f} detik)")
-        return htx_prices_data["prices"], htx_prices_data["volumes"]
+def get_htx_networks(coin: str) -> List[str]:
+    """Mendapatkan jaringan yang didukung untuk deposit ke HTX (Huobi)"""
+    return get_networks("htx", coin)
 
-    # Jika data sudah kedaluwarsa atau dipaksa refresh, ambil data baru
-    try:
-        logger.info("Mengambil data harga terbaru dari HTX...")
-        response = requests.get(f"{HTX_API_URL}/tickers", timeout=10)
-        data = response.json()
 
-        if data["status"] == "ok" and "data" in data:
-            prices = {}
-            volumes = {}
-            for ticker in data["data"]:
-                symbol = ticker["symbol"]  # Format: btcusdt
-                price = safe_float(ticker["close"])
-                volume = safe_float(ticker["vol"]) * price  # Konversi volume ke USD
+def get_kucoin_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari KuCoin"""
+    return get_prices("kucoin", force_refresh)
+
 
-                prices[symbol] = price
-                volumes[symbol] = volume
+def get_bybit_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari ByBit"""
+    return get_prices("bybit", force_refresh)
 
-            # Update data global dengan timestamp
-            htx_prices_data["prices"] = prices
-            htx_prices_data["volumes"] = volumes
-            htx_prices_data["timestamp"] = current_time
 
-            logger.info(f"Berhasil mengambil {len(prices)} harga terbaru dari HTX")
-            return prices, volumes
-        else:
-            logger.error(f"Gagal mengambil harga HTX: {data}")
-            # Jika gagal dan ada data lama, gunakan data lama
-            if htx_prices_data["prices"]:
-                logger.warning(f"Menggunakan data HTX lama (umur: {data_age_seconds:.1f} detik)")
-                return htx_prices_data["prices"], htx_prices_data["volumes"]
-            return {}, {}
+def get_okx_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari OKX"""
+    return get_prices("okx", force_refresh)
 
-    except Exception as e:
-        logger.error(f"Error mendapatkan harga HTX: {e}")
-        # Jika gagal dan ada data lama, gunakan data lama
-        if htx_prices_data["prices"]:
-            logger.warning(f"Menggunakan data HTX lama (umur: {data_age_seconds:.1f} detik)")
-            return htx_prices_data["prices"], htx_prices_data["volumes"]
-        return {}, {}
+
+def get_gate_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari Gate.io"""
+    return get_prices("gate", force_refresh)
+
+
+def get_mexc_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari MEXC"""
+    return get_prices("mexc", force_refresh)
+
+
+def get_htx_prices(force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mendapatkan harga dan volume dari HTX (Huobi)"""
+    return get_prices("htx", force_refresh)
 
 
 def find_common_pairs(
@@ -1660,52 +1676,38 @@ def find_common_pairs(
     mexc_prices: Dict[str, float],
     htx_prices: Dict[str, float]
 ) -> Dict[str, Dict[str, str]]:
-    """Menemukan pasangan trading yang sama di minimal 2 bursa"""
-    normalized_binance = {normalize_binance_symbol(s): s for s in binance_prices.keys()}
-    normalized_kucoin = {normalize_kucoin_symbol(s): s for s in kucoin_prices.keys()}
-    normalized_bybit = {normalize_bybit_symbol(s): s for s in bybit_prices.keys()}
-    normalized_okx = {normalize_okx_symbol(s): s for s in okx_prices.keys()}
-    normalized_gate = {normalize_gate_symbol(s): s for s in gate_prices.keys()}
-    normalized_mexc = {normalize_mexc_symbol(s): s for s in mexc_prices.keys()}
-    normalized_htx = {normalize_htx_symbol(s): s for s in htx_prices.keys()}
-
-    # Temukan pasangan yang sama di minimal 2 bursa
-    common_pairs = {}
-
-    # Buat set untuk semua simbol yang dinormalisasi
-    all_normalized = set(normalized_binance.keys()) | set(normalized_kucoin.keys()) | \
-                     set(normalized_bybit.keys()) | set(normalized_okx.keys()) | \
-                     set(normalized_gate.keys()) | set(normalized_mexc.keys()) | \
-                     set(normalized_htx.keys())
-
-    # Untuk setiap simbol yang dinormalisasi, cek di bursa mana saja simbol tersebut ada
-    for norm in all_normalized:
-        exchanges = {}
-
-        if norm in normalized_binance:
-            exchanges["binance"] = normalized_binance[norm]
+    """Menemukan pasangan trading yang sama di minimal 2 bursa
 
-        if norm in normalized_kucoin:
-            exchanges["kucoin"] = normalized_kucoin[norm]
-
-        if norm in normalized_bybit:
-            exchanges["bybit"] = normalized_bybit[norm]
-
-        if norm in normalized_okx:
-            exchanges["okx"] = normalized_okx[norm]
-
-        if norm in normalized_gate:
-            exchanges["gate"] = normalized_gate[norm]
-
-        if norm in normalized_mexc:
-            exchanges["mexc"] = normalized_mexc[norm]
-
-        if norm in normalized_htx:
-            exchanges["htx"] = normalized_htx[norm]
+    Dibangun sebagai indeks terbalik {simbol ternormalisasi: {bursa: simbol asli}} dengan
+    membaca simbol setiap bursa tepat sekali, tanpa himpunan gabungan atau pengecekan per bursa.
+    """
+    exchange_prices = (
+        ("binance", binance_prices),
+        ("kucoin", kucoin_prices),
+        ("bybit", bybit_prices),
+        ("okx", okx_prices),
+        ("gate", gate_prices),
+        ("mexc", mexc_prices),
+        ("htx", htx_prices),
+    )
 
-        # Jika simbol ada di minimal 2 bursa, tambahkan ke common_pairs
-        if len(exchanges) >= 2:
-            common_pairs[norm] = exchanges
+    # Kelompokkan simbol asli per simbol ternormalisasi dalam satu pass per bursa
+    pairs_by_symbol: Dict[str, Dict[str, str]] = {}
+    for exchange, prices in exchange_prices:
+        # Pakai hasil normalisasi saat ingest jika dict harga ini yang dinormalisasi
+        normalized = EXCHANGES[exchange].normalized_symbols
+        if normalized is not None and normalized[0] is prices:
+            symbol_pairs = normalized[1].items()
+        else:
+            normalize = SYMBOL_NORMALIZERS[exchange]
+            symbol_pairs = ((normalize(symbol), symbol) for symbol in prices)
+        for norm, symbol in symbol_pairs:
+            pairs_by_symbol.setdefault(norm, {})[exchange] = symbol
+
+    # Simpan hanya simbol yang ada di minimal 2 bursa
+    common_pairs = {
+        norm: exchanges for norm, exchanges in pairs_by_symbol.items() if len(exchanges) >= 2
+    }
 
     logger.info(f"Ditemukan {len(common_pairs)} pasangan trading yang sama di minimal 2 bursa")
     return common_pairs
@@ -1741,19 +1743,15 @@ def find_common_networks(coin: str) -> Dict[str, List[str]]:
         "htx": normalized_htx
     }
 
-    # Buat set dari semua jaringan yang ada
-    all_networks = set()
-    for networks in exchange_networks.values():
-        all_networks.update(networks)
-
-    # Hitung berapa banyak bursa yang mendukung setiap jaringan
+    # Hitung berapa banyak bursa yang mendukung setiap jaringan dalam satu pass
+    # (dict.fromkeys membuang duplikat dalam satu bursa tanpa mengubah urutan)
     network_support_count = {}
-    for network in all_networks:
-        count = sum(1 for exchange_net in exchange_networks.values() if network in exchange_net)
-        network_support_count[network] = count
+    for networks in exchange_networks.values():
+        for network in dict.fromkeys(networks):
+            network_support_count[network] = network_support_count.get(network, 0) + 1
 
     # Urutkan jaringan berdasarkan jumlah bursa yang mendukung (dari yang terbanyak)
-    sorted_networks = sorted(network_support_count.items(), key=lambda x: x[1], reverse=True)
+    sorted_networks = sorted(network_support_count.items(), key=operator.itemgetter(1), reverse=True)
 
     # Ambil jaringan yang didukung oleh minimal 2 bursa
     common_networks = [network for network, count in sorted_networks if count >= 2]
@@ -1787,92 +1785,84 @@ def find_common_networks(coin: str) -> Dict[str, List[str]]:
 
 def get_withdrawal_fee(coin: str, network: str, price: float = 0.0) -> float:
     """Mendapatkan biaya penarikan dalam USD"""
-    # Normalisasi nama coin dan network
-    coin = coin.upper()
-    network = network.upper()
+    # Normalisasi nama coin dan network (biasanya sudah uppercase, jadi salinan jarang dibuat)
+    if not coin.isupper():
+        coin = coin.upper()
+    if not network.isupper():
+        network = network.upper()
 
     # Cek apakah ada biaya spesifik untuk coin dan network
-    if coin in WITHDRAWAL_FEES and network in WITHDRAWAL_FEES[coin]:
-        fee = WITHDRAWAL_FEES[coin][network]
+    fee = WITHDRAWAL_FEE_TABLE.get((coin, network))
+    if fee is not None:
         # Jika fee negatif, berarti dalam token, konversi ke USD
         if fee < 0:
-            return abs(fee) * price
+            return -fee * price
         # Jika fee positif, berarti dalam USD
         return fee
 
-    # Cek apakah ada biaya default untuk network
-    if "default" in WITHDRAWAL_FEES and network in WITHDRAWAL_FEES["default"]:
-        return WITHDRAWAL_FEES["default"][network]
-
-    # Gunakan biaya default
-    if "default" in WITHDRAWAL_FEES and "default" in WITHDRAWAL_FEES["default"]:
-        return WITHDRAWAL_FEES["default"]["default"]
-
-    # Jika tidak ada biaya yang ditemukan, gunakan nilai default
-    return 5.0  # $5 USD
+    # Cek biaya default untuk network, lalu biaya default umum
+    return DEFAULT_WITHDRAWAL_FEES.get(network, DEFAULT_WITHDRAWAL_FEE)
 
 
 def get_gas_fee(network: str) -> float:
     """Mendapatkan biaya gas dalam USD"""
     # Normalisasi nama network
-    network = network.upper()
+    if not network.isupper():
+        network = network.upper()
 
-    # Cek apakah ada biaya spesifik untuk network
-    if network in GAS_FEES:
-        return GAS_FEES[network]
-
-    # Gunakan biaya default
-    return GAS_FEES.get("default", 1.0)  # $1 USD
+    # Biaya spesifik untuk network, atau biaya default
+    return GAS_FEES.get(network, DEFAULT_GAS_FEE)
 
 
 def get_trading_fee(exchange: str, order_type: str = "taker") -> float:
     """Mendapatkan biaya trading dalam persentase"""
     # Normalisasi nama exchange dan order_type
-    exchange = exchange.lower()
-    order_type = order_type.lower()
+    if not exchange.islower():
+        exchange = exchange.lower()
+    if not order_type.islower():
+        order_type = order_type.lower()
 
     # Cek apakah ada biaya spesifik untuk exchange dan order_type
-    if exchange in TRADING_FEES and order_type in TRADING_FEES[exchange]:
-        return TRADING_FEES[exchange][order_type]
+    fee = TRADING_FEE_TABLE.get((exchange, order_type))
+    if fee is not None:
+        return fee
 
-    # Cek apakah ada biaya default untuk exchange
-    if exchange in TRADING_FEES and "default" in TRADING_FEES[exchange]:
-        return TRADING_FEES[exchange]["default"]
+    # Cek biaya default untuk exchange, lalu biaya default umum (0.1%)
+    return TRADING_FEE_TABLE.get((exchange, "default"), 0.1)
 
-    # Gunakan biaya default
-    return 0.1  # 0.1%
+
+# Biaya taker per bursa sebagai pecahan (0.001 = 0.1%), dihitung sekali untuk loop scan
+TAKER_FEE_RATES = {exchange: get_trading_fee(exchange, "taker") / 100 for exchange in EXCHANGES}
 
 
 def find_best_network(coin: str, binance_price: float, common_networks: Dict[str, List[str]]) -> Dict[str, str]:
     """Menemukan jaringan terbaik (biaya terendah) untuk transfer"""
     best_network = None
+    best_withdrawal_fee = 0.0
+    best_gas_fee = 0.0
     lowest_total_fee = float('inf')
 
-    # Jika ada jaringan yang sama, pilih yang biayanya paling rendah
-    if common_networks["common"]:
-        for network in common_networks["common"]:
-            # Hitung biaya penarikan
-            withdrawal_fee = get_withdrawal_fee(coin, network, binance_price)
-            # Hitung biaya gas
-            gas_fee = get_gas_fee(network)
-            # Total biaya
-            total_fee = withdrawal_fee + gas_fee
-
-            # Jika biaya lebih rendah, update jaringan terbaik
-            if total_fee < lowest_total_fee:
-                lowest_total_fee = total_fee
-                best_network = network
-    # Jika tidak ada jaringan yang sama, gunakan jaringan default
-    else:
-        best_network = "ERC20"  # Default ke ERC20
-        withdrawal_fee = get_withdrawal_fee(coin, best_network, binance_price)
-        gas_fee = get_gas_fee(best_network)
-        lowest_total_fee = withdrawal_fee + gas_fee
+    # Jika ada jaringan yang sama, pilih yang biayanya paling rendah;
+    # jika tidak, gunakan jaringan default ERC20
+    for network in common_networks["common"] or ("ERC20",):
+        # Hitung biaya penarikan
+        withdrawal_fee = get_withdrawal_fee(coin, network, binance_price)
+        # Hitung biaya gas
+        gas_fee = get_gas_fee(network)
+        # Total biaya
+        total_fee = withdrawal_fee + gas_fee
+
+        # Jika biaya lebih rendah, update jaringan terbaik
+        if total_fee < lowest_total_fee:
+            lowest_total_fee = total_fee
+            best_network = network
+            best_withdrawal_fee = withdrawal_fee
+            best_gas_fee = gas_fee
 
     return {
         "network": best_network,
-        "withdrawal_fee": get_withdrawal_fee(coin, best_network, binance_price),
-        "gas_fee": get_gas_fee(best_network),
+        "withdrawal_fee": best_withdrawal_fee,
+        "gas_fee": best_gas_fee,
         "total_fee": lowest_total_fee
     }
 
@@ -1905,215 +1895,111 @@ def calculate_arbitrage(
     mexc_volumes: Dict[str, float],
     htx_prices: Dict[str, float],
     htx_volumes: Dict[str, float]
-) -> List[Dict]:
+) -> List[Opportunity]:
     """Menghitung peluang arbitrase"""
     opportunities = []
     checked_pairs = 0
     potential_pairs = 0
+    # Satu timestamp tampilan untuk seluruh peluang dalam satu siklus scan
+    scan_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    exchange_data = (
+        ("binance", binance_prices, binance_volumes),
+        ("kucoin", kucoin_prices, kucoin_volumes),
+        ("bybit", bybit_prices, bybit_volumes),
+        ("okx", okx_prices, okx_volumes),
+        ("gate", gate_prices, gate_volumes),
+        ("mexc", mexc_prices, mexc_volumes),
+        ("htx", htx_prices, htx_volumes),
+    )
 
     # Kumpulkan semua simbol dari ketujuh bursa yang perlu diperiksa
-    binance_symbols = []
-    kucoin_symbols = []
-    bybit_symbols = []
-    okx_symbols = []
-    gate_symbols = []
-    mexc_symbols = []
-    htx_symbols = []
-
+    exchange_symbols_to_check = {exchange: [] for exchange, _, _ in exchange_data}
     for exchange_pairs in common_pairs.values():
-        if exchange_pairs.get("binance"):
-            binance_symbols.append(exchange_pairs["binance"])
-        if exchange_pairs.get("kucoin"):
-            kucoin_symbols.append(exchange_pairs["kucoin"])
-        if exchange_pairs.get("bybit"):
-            bybit_symbols.append(exchange_pairs["bybit"])
-        if exchange_pairs.get("okx"):
-            okx_symbols.append(exchange_pairs["okx"])
-        if exchange_pairs.get("gate"):
-            gate_symbols.append(exchange_pairs["gate"])
-        if exchange_pairs.get("mexc"):
-            mexc_symbols.append(exchange_pairs["mexc"])
-        if exchange_pairs.get("htx"):
-            htx_symbols.append(exchange_pairs["htx"])
-
-    # Dapatkan status trading untuk semua simbol sekaligus
-    logger.info(f"Memeriksa status trading untuk {len(binance_symbols)} simbol Binance...")
-    binance_trading_status = get_binance_trading_status(binance_symbols)
-
-    logger.info(f"Memeriksa status trading untuk {len(kucoin_symbols)} simbol KuCoin...")
-    kucoin_trading_status = get_kucoin_trading_status(kucoin_symbols)
-
-    logger.info(f"Memeriksa status trading untuk {len(bybit_symbols)} simbol ByBit...")
-    bybit_trading_status = get_bybit_trading_status(bybit_symbols)
-
-    logger.info(f"Memeriksa status trading untuk {len(okx_symbols)} simbol OKX...")
-    okx_trading_status = get_okx_trading_status(okx_symbols)
-
-    logger.info(f"Memeriksa status trading untuk {len(gate_symbols)} simbol Gate.io...")
-    gate_trading_status = get_gate_trading_status(gate_symbols)
-
-    logger.info(f"Memeriksa status trading untuk {len(mexc_symbols)} simbol MEXC...")
-    mexc_trading_status = get_mexc_trading_status(mexc_symbols)
-
-    logger.info(f"Memeriksa status trading untuk {len(htx_symbols)} simbol HTX...")
-    htx_trading_status = get_htx_trading_status(htx_symbols)
+        for exchange, symbol in exchange_pairs.items():
+            if symbol:
+                exchange_symbols_to_check[exchange].append(symbol)
+
+    # Muat status trading untuk semua simbol sekaligus (satu request per bursa)
+    trading_status = preload_trading_status(exchange_symbols_to_check)
+
+    # (bursa, nama tampilan, harga, volume, status trading) untuk pemeriksaan per pasangan
+    exchange_tables = tuple(
+        (exchange, PRICE_CONFIG[exchange]["name"], prices, volumes, trading_status[exchange])
+        for exchange, prices, volumes in exchange_data
+    )
+    price_tables = {exchange: prices for exchange, prices, _ in exchange_data}
+    min_spread_ratio = 1 + MIN_PROFIT_THRESHOLD / 100
+    # Pesan debug per bursa per pasangan hanya dibentuk jika level DEBUG aktif
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Jaringan bersama hanya bergantung pada coin (mis. USDT dipakai hampir semua pasangan),
+    # jadi dihitung sekali per coin per siklus scan; cache jaringan per bursa tetap mengatur TTL-nya
+    common_networks_by_coin: Dict[str, Dict[str, List[str]]] = {}
 
     for norm_pair, exchange_pairs in common_pairs.items():
         checked_pairs += 1
 
-        try:
-            # Dapatkan simbol dari ketujuh bursa
-            binance_symbol = exchange_pairs.get("binance")
-            kucoin_symbol = exchange_pairs.get("kucoin")
-            bybit_symbol = exchange_pairs.get("bybit")
-            okx_symbol = exchange_pairs.get("okx")
-            gate_symbol = exchange_pairs.get("gate")
-            mexc_symbol = exchange_pairs.get("mexc")
-            htx_symbol = exchange_pairs.get("htx")
+        # Saringan cepat: filter status/volume di bawah hanya mempersempit himpunan bursa,
+        # jadi jika selisih harga mentah sudah di bawah ambang, pasangan ini pasti dilewati
+        raw_prices = [
+            price for price in (price_tables[exchange].get(symbol, 0) for exchange, symbol in exchange_pairs.items())
+            if price > 0
+        ]
+        if len(raw_prices) < 2 or max(raw_prices) < min(raw_prices) * min_spread_ratio:
+            continue
 
+        try:
             # Tentukan bursa mana yang tersedia untuk pasangan ini
             available_exchanges = []
             exchange_symbols = {}
             exchange_prices = {}
             exchange_volumes = {}
             exchange_tradable = {}
-
-            # Cek Binance
-            if binance_symbol:
-                binance_tradable = binance_trading_status.get(binance_symbol, True)
-                if binance_tradable:
-                    binance_price = binance_prices.get(binance_symbol, 0)
-                    binance_volume = binance_volumes.get(binance_symbol, 0)
-                    if binance_price > 0 and binance_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("binance")
-                        exchange_symbols["binance"] = binance_symbol
-                        exchange_prices["binance"] = binance_price
-                        exchange_volumes["binance"] = binance_volume
-                        exchange_tradable["binance"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di Binance: Harga={binance_price}, Volume=${binance_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {binance_symbol} tidak dapat diperdagangkan di Binance")
-
-            # Cek KuCoin
-            if kucoin_symbol:
-                kucoin_tradable = kucoin_trading_status.get(kucoin_symbol, True)
-                if kucoin_tradable:
-                    kucoin_price = kucoin_prices.get(kucoin_symbol, 0)
-                    kucoin_volume = kucoin_volumes.get(kucoin_symbol, 0)
-                    if kucoin_price > 0 and kucoin_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("kucoin")
-                        exchange_symbols["kucoin"] = kucoin_symbol
-                        exchange_prices["kucoin"] = kucoin_price
-                        exchange_volumes["kucoin"] = kucoin_volume
-                        exchange_tradable["kucoin"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di KuCoin: Harga={kucoin_price}, Volume=${kucoin_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {kucoin_symbol} tidak dapat diperdagangkan di KuCoin")
-
-            # Cek ByBit
-            if bybit_symbol:
-                bybit_tradable = bybit_trading_status.get(bybit_symbol, True)
-                if bybit_tradable:
-                    bybit_price = bybit_prices.get(bybit_symbol, 0)
-                    bybit_volume = bybit_volumes.get(bybit_symbol, 0)
-                    if bybit_price > 0 and bybit_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("bybit")
-                        exchange_symbols["bybit"] = bybit_symbol
-                        exchange_prices["bybit"] = bybit_price
-                        exchange_volumes["bybit"] = bybit_volume
-                        exchange_tradable["bybit"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di ByBit: Harga={bybit_price}, Volume=${bybit_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {bybit_symbol} tidak dapat diperdagangkan di ByBit")
-
-            # Cek OKX
-            if okx_symbol:
-                okx_tradable = okx_trading_status.get(okx_symbol, True)
-                if okx_tradable:
-                    okx_price = okx_prices.get(okx_symbol, 0)
-                    okx_volume = okx_volumes.get(okx_symbol, 0)
-                    if okx_price > 0 and okx_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("okx")
-                        exchange_symbols["okx"] = okx_symbol
-                        exchange_prices["okx"] = okx_price
-                        exchange_volumes["okx"] = okx_volume
-                        exchange_tradable["okx"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di OKX: Harga={okx_price}, Volume=${okx_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {okx_symbol} tidak dapat diperdagangkan di OKX")
-
-            # Cek Gate.io
-            if gate_symbol:
-                gate_tradable = gate_trading_status.get(gate_symbol, True)
-                if gate_tradable:
-                    gate_price = gate_prices.get(gate_symbol, 0)
-                    gate_volume = gate_volumes.get(gate_symbol, 0)
-                    if gate_price > 0 and gate_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("gate")
-                        exchange_symbols["gate"] = gate_symbol
-                        exchange_prices["gate"] = gate_price
-                        exchange_volumes["gate"] = gate_volume
-                        exchange_tradable["gate"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di Gate.io: Harga={gate_price}, Volume=${gate_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {gate_symbol} tidak dapat diperdagangkan di Gate.io")
-
-            # Cek MEXC
-            if mexc_symbol:
-                mexc_tradable = mexc_trading_status.get(mexc_symbol, True)
-                if mexc_tradable:
-                    mexc_price = mexc_prices.get(mexc_symbol, 0)
-                    mexc_volume = mexc_volumes.get(mexc_symbol, 0)
-                    if mexc_price > 0 and mexc_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("mexc")
-                        exchange_symbols["mexc"] = mexc_symbol
-                        exchange_prices["mexc"] = mexc_price
-                        exchange_volumes["mexc"] = mexc_volume
-                        exchange_tradable["mexc"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di MEXC: Harga={mexc_price}, Volume=${mexc_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {mexc_symbol} tidak dapat diperdagangkan di MEXC")
-
-            # Cek HTX (Huobi)
-            if htx_symbol:
-                htx_tradable = htx_trading_status.get(htx_symbol, True)
-                if htx_tradable:
-                    htx_price = htx_prices.get(htx_symbol, 0)
-                    htx_volume = htx_volumes.get(htx_symbol, 0)
-                    if htx_price > 0 and htx_volume >= MIN_VOLUME_USD:
-                        available_exchanges.append("htx")
-                        exchange_symbols["htx"] = htx_symbol
-                        exchange_prices["htx"] = htx_price
-                        exchange_volumes["htx"] = htx_volume
-                        exchange_tradable["htx"] = True
-                    else:
-                        logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di HTX: Harga={htx_price}, Volume=${htx_volume:.2f}")
-                else:
-                    logger.debug(f"Simbol {htx_symbol} tidak dapat diperdagangkan di HTX")
+            # Bursa dengan harga terendah dan tertinggi dilacak sambil mengisi tabel di atas;
+            # perbandingan ketat mempertahankan bursa pertama saat harga sama (seperti min/max)
+            buy_exchange = sell_exchange = None
+            buy_price = float('inf')
+            sell_price = 0.0
+
+            for exchange, exchange_name, prices, volumes, status in exchange_tables:
+                symbol = exchange_pairs.get(exchange)
+                if not symbol:
+                    continue
+
+                if not status.get(symbol, True):
+                    if debug_enabled:
+                        logger.debug(f"Simbol {symbol} tidak dapat diperdagangkan di {exchange_name}")
+                    continue
+
+                price = prices.get(symbol, 0)
+                volume = volumes.get(symbol, 0)
+                if price > 0 and volume >= MIN_VOLUME_USD:
+                    available_exchanges.append(exchange)
+                    exchange_symbols[exchange] = symbol
+                    exchange_prices[exchange] = price
+                    exchange_volumes[exchange] = volume
+                    exchange_tradable[exchange] = True
+                    if price < buy_price:
+                        buy_price, buy_exchange = price, exchange
+                    if price > sell_price:
+                        sell_price, sell_exchange = price, exchange
+                elif debug_enabled:
+                    logger.debug(f"Harga atau volume tidak valid untuk {norm_pair} di {exchange_name}: Harga={price}, Volume=${volume:.2f}")
 
             # Kita butuh minimal 2 bursa untuk arbitrase
             if len(available_exchanges) < 2:
-                logger.debug(f"Tidak cukup bursa yang tersedia untuk {norm_pair}: {available_exchanges}")
+                if debug_enabled:
+                    logger.debug(f"Tidak cukup bursa yang tersedia untuk {norm_pair}: {available_exchanges}")
                 continue
 
-            # Temukan bursa dengan harga terendah dan tertinggi
-            buy_exchange = min(available_exchanges, key=lambda x: exchange_prices[x])
-            sell_exchange = max(available_exchanges, key=lambda x: exchange_prices[x])
-
             # Jika harga sama, lewati
-            if exchange_prices[buy_exchange] >= exchange_prices[sell_exchange]:
-                logger.debug(f"Tidak ada perbedaan harga untuk {norm_pair}: {buy_exchange}={exchange_prices[buy_exchange]}, {sell_exchange}={exchange_prices[sell_exchange]}")
+            if buy_price >= sell_price:
+                if debug_enabled:
+                    logger.debug(f"Tidak ada perbedaan harga untuk {norm_pair}: {buy_exchange}={buy_price}, {sell_exchange}={sell_price}")
                 continue
 
-            # Dapatkan harga dan volume
-            buy_price = exchange_prices[buy_exchange]
-            sell_price = exchange_prices[sell_exchange]
+            # Dapatkan volume
             buy_volume = exchange_volumes[buy_exchange]
             sell_volume = exchange_volumes[sell_exchange]
 
@@ -2126,11 +2012,22 @@ def calculate_arbitrage(
 
             # Jika perbedaan harga terlalu besar (kemungkinan false positive), lewati
             if price_diff_pct > MAX_PROFIT_THRESHOLD:
-                logger.debug(f"Perbedaan harga terlalu besar untuk {norm_pair}: {price_diff_pct:.2f}%")
+                if debug_enabled:
+                    logger.debug(f"Perbedaan harga terlalu besar untuk {norm_pair}: {price_diff_pct:.2f}%")
                 continue
 
             potential_pairs += 1
 
+            # Hitung biaya trading
+            buy_fee_rate = TAKER_FEE_RATES[buy_exchange]
+            sell_fee_rate = TAKER_FEE_RATES[sell_exchange]
+
+            # Slippage dan biaya transfer tidak pernah negatif, jadi jika selisih harga tidak
+            # menutup biaya trading saja, keuntungan bersih pasti <= 0: lewati sebelum
+            # menghitung slippage dan mencari jaringan transfer
+            if sell_price * (1 - sell_fee_rate) <= buy_price * (1 + buy_fee_rate):
+                continue
+
             # Hitung slippage berdasarkan volume
             buy_price_with_slippage = calculate_slippage(buy_price, buy_volume, "buy")
             sell_price_with_slippage = calculate_slippage(sell_price, sell_volume, "sell")
@@ -2146,20 +2043,22 @@ def calculate_arbitrage(
             # Hitung jumlah yang bisa dibeli dengan modal
             quantity = MODAL_USD / buy_price_with_slippage
 
-            # Hitung biaya trading
-            buy_fee_pct = get_trading_fee(buy_exchange, "taker")
-            sell_fee_pct = get_trading_fee(sell_exchange, "taker")
-
-            buy_fee = (quantity * buy_price_with_slippage) * (buy_fee_pct / 100)
-            sell_fee = (quantity * sell_price_with_slippage) * (sell_fee_pct / 100)
+            buy_fee = (quantity * buy_price_with_slippage) * buy_fee_rate
+            sell_fee = (quantity * sell_price_with_slippage) * sell_fee_rate
 
             # Dapatkan jaringan terbaik untuk base asset
-            base_networks = find_common_networks(base_asset)
-            best_base_network = find_best_network(base_asset, binance_price, base_networks)
+            # (biaya dalam token dikonversi dengan harga beli pasangan ini, bukan harga Binance
+            # yang belum tentu tersedia untuk pasangan ini)
+            base_networks = common_networks_by_coin.get(base_asset)
+            if base_networks is None:
+                base_networks = common_networks_by_coin[base_asset] = find_common_networks(base_asset)
+            best_base_network = find_best_network(base_asset, buy_price, base_networks)
 
             # Dapatkan jaringan terbaik untuk quote asset
-            quote_networks = find_common_networks(quote_asset)
-            best_quote_network = find_best_network(quote_asset, binance_price, quote_networks)
+            quote_networks = common_networks_by_coin.get(quote_asset)
+            if quote_networks is None:
+                quote_networks = common_networks_by_coin[quote_asset] = find_common_networks(quote_asset)
+            best_quote_network = find_best_network(quote_asset, buy_price, quote_networks)
 
             # Pilih jaringan dengan biaya terendah
             if best_base_network["total_fee"] <= best_quote_network["total_fee"]:
@@ -2197,30 +2096,30 @@ def calculate_arbitrage(
                         "tradable": exchange_tradable[exchange]
                     }
 
-                opportunity = {
-                    "pair": norm_pair,
-                    "exchanges": exchange_info,
-                    "price_diff_pct": price_diff_pct,
-                    "buy_exchange": buy_exchange,
-                    "sell_exchange": sell_exchange,
-                    "buy_price": buy_price_with_slippage,
-                    "sell_price": sell_price_with_slippage,
-                    "quantity": quantity,
-                    "gross_profit_usd": gross_profit_usd,
-                    "net_profit_usd": net_profit_usd,
-                    "roi": roi,
-                    "base_asset": base_asset,
-                    "quote_asset": quote_asset,
-                    "base_networks": base_networks,
-                    "quote_networks": quote_networks,
-                    "best_transfer_network": transfer_network["network"],
-                    "withdrawal_fee": transfer_network["withdrawal_fee"],
-                    "gas_fee": transfer_network["gas_fee"],
-                    "total_transfer_fee": transfer_network["total_fee"],
-                    "buy_trading_fee": buy_fee,
-                    "sell_trading_fee": sell_fee,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
+                opportunity = Opportunity(
+                    pair=norm_pair,
+                    exchanges=exchange_info,
+                    price_diff_pct=price_diff_pct,
+                    buy_exchange=buy_exchange,
+                    sell_exchange=sell_exchange,
+                    buy_price=buy_price_with_slippage,
+                    sell_price=sell_price_with_slippage,
+                    quantity=quantity,
+                    gross_profit_usd=gross_profit_usd,
+                    net_profit_usd=net_profit_usd,
+                    roi=roi,
+                    base_asset=base_asset,
+                    quote_asset=quote_asset,
+                    base_networks=base_networks,
+                    quote_networks=quote_networks,
+                    best_transfer_network=transfer_network["network"],
+                    withdrawal_fee=transfer_network["withdrawal_fee"],
+                    gas_fee=transfer_network["gas_fee"],
+                    total_transfer_fee=transfer_network["total_fee"],
+                    buy_trading_fee=buy_fee,
+                    sell_trading_fee=sell_fee,
+                    timestamp=scan_timestamp
+                )
 
                 opportunities.append(opportunity)
                 logger.info(
@@ -2234,7 +2133,7 @@ def calculate_arbitrage(
             logger.error(f"Error menghitung arbitrase untuk {norm_pair}: {e}")
 
     # Urutkan berdasarkan keuntungan (tertinggi ke terendah)
-    opportunities.sort(key=lambda x: x["gross_profit_usd"], reverse=True)
+    opportunities.sort(key=operator.attrgetter("gross_profit_usd"), reverse=True)
 
     # Log statistik
     logger.info(
@@ -2246,157 +2145,252 @@ def calculate_arbitrage(
     return opportunities
 
 
-def display_opportunities(opportunities: List[Dict]) -> None:
+def write_lines(lines: List[str]) -> None:
+    """Menulis semua baris ke stdout dengan satu write dan satu flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def display_opportunities(opportunities: List[Opportunity]) -> None:
     """Menampilkan peluang arbitrase"""
-    current_time = datetime.now()
-    print("\n=== TOP 10 PELUANG ARBITRASE ===")
-    print(f"Waktu: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    # Semua peluang dari satu siklus scan berbagi timestamp yang sudah diformat;
+    # format ulang hanya jika tidak ada peluang untuk ditampilkan
+    scan_timestamp = opportunities[0].timestamp if opportunities else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Timestamp data harga disimpan sebagai waktu monotonic
+    monotonic_now = time.monotonic()
+    # Baris output dikumpulkan lalu ditulis sekaligus: satu write per refresh, bukan ratusan print
+    lines = []
+    out = lines.append
+    out("\n=== TOP 10 PELUANG ARBITRASE ===")
+    out(f"Waktu: {scan_timestamp}")
 
     # Tampilkan informasi kebaruan data
-    binance_data_age = "N/A"
-    kucoin_data_age = "N/A"
-    bybit_data_age = "N/A"
-    okx_data_age = "N/A"
-    gate_data_age = "N/A"
-    mexc_data_age = "N/A"
-    htx_data_age = "N/A"
-
-    if binance_prices_data["timestamp"] is not None:
-        binance_age_seconds = (current_time - binance_prices_data["timestamp"]).total_seconds()
-        binance_data_age = f"{binance_age_seconds:.1f} detik"
-
-    if kucoin_prices_data["timestamp"] is not None:
-        kucoin_age_seconds = (current_time - kucoin_prices_data["timestamp"]).total_seconds()
-        kucoin_data_age = f"{kucoin_age_seconds:.1f} detik"
-
-    if bybit_prices_data["timestamp"] is not None:
-        bybit_age_seconds = (current_time - bybit_prices_data["timestamp"]).total_seconds()
-        bybit_data_age = f"{bybit_age_seconds:.1f} detik"
-
-    if okx_prices_data["timestamp"] is not None:
-        okx_age_seconds = (current_time - okx_prices_data["timestamp"]).total_seconds()
-        okx_data_age = f"{okx_age_seconds:.1f} detik"
-
-    if gate_prices_data["timestamp"] is not None:
-        gate_age_seconds = (current_time - gate_prices_data["timestamp"]).total_seconds()
-        gate_data_age = f"{gate_age_seconds:.1f} detik"
-
-    if mexc_prices_data["timestamp"] is not None:
-        mexc_age_seconds = (current_time - mexc_prices_data["timestamp"]).total_seconds()
-        mexc_data_age = f"{mexc_age_seconds:.1f} detik"
-
-    if htx_prices_data["timestamp"] is not None:
-        htx_age_seconds = (current_time - htx_prices_data["timestamp"]).total_seconds()
-        htx_data_age = f"{htx_age_seconds:.1f} detik"
-
-    print(f"Data Binance: {binance_data_age} yang lalu | Data KuCoin: {kucoin_data_age} yang lalu | Data ByBit: {bybit_data_age} yang lalu | Data OKX: {okx_data_age} yang lalu")
-    print(f"Data Gate.io: {gate_data_age} yang lalu | Data MEXC: {mexc_data_age} yang lalu | Data HTX: {htx_data_age} yang lalu")
-    print("=" * 80)
+    data_ages = []
+    for exchange, config in PRICE_CONFIG.items():
+        timestamp = EXCHANGES[exchange].timestamp
+        data_age = "N/A" if timestamp is None else f"{monotonic_now - timestamp:.1f} detik"
+        data_ages.append(f"Data {config['name']}: {data_age} yang lalu")
+
+    # Empat bursa pertama di baris pertama, sisanya di baris kedua
+    out(" | ".join(data_ages[:4]))
+    out(" | ".join(data_ages[4:]))
+    out("=" * 80)
 
     if not opportunities:
-        print("Tidak ada peluang arbitrase ditemukan")
+        out("Tidak ada peluang arbitrase ditemukan")
+        write_lines(lines)
         return
 
     # Periksa apakah ada pasangan yang tidak dapat diperdagangkan
     non_tradable_pairs = []
     for opp in opportunities:
-        exchanges_info = opp.get("exchanges", {})
+        exchanges_info = opp.exchanges
         for exchange, info in exchanges_info.items():
             if not info.get("tradable", True):
-                non_tradable_pairs.append(f"{opp['pair']} di {exchange.upper()}")
+                non_tradable_pairs.append(f"{opp.pair} di {exchange.upper()}")
 
     if non_tradable_pairs:
-        print("⚠️  PERINGATAN: Beberapa pasangan tidak dapat diperdagangkan:")
+        out("⚠️  PERINGATAN: Beberapa pasangan tidak dapat diperdagangkan:")
         for pair in non_tradable_pairs:
-            print(f"   - {pair}")
-        print("=" * 80)
+            out(f"   - {pair}")
+        out("=" * 80)
 
     for i, opp in enumerate(opportunities[:10], 1):
-        # Tambahkan peringatan jika pasangan tidak dapat diperdagangkan
-        exchanges_info = opp.get("exchanges", {})
+        # Baris status per bursa dan peringatan (jika ada bursa yang tidak dapat
+        # diperdagangkan) disusun dalam satu iterasi
+        status_lines = []
         warning = ""
-
-        for exchange, info in exchanges_info.items():
-            if not info.get("tradable", True):
+        for exchange, info in opp.exchanges.items():
+            tradable = info.get("tradable", True)
+            if not tradable:
                 warning = " ⚠️"
-                break
-
-        print(f"{i}. {opp['pair']}{warning}")
-        print(f"   Beli di: {opp['buy_exchange'].upper()} dengan harga {opp['buy_price']:.8f}")
-        print(f"   Jual di: {opp['sell_exchange'].upper()} dengan harga {opp['sell_price']:.8f}")
-        print(f"   Selisih: {opp['price_diff_pct']:.2f}%")
+            status = "✅ Aktif" if tradable else "❌ Tidak aktif"
+            status_lines.append(
+                f"     - {exchange.upper()}: {status}, Harga: {info.get('price', 0):.8f}, Volume: ${info.get('volume', 0):.2f}"
+            )
 
-        # Tampilkan informasi profit dan biaya
-        print(f"   Profit Kotor: ${opp['gross_profit_usd']:.2f}")
-        print(f"   Biaya Trading Beli: ${opp['buy_trading_fee']:.2f}")
-        print(f"   Biaya Trading Jual: ${opp['sell_trading_fee']:.2f}")
-        print(f"   Biaya Transfer: ${opp['total_transfer_fee']:.2f} (Penarikan: ${opp['withdrawal_fee']:.2f}, Gas: ${opp['gas_fee']:.2f})")
-        print(f"   Profit Bersih: ${opp['net_profit_usd']:.2f}")
-        print(f"   ROI: {opp['roi']:.2f}%")
+        # Ringkasan harga, profit, dan biaya diformat dalam satu f-string
+        out(
+            f"{i}. {opp.pair}{warning}\n"
+            f"   Beli di: {opp.buy_exchange.upper()} dengan harga {opp.buy_price:.8f}\n"
+            f"   Jual di: {opp.sell_exchange.upper()} dengan harga {opp.sell_price:.8f}\n"
+            f"   Selisih: {opp.price_diff_pct:.2f}%\n"
+            f"   Profit Kotor: ${opp.gross_profit_usd:.2f}\n"
+            f"   Biaya Trading Beli: ${opp.buy_trading_fee:.2f}\n"
+            f"   Biaya Trading Jual: ${opp.sell_trading_fee:.2f}\n"
+            f"   Biaya Transfer: ${opp.total_transfer_fee:.2f} (Penarikan: ${opp.withdrawal_fee:.2f}, Gas: ${opp.gas_fee:.2f})\n"
+            f"   Profit Bersih: ${opp.net_profit_usd:.2f}\n"
+            f"   ROI: {opp.roi:.2f}%"
+        )
 
         # Tampilkan informasi status trading untuk setiap bursa
-        print("   Status Bursa:")
-        for exchange, info in exchanges_info.items():
-            status = "✅ Aktif" if info.get("tradable", True) else "❌ Tidak aktif"
-            price = info.get("price", 0)
-            volume = info.get("volume", 0)
-            print(f"     - {exchange.upper()}: {status}, Harga: {price:.8f}, Volume: ${volume:.2f}")
+        out("   Status Bursa:")
+        lines.extend(status_lines)
 
         # Tampilkan informasi jaringan terbaik untuk transfer
-        print(f"   Jaringan Transfer Terbaik: {opp['best_transfer_network']}")
+        out(f"   Jaringan Transfer Terbaik: {opp.best_transfer_network}")
 
         # Tampilkan informasi jaringan untuk base asset
-        if "base_networks" in opp and opp["base_networks"]:
-            base_networks = opp["base_networks"]
+        if opp.base_networks:
+            base_networks = opp.base_networks
             common_base_networks = base_networks.get("common", [])
 
             if common_base_networks:
-                print(f"   Jaringan {opp['base_asset']} yang didukung semua bursa: {', '.join(common_base_networks)}")
+                out(f"   Jaringan {opp.base_asset} yang didukung semua bursa: {', '.join(common_base_networks)}")
             else:
                 # Tampilkan jaringan untuk setiap bursa
                 for exchange in ["binance", "kucoin", "bybit"]:
                     if exchange in base_networks:
                         networks = base_networks.get(exchange, [])
-                        print(f"   Jaringan {opp['base_asset']} {exchange.upper()}: {', '.join(networks) or 'Tidak ada'}")
+                        out(f"   Jaringan {opp.base_asset} {exchange.upper()}: {', '.join(networks) or 'Tidak ada'}")
 
         # Tampilkan informasi jaringan untuk quote asset
-        if "quote_networks" in opp and opp["quote_networks"]:
-            quote_networks = opp["quote_networks"]
+        if opp.quote_networks:
+            quote_networks = opp.quote_networks
             common_quote_networks = quote_networks.get("common", [])
 
             if common_quote_networks:
-                print(f"   Jaringan {opp['quote_asset']} yang didukung semua bursa: {', '.join(common_quote_networks)}")
+                out(f"   Jaringan {opp.quote_asset} yang didukung semua bursa: {', '.join(common_quote_networks)}")
             else:
                 # Tampilkan jaringan untuk setiap bursa
                 for exchange in ["binance", "kucoin", "bybit"]:
                     if exchange in quote_networks:
                         networks = quote_networks.get(exchange, [])
-                        print(f"   Jaringan {opp['quote_asset']} {exchange.upper()}: {', '.join(networks) or 'Tidak ada'}")
+                        out(f"   Jaringan {opp.quote_asset} {exchange.upper()}: {', '.join(networks) or 'Tidak ada'}")
+
+        out("-" * 80)
 
-        print("-" * 80)
+    write_lines(lines)
 
 
-def save_opportunities(opportunities: List[Dict], filename: str = "arbitrage_opportunities.json") -> None:
-    """Menyimpan peluang arbitrase ke file JSON"""
+def save_opportunities(opportunities: List[Opportunity], filename: str = "arbitrage_opportunities.json") -> bool:
+    """Menyimpan peluang arbitrase ke file JSON secara atomik
+
+    Data ditulis ke file sementara lalu os.replace, sehingga pembaca file
+    (mis. UI) tidak pernah melihat JSON yang baru setengah tertulis.
+    """
+    tmp_filename = f"{filename}.tmp"
     try:
-        with open(filename, "w") as f:
-            json.dump(opportunities, f, indent=4)
+        if orjson is not None:
+            # orjson menserialisasi dataclass langsung ke bytes tanpa asdict perantara
+            data = orjson.dumps(opportunities, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps([asdict(opportunity) for opportunity in opportunities], indent=4).encode()
+        with open(tmp_filename, "wb") as f:
+            f.write(data)
+        os.replace(tmp_filename, filename)
         logger.info(f"Berhasil menyimpan {len(opportunities)} peluang arbitrase ke {filename}")
+        return True
     except Exception as e:
         logger.error(f"Error menyimpan peluang arbitrase: {e}")
+        return False
+
 
+def signal_handler(sig, task: asyncio.Task) -> None:
+    """Menangani sinyal interupsi dengan membatalkan task main_loop
 
-def signal_handler(sig, _):
-    """Menangani sinyal interupsi
+    Berbeda dengan sys.exit, pembatalan task membiarkan blok finally berjalan
+    sehingga task background dihentikan dan koneksi ditutup dengan rapi.
 
     Args:
         sig: Sinyal yang diterima
-        _: Frame eksekusi saat sinyal diterima (tidak digunakan)
+        task: Task main_loop yang dibatalkan
     """
     global running
     logger.info(f"Menerima sinyal interupsi {sig}, menutup program...")
     running = False
-    sys.exit(0)
+    task.cancel()
+
+
+def fetch_prices(exchange: str, force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Memanggil get_prices satu bursa dengan satu request aktif per bursa (single-flight)
+
+    Pemanggil yang menunggu lock mendapati cache sudah segar dan langsung memakainya.
+    """
+    with EXCHANGES[exchange].price_lock:
+        return get_prices(exchange, force_refresh)
+
+
+def get_cached_prices(exchange: str) -> Optional[Tuple[Dict[str, float], Dict[str, float]]]:
+    """Harga dan volume dari cache jika masih segar; None jika harus diambil ulang"""
+    state = EXCHANGES[exchange]
+    if state.timestamp is None or not state.prices or time.monotonic() - state.timestamp >= PRICE_DATA_EXPIRY:
+        return None
+    return state.prices, state.volumes
+
+
+async def fetch_exchange_prices(exchange: str, force_refresh: bool = False) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Mengambil harga satu bursa; cache yang masih segar dibaca langsung tanpa berpindah thread"""
+    if not force_refresh:
+        cached = get_cached_prices(exchange)
+        if cached is not None:
+            return cached
+    return await asyncio.to_thread(fetch_prices, exchange, force_refresh)
+
+
+async def fetch_all_prices(force_refresh: bool = False) -> Dict[str, Tuple[Dict[str, float], Dict[str, float]]]:
+    """Mengambil harga dan volume dari ketujuh bursa secara bersamaan
+
+    Fungsi get_prices masih blocking, jadi masing-masing dijalankan di thread
+    terpisah agar round-trip jaringan ketujuh bursa saling tumpang tindih.
+    """
+    results = await asyncio.gather(
+        *(fetch_exchange_prices(exchange, force_refresh) for exchange in PRICE_CONFIG)
+    )
+    return dict(zip(PRICE_CONFIG, results))
+
+
+def jittered(interval: float) -> float:
+    """Menambahkan variasi acak ±SCHEDULE_JITTER pada interval"""
+    return interval * (1 + random.uniform(-SCHEDULE_JITTER, SCHEDULE_JITTER))
+
+
+async def price_refresher(exchange: str):
+    """Menyegarkan harga satu bursa di background sebelum cache-nya kedaluwarsa
+
+    Scan membaca cache harga tanpa menunggu request (stale-while-revalidate);
+    jika refresh gagal, get_*_prices tetap mengembalikan data lama.
+    Jadwal mengikuti umur data, sehingga harga yang baru saja diambil oleh scan
+    (karena cache sempat kedaluwarsa) tidak langsung diminta ulang.
+    """
+    state = EXCHANGES[exchange]
+    while running:
+        started = time.monotonic()
+        if state.timestamp is None or started - state.timestamp >= PRICE_REFRESH_INTERVAL:
+            try:
+                await asyncio.to_thread(fetch_prices, exchange, True)
+            except Exception as e:
+                logger.error(f"Error menyegarkan harga {exchange}: {e}")
+
+        # Interval dihitung dari waktu data diambil agar request lambat tidak membuat cache kedaluwarsa;
+        # jika refresh gagal (data tetap tua), coba lagi satu interval setelah awal percobaan ini
+        fetched_at = state.timestamp
+        if fetched_at is None or time.monotonic() - fetched_at >= PRICE_REFRESH_INTERVAL:
+            fetched_at = started
+        await asyncio.sleep(max(jittered(PRICE_REFRESH_INTERVAL) - (time.monotonic() - fetched_at), 0))
+
+
+async def trading_status_refresher(exchange: str):
+    """Menyegarkan tabel status trading satu bursa di background sesuai umurnya
+
+    Status trading jarang berubah, jadi disegarkan jauh lebih jarang daripada harga
+    dan sebelum kedaluwarsa, sehingga preload_trading_status cukup membaca cache.
+    """
+    state = EXCHANGES[exchange]
+    while running:
+        age = float('inf') if state.status_timestamp is None else time.monotonic() - state.status_timestamp
+        if age >= STATUS_REFRESH_AGE:
+            try:
+                # Salinan disk seumur ini juga harus divalidasi ulang ke API
+                await asyncio.to_thread(refresh_trading_status, exchange, STATUS_REFRESH_AGE)
+            except Exception as e:
+                logger.error(f"Error mendapatkan status trading {TRADING_STATUS_CONFIG[exchange]['name']}: {e}")
+
+        if state.status_timestamp is None:
+            delay = STATUS_RETRY_INTERVAL
+        else:
+            delay = max(STATUS_REFRESH_AGE - (time.monotonic() - state.status_timestamp), STATUS_RETRY_INTERVAL)
+        await asyncio.sleep(jittered(delay))
 
 
 async def main_loop():
@@ -2405,89 +2399,133 @@ async def main_loop():
 
     logger.info("Memulai Final Crypto Arbitrage Scanner...")
 
+    # Executor default (min(32, CPU + 4) thread) bisa lebih kecil dari jumlah request
+    # bersamaan di mesin kecil, sehingga fetch tetap antre; gunakan pool berukuran tetap
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch")
+    )
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGINT, signal_handler, signal.SIGINT, asyncio.current_task()
+        )
+    except NotImplementedError:
+        # Event loop di Windows tidak mendukung signal handler; Ctrl+C tetap memicu KeyboardInterrupt
+        pass
+
+    # Status trading (dan harga, setelah data awal) disegarkan oleh task terpisah dengan jadwalnya sendiri
+    refresher_tasks = [
+        asyncio.create_task(trading_status_refresher(exchange)) for exchange in TRADING_STATUS_CONFIG
+    ]
+
     # Selalu ambil data terbaru saat program dimulai
     try:
         # Paksa refresh data dari ketujuh bursa
         logger.info("Mengambil data awal dari ketujuh bursa...")
-        binance_prices, binance_volumes = get_binance_prices(force_refresh=True)
-        kucoin_prices, kucoin_volumes = get_kucoin_prices(force_refresh=True)
-        bybit_prices, bybit_volumes = get_bybit_prices(force_refresh=True)
-        okx_prices, okx_volumes = get_okx_prices(force_refresh=True)
-        gate_prices, gate_volumes = get_gate_prices(force_refresh=True)
-        mexc_prices, mexc_volumes = get_mexc_prices(force_refresh=True)
-        htx_prices, htx_volumes = get_htx_prices(force_refresh=True)
-
-        if not binance_prices or not kucoin_prices or not bybit_prices or not okx_prices or not gate_prices or not mexc_prices or not htx_prices:
+        all_prices = await fetch_all_prices(force_refresh=True)
+        if not all(prices for prices, _ in all_prices.values()):
             logger.error("Gagal mendapatkan data awal dari salah satu bursa")
     except Exception as e:
         logger.error(f"Error saat mengambil data awal: {e}")
 
-    while running:
-        try:
-            # Dapatkan harga dan volume terbaru dari ketujuh bursa
-            # Selalu paksa refresh pada setiap iterasi untuk memastikan data selalu fresh
-            binance_prices, binance_volumes = get_binance_prices(force_refresh=True)
-            kucoin_prices, kucoin_volumes = get_kucoin_prices(force_refresh=True)
-            bybit_prices, bybit_volumes = get_bybit_prices(force_refresh=True)
-            okx_prices, okx_volumes = get_okx_prices(force_refresh=True)
-            gate_prices, gate_volumes = get_gate_prices(force_refresh=True)
-            mexc_prices, mexc_volumes = get_mexc_prices(force_refresh=True)
-            htx_prices, htx_volumes = get_htx_prices(force_refresh=True)
-
-            if not binance_prices or not kucoin_prices or not bybit_prices or not okx_prices or not gate_prices or not mexc_prices or not htx_prices:
-                logger.error("Gagal mendapatkan harga dari salah satu bursa")
-                await asyncio.sleep(10)
-                continue
+    # Setelah cache terisi, harga disegarkan di background sehingga scan tidak menunggu jaringan
+    refresher_tasks.extend(
+        asyncio.create_task(price_refresher(exchange)) for exchange in PRICE_CONFIG
+    )
 
-            # Temukan pasangan trading yang sama
-            common_pairs = find_common_pairs(
-                binance_prices, kucoin_prices, bybit_prices, okx_prices,
-                gate_prices, mexc_prices, htx_prices
-            )
+    last_saved_opportunities = None
 
-            # Hitung peluang arbitrase
-            opportunities = calculate_arbitrage(
-                common_pairs,
-                binance_prices, binance_volumes,
-                kucoin_prices, kucoin_volumes,
-                bybit_prices, bybit_volumes,
-                okx_prices, okx_volumes,
-                gate_prices, gate_volumes,
-                mexc_prices, mexc_volumes,
-                htx_prices, htx_volumes
-            )
+    try:
+        while running:
+            try:
+                # Dapatkan harga dan volume dari cache yang dijaga segar oleh price_refresher;
+                # get_*_prices hanya mengambil langsung jika cache sudah kedaluwarsa
+                all_prices = await fetch_all_prices()
+                if not all(prices for prices, _ in all_prices.values()):
+                    logger.error("Gagal mendapatkan harga dari salah satu bursa")
+                    await asyncio.sleep(10)
+                    continue
+
+                binance_prices, binance_volumes = all_prices["binance"]
+                kucoin_prices, kucoin_volumes = all_prices["kucoin"]
+                bybit_prices, bybit_volumes = all_prices["bybit"]
+                okx_prices, okx_volumes = all_prices["okx"]
+                gate_prices, gate_volumes = all_prices["gate"]
+                mexc_prices, mexc_volumes = all_prices["mexc"]
+                htx_prices, htx_volumes = all_prices["htx"]
+
+                # Temukan pasangan trading yang sama
+                common_pairs = find_common_pairs(
+                    binance_prices, kucoin_prices, bybit_prices, okx_prices,
+                    gate_prices, mexc_prices, htx_prices
+                )
+                update_binance_ticker_filter(common_pairs)
+
+                # Hitung peluang arbitrase di thread terpisah; cache miss jaringan/status trading
+                # memanggil REST secara blocking dan tidak boleh menahan task refresher
+                opportunities = await asyncio.to_thread(
+                    calculate_arbitrage,
+                    common_pairs,
+                    binance_prices, binance_volumes,
+                    kucoin_prices, kucoin_volumes,
+                    bybit_prices, bybit_volumes,
+                    okx_prices, okx_volumes,
+                    gate_prices, gate_volumes,
+                    mexc_prices, mexc_volumes,
+                    htx_prices, htx_volumes
+                )
 
-            # Tampilkan peluang
-            display_opportunities(opportunities)
+                # Tampilkan peluang
+                display_opportunities(opportunities)
 
-            # Simpan peluang ke file
-            if opportunities:
-                save_opportunities(opportunities)
+                # Simpan peluang ke file hanya jika hasilnya berubah sejak penyimpanan terakhir
+                # (timestamp scan tidak ikut dibandingkan)
+                if opportunities and opportunities != last_saved_opportunities:
+                    if save_opportunities(opportunities):
+                        last_saved_opportunities = opportunities
 
-            # Tunggu sebelum update berikutnya
-            logger.info(f"Menunggu {UPDATE_INTERVAL} detik sebelum update berikutnya...")
-            await asyncio.sleep(UPDATE_INTERVAL)
+                # Tunggu sebelum update berikutnya
+                delay = jittered(UPDATE_INTERVAL)
+                logger.info(f"Menunggu {delay:.0f} detik sebelum update berikutnya...")
+                await asyncio.sleep(delay)
 
-        except KeyboardInterrupt:
-            logger.info("Program dihentikan oleh pengguna")
-            running = False
-            break
+            except KeyboardInterrupt:
+                logger.info("Program dihentikan oleh pengguna")
+                running = False
+                break
 
-        except Exception as e:
-            logger.error(f"Error tidak tertangani: {e}")
-            await asyncio.sleep(10)
+            except Exception as e:
+                logger.error(f"Error tidak tertangani: {e}")
+                await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        logger.info("Program dihentikan oleh pengguna")
+    finally:
+        for task in refresher_tasks:
+            task.cancel()
 
     logger.info("Program selesai")
 
 
 if __name__ == "__main__":
-    # Register signal handler
-    signal.signal(signal.SIGINT, signal_handler)
+    parser = argparse.ArgumentParser(description="Final Crypto Arbitrage Scanner")
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Abaikan cache disk dan ambil ulang semua data dari API bursa"
+    )
+    args = parser.parse_args()
+    FORCE_REFRESH = args.force_refresh
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     try:
         # Jalankan loop asyncio
         asyncio.run(main_loop())
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Program dihentikan oleh pengguna")
     except Exception as e:
         logger.exception(f"Error tidak tertangani: {e}")
+    finally:
+        # asyncio.run sudah menunggu thread fetch selesai, jadi koneksi pool aman ditutup
+        SESSION.close()
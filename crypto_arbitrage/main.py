@@ -16,6 +16,12 @@ import argparse
 import time
 from datetime import datetime
 
+# uvloop opsional: event loop berbasis libuv dengan dispatch socket lebih cepat
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Tambahkan print untuk debugging
 print("Program dimulai...")
 
@@ -60,16 +66,20 @@ running = True
 exchanges_ready = False
 arbitrage_thread = None
 ui_thread = None
+# ArbitrageDetector.update adalah coroutine; loop berkala dan worker berbagi lock ini
+# agar paling banyak satu update berjalan
+arbitrage_update_lock = asyncio.Lock()
+
+def signal_handler(sig, task):
+    """Menangani sinyal interupsi dengan membatalkan task utama
 
-def signal_handler(sig, frame):
-    """Menangani sinyal interupsi"""
+    Pembatalan task (bukan sys.exit) membiarkan blok finally di main
+    memutus koneksi WebSocket ke bursa dengan rapi.
+    """
     global running
     logger.info("Menerima sinyal interupsi, menutup program...")
     running = False
-    sys.exit(0)
-
-# Register signal handler
-signal.signal(signal.SIGINT, signal_handler)
+    task.cancel()
 
 async def update_arbitrage_loop(arbitrage_detector, update_interval=10):
     """Loop untuk memperbarui peluang arbitrase"""
@@ -83,7 +93,8 @@ async def update_arbitrage_loop(arbitrage_detector, update_interval=10):
                 continue
 
             # Update peluang arbitrase
-            arbitrage_detector.update()
+            async with arbitrage_update_lock:
+                await arbitrage_detector.update()
 
             # Tunggu sebelum update berikutnya
             await asyncio.sleep(update_interval)
@@ -92,10 +103,36 @@ async def update_arbitrage_loop(arbitrage_detector, update_interval=10):
             logger.error(f"Error dalam update arbitrage loop: {e}")
             await asyncio.sleep(5)
 
+async def arbitrage_update_worker(arbitrage_detector, update_event):
+    """Worker tunggal yang menjalankan update arbitrase setiap ada update harga
+
+    Update harga yang datang beruntun digabung menjadi satu event, dan update
+    (coroutine) di-await di bawah arbitrage_update_lock sehingga paling banyak
+    satu update berjalan.
+    """
+    while running:
+        await update_event.wait()
+        update_event.clear()
+        try:
+            async with arbitrage_update_lock:
+                await arbitrage_detector.update()
+        except Exception as e:
+            logger.error(f"Error dalam update arbitrase: {e}")
+
 async def main():
     """Fungsi utama program"""
     global running, exchanges_ready, arbitrage_thread, ui_thread
 
+    update_worker_task = None
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGINT, signal_handler, signal.SIGINT, asyncio.current_task()
+        )
+    except NotImplementedError:
+        # Event loop di Windows tidak mendukung signal handler; Ctrl+C tetap memicu KeyboardInterrupt
+        pass
+
     try:
         logger.info("Memulai Crypto Arbitrage Scanner...")
 
@@ -119,13 +156,19 @@ async def main():
         arbitrage_detector = ArbitrageDetector(binance, kucoin, modal_usd)
 
         # Set callback untuk update harga
+        loop = asyncio.get_running_loop()
+        update_event = asyncio.Event()
+
         def on_price_update():
             if exchanges_ready:
-                # Jalankan update dalam thread terpisah untuk menghindari blocking
-                threading.Thread(target=arbitrage_detector.update).start()
+                # Tandai ada update; worker meng-await update di event loop tanpa membuat thread baru
+                loop.call_soon_threadsafe(update_event.set)
 
         binance.set_price_update_callback(on_price_update)
         kucoin.set_price_update_callback(on_price_update)
+        update_worker_task = asyncio.create_task(
+            arbitrage_update_worker(arbitrage_detector, update_event)
+        )
 
         # Tampilkan spinner loading
         with LoadingSpinner() as spinner:
@@ -149,7 +192,7 @@ async def main():
 
             # Hitung peluang arbitrase pertama kali
             spinner.update("Menghitung peluang arbitrase...")
-            arbitrage_detector.calculate_arbitrage()
+            await arbitrage_detector.calculate_arbitrage()
 
             # Set flag bahwa bursa sudah siap
             exchanges_ready = True
@@ -163,6 +206,7 @@ async def main():
         if not args.no_ui:
             # Inisialisasi UI
             ui = ArbitrageUI(binance, kucoin, arbitrage_detector, idr_usd_rate)
+            arbitrage_detector.set_opportunities_update_callback(ui.notify_data_changed)
 
             # Jalankan UI dalam thread terpisah
             ui_thread = threading.Thread(target=ui.start)
@@ -193,7 +237,7 @@ async def main():
         # Tunggu hingga semua task selesai
         await asyncio.gather(binance_task, kucoin_task, arbitrage_task)
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Program dihentikan oleh pengguna")
         running = False
 
@@ -201,6 +245,9 @@ async def main():
         logger.exception(f"Error tidak tertangani: {e}")
 
     finally:
+        if update_worker_task:
+            update_worker_task.cancel()
+
         # Tutup koneksi ke bursa
         logger.info("Menutup koneksi ke bursa...")
         await binance.disconnect()
@@ -213,6 +260,9 @@ async def main():
         logger.info("Program selesai")
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         # Jalankan loop asyncio
         asyncio.run(main())
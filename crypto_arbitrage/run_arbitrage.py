@@ -5,13 +5,23 @@
 Program sederhana untuk menjalankan arbitrase
 """
 
+import functools
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+# orjson opsional: parser JSON lebih cepat untuk payload ticker yang besar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,12 +38,36 @@ MODAL_USD = 1000  # Modal dalam USD
 MIN_PROFIT_THRESHOLD = 0.5  # Minimal persentase keuntungan
 MAX_PROFIT_THRESHOLD = 100.0  # Maksimal persentase keuntungan (untuk filter false positive)
 TRADING_FEE = 0.1  # Biaya trading dalam persentase
+TRADING_FEE_RATE = TRADING_FEE / 100
+SELL_NET_FACTOR = 1 - TRADING_FEE_RATE  # Bagian nilai jual yang diterima setelah biaya trading
+BUY_COST_FACTOR = 1 + TRADING_FEE_RATE  # Total biaya beli relatif terhadap modal
+# Rasio harga jual/beli minimal agar selisih mencapai MIN_PROFIT_THRESHOLD dan profit
+# setelah biaya trading di kedua sisi positif: sell * (1 - fee) > buy * (1 + fee)
+MIN_PRICE_RATIO = max(
+    1 + MIN_PROFIT_THRESHOLD / 100,
+    BUY_COST_FACTOR / SELL_NET_FACTOR
+)
+
+# Quote asset Binance beserta panjang suffix-nya; dicek dari suffix terpanjang
+BINANCE_QUOTE_SUFFIXES = {"USDT": 4, "BUSD": 4, "BTC": 3, "ETH": 3, "BNB": 3, "USD": 3}
+
+# Session bersama: koneksi keep-alive dipakai ulang sehingga tidak ada handshake TCP/TLS per request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+def parse_json_response(response):
+    """Parse body respons JSON langsung dari bytes, memakai orjson jika tersedia"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
 
 def get_binance_prices():
     """Mendapatkan harga dari Binance"""
     try:
-        response = requests.get(f"{BINANCE_REST_URL}/ticker/price", timeout=10)
-        data = response.json()
+        response = SESSION.get(f"{BINANCE_REST_URL}/ticker/price", timeout=10)
+        data = parse_json_response(response)
 
         prices = {}
         for item in data:
@@ -51,8 +85,8 @@ def get_binance_prices():
 def get_kucoin_prices():
     """Mendapatkan harga dari KuCoin"""
     try:
-        response = requests.get(f"{KUCOIN_API_URL}/api/v1/market/allTickers", timeout=10)
-        data = response.json()
+        response = SESSION.get(f"{KUCOIN_API_URL}/api/v1/market/allTickers", timeout=10)
+        data = parse_json_response(response)
 
         if data["code"] == "200000":
             prices = {}
@@ -71,13 +105,15 @@ def get_kucoin_prices():
         logger.error(f"Error mendapatkan harga KuCoin: {e}")
         return {}
 
+# Simbol bursa jarang berubah antar scan, jadi hasil normalisasi di-cache per simbol mentah
+@functools.lru_cache(maxsize=8192)
 def normalize_binance_symbol(symbol):
     """Menormalisasi simbol Binance"""
-    common_quotes = ["USDT", "BUSD", "BTC", "ETH", "BNB", "USD"]
-    for quote in common_quotes:
-        if symbol.endswith(quote):
-            base = symbol[:-len(quote)]
-            return f"{base}/{quote}"
+    # Dua lookup dict pada suffix 4 dan 3 huruf, bukan endswith untuk setiap quote
+    for length in (4, 3):
+        quote = symbol[-length:]
+        if BINANCE_QUOTE_SUFFIXES.get(quote) == length:
+            return f"{symbol[:-length]}/{quote}"
 
     # Fallback
     if len(symbol) > 3:
@@ -87,6 +123,7 @@ def normalize_binance_symbol(symbol):
 
     return symbol
 
+@functools.lru_cache(maxsize=8192)
 def normalize_kucoin_symbol(symbol):
     """Menormalisasi simbol KuCoin"""
     if "-" in symbol:
@@ -116,6 +153,8 @@ def find_common_pairs(binance_prices, kucoin_prices):
 def calculate_arbitrage(common_pairs, binance_prices, kucoin_prices):
     """Menghitung peluang arbitrase"""
     opportunities = []
+    # Semua peluang dari satu scan berbagi timestamp yang sama; format sekali saja
+    scan_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     for norm_pair, exchange_pairs in common_pairs.items():
         try:
@@ -129,15 +168,13 @@ def calculate_arbitrage(common_pairs, binance_prices, kucoin_prices):
             if binance_price <= 0 or kucoin_price <= 0:
                 continue
 
-            # Hitung persentase perbedaan harga
+            # Tentukan bursa beli (harga lebih rendah) dan jual
             if binance_price > kucoin_price:
-                price_diff_pct = ((binance_price - kucoin_price) / kucoin_price) * 100
                 buy_exchange = "kucoin"
                 sell_exchange = "binance"
                 buy_price = kucoin_price
                 sell_price = binance_price
             else:
-                price_diff_pct = ((kucoin_price - binance_price) / binance_price) * 100
                 buy_exchange = "binance"
                 sell_exchange = "kucoin"
                 buy_price = binance_price
@@ -146,22 +183,18 @@ def calculate_arbitrage(common_pairs, binance_prices, kucoin_prices):
             logger.warning(f"Error menghitung arbitrase untuk {norm_pair}: {e}")
             continue
 
-        # Jika perbedaan harga terlalu kecil, lewati
-        if price_diff_pct < MIN_PROFIT_THRESHOLD:
+        # Sebagian besar pasangan gugur di sini: satu perkalian menggantikan
+        # perhitungan selisih, biaya, dan profit untuk pasangan yang tidak mungkin untung
+        if sell_price < buy_price * MIN_PRICE_RATIO:
             continue
 
-        # Hitung jumlah yang bisa dibeli dengan modal
-        quantity = MODAL_USD / buy_price
-
-        # Hitung biaya trading
-        buy_fee = (quantity * buy_price) * (TRADING_FEE / 100)
-        sell_fee = (quantity * sell_price) * (TRADING_FEE / 100)
-
-        # Hitung nilai setelah jual
-        sell_value = (quantity * sell_price) - sell_fee
+        # Hitung persentase perbedaan harga
+        price_ratio = sell_price / buy_price
+        price_diff_pct = (price_ratio - 1) * 100
 
-        # Hitung keuntungan kotor (dalam USD)
-        gross_profit_usd = sell_value - (quantity * buy_price) - buy_fee
+        # Jumlah yang dibeli dengan modal bernilai tepat MODAL_USD di harga beli, jadi
+        # nilai jual bersih = MODAL_USD * rasio * (1 - fee) dan biaya beli = MODAL_USD * (1 + fee)
+        gross_profit_usd = MODAL_USD * (price_ratio * SELL_NET_FACTOR - BUY_COST_FACTOR)
 
         # Hitung ROI
         roi = (gross_profit_usd / MODAL_USD) * 100
@@ -179,7 +212,7 @@ def calculate_arbitrage(common_pairs, binance_prices, kucoin_prices):
                 "sell_exchange": sell_exchange,
                 "gross_profit_usd": gross_profit_usd,
                 "roi": roi,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": scan_timestamp
             }
             opportunities.append(opportunity)
 
@@ -191,7 +224,7 @@ def calculate_arbitrage(common_pairs, binance_prices, kucoin_prices):
             )
 
     # Urutkan berdasarkan keuntungan (tertinggi ke terendah)
-    opportunities.sort(key=lambda x: x["gross_profit_usd"], reverse=True)
+    opportunities.sort(key=operator.itemgetter("gross_profit_usd"), reverse=True)
 
     return opportunities
 
@@ -226,9 +259,13 @@ def main():
     print("Memulai Crypto Arbitrage Scanner...")
 
     try:
-        # Dapatkan harga dari kedua bursa
-        binance_prices = get_binance_prices()
-        kucoin_prices = get_kucoin_prices()
+        # Dapatkan harga dari kedua bursa secara bersamaan agar waktu tunggu
+        # hanya selama request terlama, bukan jumlah kedua round-trip
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch") as executor:
+            binance_future = executor.submit(get_binance_prices)
+            kucoin_future = executor.submit(get_kucoin_prices)
+        binance_prices = binance_future.result()
+        kucoin_prices = kucoin_future.result()
 
         if not binance_prices or not kucoin_prices:
             print("Gagal mendapatkan harga dari salah satu bursa")
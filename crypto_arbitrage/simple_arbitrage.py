@@ -6,26 +6,51 @@ Versi sederhana dari program Crypto Arbitrage Scanner
 """
 
 import asyncio
+import atexit
+import heapq
 import json
+import operator
+import queue
+import sys
 import time
-import threading
 import websockets
 import requests
 import logging
+import logging.handlers
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
+# orjson opsional: parser JSON lebih cepat untuk pesan ticker WebSocket
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# uvloop opsional: event loop berbasis libuv dengan dispatch socket lebih cepat
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Konfigurasi logging
+# Record log hanya dimasukkan ke antrean; penulisan ke file dan konsole dilakukan oleh
+# thread QueueListener sehingga event loop tidak ikut menunggu I/O disk
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.FileHandler("arbitrage.log"),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("arbitrage.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger("simple_arbitrage")
 
 # Inisialisasi console Rich
@@ -36,25 +61,61 @@ BINANCE_WS_URL = "wss://stream.binance.com:9443/ws"
 KUCOIN_API_URL = "https://api.kucoin.com"
 TRADING_FEE = 0.1  # 0.1%
 MODAL_USD = 1000  # 1000 USD
+SELL_NET_FACTOR = 1 - TRADING_FEE / 100  # Bagian nilai jual yang diterima setelah biaya trading
+BUY_COST_FACTOR = 1 + TRADING_FEE / 100  # Total biaya beli relatif terhadap modal
+# Quote Binance beserta panjang suffix-nya; dicek dari suffix terpanjang
+BINANCE_QUOTE_SUFFIXES = {"USDT": 4, "BUSD": 4, "BTC": 3, "ETH": 3, "BNB": 3}
+# Urutan field peluang arbitrase selama perhitungan (sebelum dijadikan dict)
+OPPORTUNITY_FIELDS = (
+    "pair", "binance_symbol", "kucoin_symbol", "binance_price", "kucoin_price",
+    "price_diff_pct", "buy_exchange", "sell_exchange", "gross_profit_usd", "roi"
+)
+OPPORTUNITY_PROFIT_KEY = operator.itemgetter(OPPORTUNITY_FIELDS.index("gross_profit_usd"))
+# Opsi koneksi WebSocket untuk feed ticker: tanpa kompresi per-pesan (hemat CPU dan latensi),
+# antrean pesan besar agar burst tidak menahan pembaca, dan batas ukuran pesan yang cukup untuk
+# array !ticker@arr Binance
+WS_CONNECT_OPTIONS = {
+    "compression": None,
+    "max_queue": 1024,
+    "max_size": 2 ** 22,
+}
+RECONNECT_BASE_DELAY = 1.0  # Jeda awal sebelum menghubungkan ulang WebSocket dalam detik
+RECONNECT_MAX_DELAY = 30.0  # Batas jeda backoff saat koneksi terus gagal
+COMPUTE_INTERVAL = 0.5  # Jeda antar perhitungan ulang arbitrase dalam detik
+# Penanda frame kontrol KuCoin yang tidak perlu di-parse
+KUCOIN_CONTROL_MARKERS = ('"type":"pong"', '"type":"welcome"')
+# Spesifikasi kolom tabel peluang arbitrase, dibangun sekali dan dipakai setiap kali tabel ditampilkan
+OPPORTUNITY_TABLE_COLUMNS = (
+    ("Pasangan", {"style": "cyan"}),
+    ("Beli di", {"style": "green"}),
+    ("Jual di", {"style": "red"}),
+    ("Selisih %", {"justify": "right", "style": "yellow"}),
+    ("Profit (USD)", {"justify": "right", "style": "green"}),
+    ("ROI %", {"justify": "right", "style": "cyan"}),
+)
 
 class SimpleArbitrage:
     def __init__(self):
+        # Handler WebSocket dan compute_loop berjalan di satu event loop, jadi state
+        # di bawah ini tidak pernah diakses bersamaan dan tidak memerlukan lock
         self.binance_prices = {}
         self.kucoin_prices = {}
-        self.binance_symbols = set()
-        self.kucoin_symbols = set()
-        self.normalized_pairs = {}
+        self.normalized_symbols = {"binance": {}, "kucoin": {}}  # Simbol ternormalisasi -> simbol bursa
+        self.normalized_pairs = {}  # Simbol ternormalisasi -> (simbol Binance, simbol KuCoin)
         self.arbitrage_opportunities = []
+        self.prices_changed = False  # Ada harga yang diperbarui sejak perhitungan terakhir
         self.kucoin_ws_url = None
         self.kucoin_ping_interval = 30
         self.running = True
-        self.lock = threading.Lock()
 
     async def get_kucoin_ws_token(self):
         """Mendapatkan token untuk koneksi WebSocket KuCoin"""
         try:
-            response = requests.post(f"{KUCOIN_API_URL}/api/v1/bullet-public")
-            data = response.json()
+            # requests bersifat blocking; jalankan di thread agar event loop tetap memproses pesan WebSocket
+            response = await asyncio.to_thread(
+                requests.post, f"{KUCOIN_API_URL}/api/v1/bullet-public", timeout=10
+            )
+            data = json_loads(response.content)
             if data["code"] == "200000":
                 token = data["data"]["token"]
                 server = data["data"]["instanceServers"][0]
@@ -73,11 +134,11 @@ class SimpleArbitrage:
         """Menormalisasi nama simbol untuk konsistensi antar bursa"""
         if exchange == "binance":
             # Binance format: BTCUSDT
-            common_quotes = ["USDT", "BUSD", "BTC", "ETH", "BNB"]
-            for quote in common_quotes:
-                if symbol.endswith(quote):
-                    base = symbol[:-len(quote)]
-                    return f"{base}/{quote}"
+            # Dua lookup dict pada suffix 4 dan 3 huruf, bukan endswith untuk setiap quote
+            for length in (4, 3):
+                quote = symbol[-length:]
+                if BINANCE_QUOTE_SUFFIXES.get(quote) == length:
+                    return f"{symbol[:-length]}/{quote}"
             return symbol
 
         elif exchange == "kucoin":
@@ -89,22 +150,20 @@ class SimpleArbitrage:
 
         return symbol
 
-    def find_common_pairs(self):
-        """Menemukan pasangan trading yang ada di kedua bursa"""
-        normalized_binance = {self.normalize_symbol(s, "binance"): s for s in self.binance_symbols}
-        normalized_kucoin = {self.normalize_symbol(s, "kucoin"): s for s in self.kucoin_symbols}
+    def add_symbol(self, symbol: str, exchange: str):
+        """Mencatat simbol yang baru muncul dan memasangkannya dengan simbol yang sama di bursa lain
 
-        common_normalized = set(normalized_binance.keys()) & set(normalized_kucoin.keys())
+        Pasangan umum dipelihara secara inkremental: setiap simbol dinormalisasi sekali
+        saat pertama kali terlihat, bukan membangun ulang seluruh pasangan per pesan.
+        """
+        norm = self.normalize_symbol(symbol, exchange)
+        self.normalized_symbols[exchange][norm] = symbol
 
-        self.normalized_pairs = {
-            norm: {
-                "binance": normalized_binance[norm],
-                "kucoin": normalized_kucoin[norm]
-            }
-            for norm in common_normalized
-        }
-
-        logger.info(f"Ditemukan {len(self.normalized_pairs)} pasangan trading yang sama di kedua bursa")
+        other = "kucoin" if exchange == "binance" else "binance"
+        other_symbol = self.normalized_symbols[other].get(norm)
+        if other_symbol is not None:
+            self.normalized_pairs[norm] = (symbol, other_symbol) if exchange == "binance" else (other_symbol, symbol)
+            logger.debug(f"Pasangan umum baru: {norm} ({len(self.normalized_pairs)} pasangan)")
 
     def calculate_arbitrage(self):
         """Menghitung peluang arbitrase antara Binance dan KuCoin"""
@@ -112,92 +171,81 @@ class SimpleArbitrage:
         checked_pairs = 0
         potential_pairs = 0
 
-        with self.lock:
-            for norm_pair, exchange_pairs in self.normalized_pairs.items():
-                binance_symbol = exchange_pairs["binance"]
-                kucoin_symbol = exchange_pairs["kucoin"]
+        # Tabel harga dibaca lewat variabel lokal; setiap harga cukup satu lookup dict
+        binance_prices = self.binance_prices
+        kucoin_prices = self.kucoin_prices
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        for norm_pair, (binance_symbol, kucoin_symbol) in self.normalized_pairs.items():
+            binance_price = binance_prices.get(binance_symbol)
+            kucoin_price = kucoin_prices.get(kucoin_symbol)
 
-                if binance_symbol not in self.binance_prices or kucoin_symbol not in self.kucoin_prices:
+            if binance_price is None or kucoin_price is None:
+                continue
+
+            checked_pairs += 1
+
+            try:
+                # Tentukan bursa beli (harga lebih rendah) dan jual
+                if binance_price > kucoin_price:
+                    buy_exchange = "kucoin"
+                    sell_exchange = "binance"
+                    buy_price = kucoin_price
+                    sell_price = binance_price
+                else:
+                    buy_exchange = "binance"
+                    sell_exchange = "kucoin"
+                    buy_price = binance_price
+                    sell_price = kucoin_price
+
+                # Hitung persentase perbedaan harga (satu-satunya pembagian per pasangan)
+                price_ratio = sell_price / buy_price
+                price_diff_pct = (price_ratio - 1) * 100
+
+                # Log semua pasangan dengan perbedaan harga (hanya di level DEBUG; f-string
+                # tidak diformat sama sekali jika DEBUG tidak aktif)
+                if debug_enabled:
+                    logger.debug(f"Perbedaan harga: {norm_pair} - {buy_exchange.upper()}:{buy_price} vs {sell_exchange.upper()}:{sell_price}, Selisih: {price_diff_pct:.4f}%")
+
+                # Jika perbedaan harga terlalu kecil, lewati untuk perhitungan arbitrase
+                if price_diff_pct < 0.05:  # Minimal 0.05% perbedaan untuk arbitrase
                     continue
 
-                checked_pairs += 1
-
-                try:
-                    binance_price = float(self.binance_prices[binance_symbol])
-                    kucoin_price = float(self.kucoin_prices[kucoin_symbol])
-
-                    # Hitung persentase perbedaan harga
-                    if binance_price > kucoin_price:
-                        price_diff_pct = ((binance_price - kucoin_price) / kucoin_price) * 100
-                        buy_exchange = "kucoin"
-                        sell_exchange = "binance"
-                        buy_price = kucoin_price
-                        sell_price = binance_price
-                    else:
-                        price_diff_pct = ((kucoin_price - binance_price) / binance_price) * 100
-                        buy_exchange = "binance"
-                        sell_exchange = "kucoin"
-                        buy_price = binance_price
-                        sell_price = kucoin_price
-
-                    # Log semua pasangan dengan perbedaan harga
-                    logger.info(f"Perbedaan harga: {norm_pair} - {buy_exchange.upper()}:{buy_price} vs {sell_exchange.upper()}:{sell_price}, Selisih: {price_diff_pct:.4f}%")
-
-                    # Jika perbedaan harga terlalu kecil, lewati untuk perhitungan arbitrase
-                    if price_diff_pct < 0.05:  # Minimal 0.05% perbedaan untuk arbitrase
-                        continue
-
-                    potential_pairs += 1
-
-                    # Hitung jumlah yang bisa dibeli dengan modal
-                    quantity = MODAL_USD / buy_price
-
-                    # Hitung biaya trading
-                    buy_fee = (quantity * buy_price) * (TRADING_FEE / 100)
-                    sell_fee = (quantity * sell_price) * (TRADING_FEE / 100)
-
-                    # Hitung nilai setelah jual
-                    sell_value = (quantity * sell_price) - sell_fee
-
-                    # Hitung keuntungan kotor (dalam USD)
-                    gross_profit_usd = sell_value - (quantity * buy_price) - buy_fee
-
-                    # Hitung ROI
-                    roi = (gross_profit_usd / MODAL_USD) * 100
-
-                    # Jika menguntungkan
-                    if gross_profit_usd > 0:
-                        opportunity = {
-                            "pair": norm_pair,
-                            "binance_symbol": binance_symbol,
-                            "kucoin_symbol": kucoin_symbol,
-                            "binance_price": binance_price,
-                            "kucoin_price": kucoin_price,
-                            "price_diff_pct": price_diff_pct,
-                            "buy_exchange": buy_exchange,
-                            "sell_exchange": sell_exchange,
-                            "gross_profit_usd": gross_profit_usd,
-                            "roi": roi,
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        }
-                        opportunities.append(opportunity)
-                        logger.info(f"Peluang arbitrase ditemukan: {norm_pair} - Beli di {buy_exchange.upper()} ({buy_price}), Jual di {sell_exchange.upper()} ({sell_price}), Profit: ${gross_profit_usd:.2f}, ROI: {roi:.2f}%")
-                except Exception as e:
-                    logger.error(f"Error menghitung arbitrase untuk {norm_pair}: {e}")
-
-        # Urutkan berdasarkan keuntungan (tertinggi ke terendah)
-        opportunities.sort(key=lambda x: x["gross_profit_usd"], reverse=True)
-
-        # Simpan top 5 peluang
-        with self.lock:
-            self.arbitrage_opportunities = opportunities[:5]
-
-            # Tampilkan peluang
-            if self.arbitrage_opportunities:
-                self.display_opportunities()
-
-            # Log statistik
-            logger.info(f"Statistik: Diperiksa {checked_pairs} pasangan, {potential_pairs} pasangan potensial, {len(opportunities)} peluang arbitrase ditemukan")
+                potential_pairs += 1
+
+                # Jumlah yang dibeli dengan modal bernilai tepat MODAL_USD di harga beli, jadi
+                # keuntungan kotor = MODAL_USD * (rasio * (1 - fee) - (1 + fee))
+                gross_profit_usd = MODAL_USD * (price_ratio * SELL_NET_FACTOR - BUY_COST_FACTOR)
+
+                # Hitung ROI
+                roi = (gross_profit_usd / MODAL_USD) * 100
+
+                # Jika menguntungkan
+                if gross_profit_usd > 0:
+                    # Disimpan sebagai tuple (urutan OPPORTUNITY_FIELDS); dict hanya dibangun untuk top 5
+                    opportunities.append((
+                        norm_pair, binance_symbol, kucoin_symbol, binance_price, kucoin_price,
+                        price_diff_pct, buy_exchange, sell_exchange, gross_profit_usd, roi
+                    ))
+                    logger.info(f"Peluang arbitrase ditemukan: {norm_pair} - Beli di {buy_exchange.upper()} ({buy_price}), Jual di {sell_exchange.upper()} ({sell_price}), Profit: ${gross_profit_usd:.2f}, ROI: {roi:.2f}%")
+            except Exception as e:
+                logger.error(f"Error menghitung arbitrase untuk {norm_pair}: {e}")
+
+        # Simpan top 5 peluang (keuntungan tertinggi ke terendah); heap O(N log 5) menggantikan
+        # pengurutan seluruh daftar. Waktu disimpan sebagai integer nanodetik dan baru
+        # diformat saat ditampilkan
+        scan_time_ns = time.time_ns()
+        self.arbitrage_opportunities = [
+            dict(zip(OPPORTUNITY_FIELDS, opportunity), timestamp_ns=scan_time_ns)
+            for opportunity in heapq.nlargest(5, opportunities, key=OPPORTUNITY_PROFIT_KEY)
+        ]
+
+        # Tampilkan peluang
+        if self.arbitrage_opportunities:
+            self.display_opportunities()
+
+        # Log statistik
+        logger.info(f"Statistik: Diperiksa {checked_pairs} pasangan, {potential_pairs} pasangan potensial, {len(opportunities)} peluang arbitrase ditemukan")
 
     def display_opportunities(self):
         """Menampilkan peluang arbitrase"""
@@ -207,12 +255,8 @@ class SimpleArbitrage:
             header_style="bold magenta"
         )
 
-        table.add_column("Pasangan", style="cyan")
-        table.add_column("Beli di", style="green")
-        table.add_column("Jual di", style="red")
-        table.add_column("Selisih %", justify="right", style="yellow")
-        table.add_column("Profit (USD)", justify="right", style="green")
-        table.add_column("ROI %", justify="right", style="cyan")
+        for header, column_options in OPPORTUNITY_TABLE_COLUMNS:
+            table.add_column(header, **column_options)
 
         for opp in self.arbitrage_opportunities:
             table.add_row(
@@ -225,62 +269,80 @@ class SimpleArbitrage:
             )
 
         console.print(table)
-        console.print(f"Waktu: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        scan_time = datetime.fromtimestamp(self.arbitrage_opportunities[0]["timestamp_ns"] / 1e9)
+        console.print(f"Waktu: {scan_time.strftime('%Y-%m-%d %H:%M:%S')}")
         console.print(f"Jumlah pasangan umum: {len(self.normalized_pairs)}")
-        console.print(f"Jumlah simbol Binance: {len(self.binance_symbols)}")
-        console.print(f"Jumlah simbol KuCoin: {len(self.kucoin_symbols)}")
+        console.print(f"Jumlah simbol Binance: {len(self.binance_prices)}")
+        console.print(f"Jumlah simbol KuCoin: {len(self.kucoin_prices)}")
         console.print("=" * 80)
 
     async def binance_websocket(self):
-        """Menangani koneksi WebSocket ke Binance"""
-        try:
-            # Berlangganan ke semua ticker
-            subscribe_msg = {
-                "method": "SUBSCRIBE",
-                "params": ["!ticker@arr"],
-                "id": 1
-            }
-
-            async with websockets.connect(BINANCE_WS_URL) as websocket:
-                logger.info("Terhubung ke Binance WebSocket")
-
-                # Kirim pesan berlangganan
-                await websocket.send(json.dumps(subscribe_msg))
-
-                while self.running:
-                    try:
-                        response = await websocket.recv()
-                        data = json.loads(response)
-
-                        # Periksa apakah ini adalah respons berlangganan
-                        if isinstance(data, dict) and "result" in data:
-                            continue
-
-                        # Proses data ticker
-                        if isinstance(data, list):
-                            with self.lock:
+        """Menangani koneksi WebSocket ke Binance
+
+        Koneksi yang terputus dibuka ulang di loop yang sama dengan exponential
+        backoff, bukan dengan membuat task baru dari dalam handler.
+        """
+        # Berlangganan ke semua ticker
+        subscribe_msg = {
+            "method": "SUBSCRIBE",
+            "params": ["!ticker@arr"],
+            "id": 1
+        }
+        reconnect_delay = RECONNECT_BASE_DELAY
+
+        while self.running:
+            try:
+                async with websockets.connect(BINANCE_WS_URL, **WS_CONNECT_OPTIONS) as websocket:
+                    logger.info("Terhubung ke Binance WebSocket")
+                    reconnect_delay = RECONNECT_BASE_DELAY
+
+                    # Kirim pesan berlangganan
+                    await websocket.send(json.dumps(subscribe_msg))
+
+                    while self.running:
+                        try:
+                            response = await websocket.recv()
+
+                            # Payload !ticker@arr selalu berupa array JSON; frame lain (ack
+                            # berlangganan, dll.) dilewati tanpa di-parse
+                            if response[:1] not in ("[", b"["):
+                                continue
+
+                            data = json_loads(response)
+
+                            # Proses data ticker
+                            # Handler hanya memperbarui harga; perhitungan dilakukan oleh compute_loop
+                            if isinstance(data, list):
+                                # Harga dikonversi ke float sekali saat diterima, bukan pada setiap perhitungan
                                 for ticker in data:
                                     symbol = ticker["s"]
-                                    price = ticker["c"]  # Harga penutupan
+                                    try:
+                                        price = float(ticker["c"])  # Harga penutupan
+                                    except (TypeError, ValueError):
+                                        continue
+                                    # Tabel harga sekaligus menjadi daftar simbol yang sudah dikenal
+                                    if symbol not in self.binance_prices:
+                                        self.add_symbol(symbol, "binance")
                                     self.binance_prices[symbol] = price
-                                    self.binance_symbols.add(symbol)
 
-                            # Temukan pasangan umum setelah mendapatkan data
-                            if self.binance_symbols and self.kucoin_symbols:
-                                self.find_common_pairs()
+                                # Seluruh array ticker diproses dulu, lalu ditandai sekali per frame;
+                                # frame yang datang beruntun digabung ke satu perhitungan oleh compute_loop
+                                self.prices_changed = True
 
-                            # Hitung peluang arbitrase
-                            self.calculate_arbitrage()
+                        except websockets.exceptions.ConnectionClosed:
+                            # Koneksi terputus: keluar ke loop luar untuk menghubungkan ulang
+                            raise
+                        except Exception as e:
+                            logger.error(f"Error memproses data Binance: {e}")
+                            await asyncio.sleep(1)
 
-                    except Exception as e:
-                        logger.error(f"Error memproses data Binance: {e}")
-                        await asyncio.sleep(1)
+            except Exception as e:
+                logger.error(f"Error koneksi Binance WebSocket: {e}")
 
-        except Exception as e:
-            logger.error(f"Error koneksi Binance WebSocket: {e}")
-            # Coba hubungkan kembali setelah beberapa detik
-            await asyncio.sleep(5)
-            asyncio.create_task(self.binance_websocket())
+            if self.running:
+                # Coba hubungkan kembali dengan jeda yang makin panjang jika terus gagal
+                await asyncio.sleep(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 2, RECONNECT_MAX_DELAY)
 
     async def kucoin_ping(self, websocket):
         """Mengirim ping ke server KuCoin untuk menjaga koneksi"""
@@ -293,76 +355,118 @@ class SimpleArbitrage:
                 break
 
     async def kucoin_websocket(self):
-        """Menangani koneksi WebSocket ke KuCoin"""
-        try:
-            # Dapatkan token WebSocket jika belum ada
-            if not self.kucoin_ws_url:
-                success = await self.get_kucoin_ws_token()
-                if not success:
-                    logger.error("Gagal mendapatkan token KuCoin WebSocket")
-                    await asyncio.sleep(5)
-                    asyncio.create_task(self.kucoin_websocket())
-                    return
-
-            async with websockets.connect(self.kucoin_ws_url) as websocket:
-                logger.info("Terhubung ke KuCoin WebSocket")
-
-                # Mulai task ping
-                ping_task = asyncio.create_task(self.kucoin_ping(websocket))
-
-                # Berlangganan ke semua ticker
-                subscribe_msg = {
-                    "id": int(time.time() * 1000),
-                    "type": "subscribe",
-                    "topic": "/market/ticker:all",
-                    "privateChannel": False,
-                    "response": True
-                }
+        """Menangani koneksi WebSocket ke KuCoin
 
-                await websocket.send(json.dumps(subscribe_msg))
+        Koneksi yang terputus dibuka ulang di loop yang sama dengan exponential
+        backoff, bukan dengan membuat task baru dari dalam handler.
+        """
+        reconnect_delay = RECONNECT_BASE_DELAY
 
-                while self.running:
-                    try:
-                        response = await websocket.recv()
-                        data = json.loads(response)
-
-                        # Periksa tipe pesan
-                        if data.get("type") == "message" and data.get("topic") == "/market/ticker:all":
-                            symbol = data["subject"]
-                            price = data["data"]["price"]
-
-                            with self.lock:
-                                self.kucoin_prices[symbol] = price
-                                self.kucoin_symbols.add(symbol)
+        while self.running:
+            try:
+                # Dapatkan token WebSocket jika belum ada
+                if not self.kucoin_ws_url and not await self.get_kucoin_ws_token():
+                    logger.error("Gagal mendapatkan token KuCoin WebSocket")
+                else:
+                    async with websockets.connect(self.kucoin_ws_url, **WS_CONNECT_OPTIONS) as websocket:
+                        logger.info("Terhubung ke KuCoin WebSocket")
+                        reconnect_delay = RECONNECT_BASE_DELAY
+
+                        # Mulai task ping
+                        ping_task = asyncio.create_task(self.kucoin_ping(websocket))
+
+                        try:
+                            # Berlangganan ke semua ticker
+                            subscribe_msg = {
+                                "id": int(time.time() * 1000),
+                                "type": "subscribe",
+                                "topic": "/market/ticker:all",
+                                "privateChannel": False,
+                                "response": True
+                            }
+
+                            await websocket.send(json.dumps(subscribe_msg))
+
+                            while self.running:
+                                try:
+                                    response = await websocket.recv()
+
+                                    # Pong dan welcome tidak membawa harga; lewati sebelum di-parse
+                                    if any(marker in response for marker in KUCOIN_CONTROL_MARKERS):
+                                        continue
+
+                                    data = json_loads(response)
+
+                                    # Periksa tipe pesan
+                                    if data.get("type") == "message" and data.get("topic") == "/market/ticker:all":
+                                        symbol = data["subject"]
+                                        try:
+                                            price = float(data["data"]["price"])
+                                        except (TypeError, ValueError):
+                                            continue
+
+                                        # Topik ini mengirim satu pesan per simbol; pesan hanya memperbarui
+                                        # harga dan menandai perubahan, perhitungan dilakukan oleh compute_loop.
+                                        # Update dengan harga yang sama tidak memicu perhitungan ulang
+                                        previous_price = self.kucoin_prices.get(symbol)
+                                        if previous_price is None:
+                                            self.add_symbol(symbol, "kucoin")
+                                        elif previous_price == price:
+                                            continue
+                                        self.kucoin_prices[symbol] = price
+                                        self.prices_changed = True
+
+                                    elif data.get("type") == "pong":
+                                        # Respons ping, tidak perlu diproses
+                                        pass
+
+                                except websockets.exceptions.ConnectionClosed:
+                                    # Koneksi terputus: keluar ke loop luar untuk menghubungkan ulang
+                                    raise
+                                except Exception as e:
+                                    logger.error(f"Error memproses data KuCoin: {e}")
+                                    await asyncio.sleep(1)
+                        finally:
+                            # Batalkan task ping setiap kali koneksi ditutup
+                            ping_task.cancel()
 
-                            # Temukan pasangan umum setelah mendapatkan data
-                            if self.binance_symbols and self.kucoin_symbols:
-                                self.find_common_pairs()
+            except Exception as e:
+                logger.error(f"Error koneksi KuCoin WebSocket: {e}")
+                # Token bisa sudah kedaluwarsa; minta token baru saat menghubungkan ulang
+                self.kucoin_ws_url = None
 
-                        elif data.get("type") == "pong":
-                            # Respons ping, tidak perlu diproses
-                            pass
+            if self.running:
+                # Coba hubungkan kembali dengan jeda yang makin panjang jika terus gagal
+                await asyncio.sleep(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 2, RECONNECT_MAX_DELAY)
 
-                    except Exception as e:
-                        logger.error(f"Error memproses data KuCoin: {e}")
-                        await asyncio.sleep(1)
+    async def compute_loop(self):
+        """Menghitung ulang peluang arbitrase secara berkala jika ada harga yang berubah
 
-                # Batalkan task ping jika keluar dari loop
-                ping_task.cancel()
+        Pesan ticker hanya memperbarui harga, sehingga pemindaian semua pasangan
+        dilakukan paling sering sekali per COMPUTE_INTERVAL, bukan pada setiap pesan.
+        """
+        while self.running:
+            await asyncio.sleep(COMPUTE_INTERVAL)
+            if not self.prices_changed:
+                continue
 
-        except Exception as e:
-            logger.error(f"Error koneksi KuCoin WebSocket: {e}")
-            # Reset token dan coba hubungkan kembali
-            self.kucoin_ws_url = None
-            await asyncio.sleep(5)
-            asyncio.create_task(self.kucoin_websocket())
+            try:
+                self.prices_changed = False
+                self.calculate_arbitrage()
+            except Exception as e:
+                logger.error(f"Error menghitung peluang arbitrase: {e}")
 
     async def run(self):
         """Menjalankan program arbitrase"""
+        loop = asyncio.get_running_loop()
+        logger.info(f"Event loop: {type(loop).__module__}.{type(loop).__name__}")
+
         try:
-            # Mulai task WebSocket
+            # Mulai task WebSocket dan task perhitungan arbitrase
             binance_task = asyncio.create_task(self.binance_websocket())
             kucoin_task = asyncio.create_task(self.kucoin_websocket())
+            compute_task = asyncio.create_task(self.compute_loop())
 
             # Tunggu hingga program dihentikan
             status_counter = 0
@@ -371,7 +475,7 @@ class SimpleArbitrage:
                 status_counter += 1
 
                 # Tampilkan status setiap 10 detik
-                logger.info(f"Status: Binance symbols={len(self.binance_symbols)}, KuCoin symbols={len(self.kucoin_symbols)}, Common pairs={len(self.normalized_pairs)}")
+                logger.info(f"Status: Binance symbols={len(self.binance_prices)}, KuCoin symbols={len(self.kucoin_prices)}, Common pairs={len(self.normalized_pairs)}")
 
                 # Tampilkan peluang arbitrase setiap 60 detik
                 if status_counter % 6 == 0 and self.arbitrage_opportunities:
@@ -382,6 +486,7 @@ class SimpleArbitrage:
             # Batalkan task jika program dihentikan
             binance_task.cancel()
             kucoin_task.cancel()
+            compute_task.cancel()
 
         except KeyboardInterrupt:
             logger.info("Program dihentikan oleh pengguna")
@@ -390,6 +495,17 @@ class SimpleArbitrage:
             logger.error(f"Error menjalankan program: {e}")
             self.running = False
 
+def run_event_loop(coro):
+    """Menjalankan coroutine di event loop uvloop jika tersedia, selain itu di loop bawaan asyncio"""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        # loop_factory memakai uvloop khusus untuk runner ini tanpa mengubah policy global
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
 if __name__ == "__main__":
     try:
         console.print("=" * 80)
@@ -402,7 +518,7 @@ if __name__ == "__main__":
 
         # Jalankan program
         arbitrage = SimpleArbitrage()
-        asyncio.run(arbitrage.run())
+        run_event_loop(arbitrage.run())
 
     except KeyboardInterrupt:
         console.print("\n[bold red]Program dihentikan oleh pengguna[/bold red]")
@@ -9,6 +9,7 @@ import requests
 import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(
@@ -21,6 +22,9 @@ logger = logging.getLogger("simple_test")
 BINANCE_REST_URL = "https://api.binance.com/api/v3"
 KUCOIN_API_URL = "https://api.kucoin.com"
 
+# Session bersama: kedua request ke bursa yang sama memakai ulang koneksi keep-alive
+SESSION = requests.Session()
+
 def test_binance():
     """Menguji koneksi ke Binance"""
     print("Menguji koneksi ke Binance...")
@@ -28,7 +32,7 @@ def test_binance():
     try:
         # Ambil informasi bursa
         print("Mengambil informasi bursa Binance...")
-        response = requests.get(f"{BINANCE_REST_URL}/exchangeInfo", timeout=10)
+        response = SESSION.get(f"{BINANCE_REST_URL}/exchangeInfo", timeout=10)
         data = response.json()
         
         if "symbols" in data:
@@ -39,7 +43,7 @@ def test_binance():
             if active_symbols:
                 symbol = active_symbols[0]
                 print(f"Mengambil harga untuk {symbol}...")
-                response = requests.get(f"{BINANCE_REST_URL}/ticker/price?symbol={symbol}", timeout=10)
+                response = SESSION.get(f"{BINANCE_REST_URL}/ticker/price?symbol={symbol}", timeout=10)
                 price_data = response.json()
                 print(f"Harga {symbol}: {price_data['price']}")
                 
@@ -59,7 +63,7 @@ def test_kucoin():
     try:
         # Ambil daftar simbol
         print("Mengambil daftar simbol KuCoin...")
-        response = requests.get(f"{KUCOIN_API_URL}/api/v1/symbols", timeout=10)
+        response = SESSION.get(f"{KUCOIN_API_URL}/api/v1/symbols", timeout=10)
         data = response.json()
         
         if data["code"] == "200000":
@@ -70,7 +74,7 @@ def test_kucoin():
             if active_symbols:
                 symbol = active_symbols[0]
                 print(f"Mengambil harga untuk {symbol}...")
-                response = requests.get(f"{KUCOIN_API_URL}/api/v1/market/orderbook/level1?symbol={symbol}", timeout=10)
+                response = SESSION.get(f"{KUCOIN_API_URL}/api/v1/market/orderbook/level1?symbol={symbol}", timeout=10)
                 price_data = response.json()
                 if price_data["code"] == "200000":
                     print(f"Harga {symbol}: {price_data['data']['price']}")
@@ -91,12 +95,18 @@ def main():
     """Fungsi utama"""
     print("Memulai pengujian koneksi ke bursa...")
     
-    # Uji koneksi ke Binance
-    binance_ok = test_binance()
+    # Uji koneksi ke kedua bursa secara bersamaan agar waktu tunggu hanya selama
+    # pengujian terlama, bukan jumlah seluruh round-trip
+    try:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="probe") as executor:
+            binance_future = executor.submit(test_binance)
+            kucoin_future = executor.submit(test_kucoin)
+        binance_ok = binance_future.result()
+        kucoin_ok = kucoin_future.result()
+    finally:
+        SESSION.close()
+
     print(f"Koneksi ke Binance: {'OK' if binance_ok else 'GAGAL'}")
-    
-    # Uji koneksi ke KuCoin
-    kucoin_ok = test_kucoin()
     print(f"Koneksi ke KuCoin: {'OK' if kucoin_ok else 'GAGAL'}")
     
     # Hasil
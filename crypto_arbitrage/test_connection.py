@@ -12,6 +12,13 @@ import requests
 import logging
 from datetime import datetime
 
+# orjson opsional: parser JSON lebih cepat untuk pesan ticker WebSocket
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Konfigurasi logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,8 +33,11 @@ KUCOIN_API_URL = "https://api.kucoin.com"
 async def get_kucoin_ws_token():
     """Mendapatkan token untuk koneksi WebSocket KuCoin"""
     try:
-        response = requests.post(f"{KUCOIN_API_URL}/api/v1/bullet-public")
-        data = response.json()
+        # requests bersifat blocking; jalankan di thread agar event loop tetap memproses pesan WebSocket
+        response = await asyncio.to_thread(
+            requests.post, f"{KUCOIN_API_URL}/api/v1/bullet-public", timeout=10
+        )
+        data = json_loads(response.content)
         if data["code"] == "200000":
             token = data["data"]["token"]
             server = data["data"]["instanceServers"][0]
@@ -68,7 +78,7 @@ async def test_binance():
             # Terima data ticker
             for _ in range(5):  # Terima 5 pesan
                 response = await websocket.recv()
-                data = json.loads(response)
+                data = json_loads(response)
                 logger.info(f"Data Binance: {data}")
                 await asyncio.sleep(1)
             
@@ -116,7 +126,7 @@ async def test_kucoin():
             # Terima data ticker
             for _ in range(5):  # Terima 5 pesan
                 response = await websocket.recv()
-                data = json.loads(response)
+                data = json_loads(response)
                 logger.info(f"Data KuCoin: {data}")
                 await asyncio.sleep(1)
             
@@ -7,7 +7,9 @@ Modul untuk menangani tampilan UI dengan Rich
 
 import time
 import logging
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
 
 from rich.console import Console
@@ -24,6 +26,24 @@ from utils import format_currency
 
 logger = logging.getLogger("crypto_arbitrage.ui")
 
+# Nama bursa untuk ditampilkan, disiapkan sekali alih-alih .upper() per baris setiap frame
+EXCHANGE_DISPLAY_NAMES = {"binance": "BINANCE", "kucoin": "KUCOIN"}
+
+# Jumlah baris terformat yang disimpan di cache tabel peluang
+ROW_CACHE_SIZE = 4 * UI_MAX_OPPORTUNITIES
+
+def opportunity_row_key(opp: Dict) -> tuple:
+    """Semua field peluang yang ditampilkan dalam satu baris tabel
+
+    Dipakai sebagai sidik jari tabel dan kunci cache baris, sehingga perubahan
+    pada field apa pun yang terlihat selalu memicu render ulang.
+    """
+    return (
+        opp["pair"], opp["buy_exchange"], opp["sell_exchange"],
+        opp["price_diff_pct"], opp["net_profit_usd"], opp["roi"],
+        opp["base_asset"], opp["base_network"], opp["quote_asset"], opp["quote_network"]
+    )
+
 class ArbitrageUI:
     """Kelas untuk menangani tampilan UI"""
     
@@ -37,6 +57,19 @@ class ArbitrageUI:
         self.live = None
         self.last_update = datetime.now()
         self.running = True
+        
+        # Di-set oleh detektor arbitrase saat ada peluang baru
+        self._data_event = threading.Event()
+        
+        # Kunci data terakhir yang dirender; panel hanya dibangun ulang jika kuncinya berubah
+        self._last_opportunities_key = None
+        self._last_status_key = None
+        self._last_clock_second = None
+        
+        self._row_cache = OrderedDict()  # Kunci nilai peluang -> sel tabel yang sudah diformat
+        
+        # Header statis, cukup dibangun sekali
+        self.layout["header"].update(self._generate_header())
     
     def _create_layout(self) -> Layout:
         """Membuat layout untuk UI"""
@@ -54,6 +87,12 @@ class ArbitrageUI:
             Layout(name="status", ratio=1)
         )
         
+        # Pisahkan jam dari isi panel status agar bisa diperbarui sendiri
+        layout["status"].split(
+            Layout(name="status_body"),
+            Layout(name="clock", size=1)
+        )
+        
         return layout
     
     def _generate_header(self) -> Panel:
@@ -69,8 +108,8 @@ class ArbitrageUI:
             title_align="center"
         )
     
-    def _generate_opportunities_table(self) -> Table:
-        """Membuat tabel peluang arbitrase"""
+    def _create_opportunities_table(self) -> Table:
+        """Membuat tabel peluang arbitrase kosong (hanya kolom, tanpa baris)"""
         table = Table(
             title="Peluang Arbitrase Terkini",
             box=box.SIMPLE_HEAD,
@@ -90,8 +129,46 @@ class ArbitrageUI:
         table.add_column("Profit (IDR)", justify="right", style="green bold")
         table.add_column("ROI %", justify="right", style="cyan bold")
         
-        # Dapatkan peluang arbitrase
-        opportunities = self.arbitrage.get_opportunities()
+        return table
+    
+    def _format_opportunity_row(self, opp: Dict) -> tuple:
+        """Memformat satu peluang arbitrase menjadi sel-sel tabel
+        
+        Baris yang sudah pernah diformat diambil dari cache LRU kecil, sehingga
+        baris yang tidak berubah antar frame tidak diformat ulang.
+        """
+        row_key = opportunity_row_key(opp)
+        row = self._row_cache.get(row_key)
+        if row is not None:
+            self._row_cache.move_to_end(row_key)
+            return row
+        
+        # Konversi profit ke IDR
+        profit_idr = opp["net_profit_usd"] * self.idr_rate
+        
+        row = (
+            opp["pair"],
+            EXCHANGE_DISPLAY_NAMES[opp["buy_exchange"]],
+            EXCHANGE_DISPLAY_NAMES[opp["sell_exchange"]],
+            f"{opp['price_diff_pct']:.2f}%",
+            f"{opp['base_asset']}: {opp['base_network']}, {opp['quote_asset']}: {opp['quote_network']}",
+            format_currency(round(opp["net_profit_usd"], 2), "USD"),
+            format_currency(round(profit_idr, 2), "IDR"),
+            f"{opp['roi']:.2f}%"
+        )
+        
+        self._row_cache[row_key] = row
+        if len(self._row_cache) > ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+        return row
+    
+    def _build_opportunities_table(self, opportunities: Sequence[Dict]) -> Table:
+        """Membangun tabel peluang baru dari baris-baris yang sudah diformat
+        
+        Hanya dipanggil saat kunci peluang berubah; sel yang sama diambil dari
+        cache baris sehingga pembangunan ulang tetap murah.
+        """
+        table = self._create_opportunities_table()
         
         if not opportunities:
             table.add_row(
@@ -99,44 +176,36 @@ class ArbitrageUI:
                 "", "", "", "", "", "", "",
                 style="italic"
             )
-        else:
-            # Tambahkan baris untuk setiap peluang
-            for opp in opportunities[:UI_MAX_OPPORTUNITIES]:
-                # Konversi profit ke IDR
-                profit_idr = opp["net_profit_usd"] * self.idr_rate
-                
-                table.add_row(
-                    opp["pair"],
-                    opp["buy_exchange"].upper(),
-                    opp["sell_exchange"].upper(),
-                    f"{opp['price_diff_pct']:.2f}%",
-                    f"{opp['base_asset']}: {opp['base_network']}, {opp['quote_asset']}: {opp['quote_network']}",
-                    format_currency(opp["net_profit_usd"], "USD"),
-                    format_currency(profit_idr, "IDR"),
-                    f"{opp['roi']:.2f}%"
-                )
+            return table
         
+        for opp in opportunities[:UI_MAX_OPPORTUNITIES]:
+            table.add_row(*self._format_opportunity_row(opp))
         return table
     
-    def _generate_status_panel(self) -> Panel:
-        """Membuat panel status"""
-        binance_status = "✅ Terhubung" if self.binance.is_connected() else "❌ Terputus"
-        kucoin_status = "✅ Terhubung" if self.kucoin.is_connected() else "❌ Terputus"
+    def _generate_opportunities_table(self, opportunities: Optional[Sequence[Dict]] = None) -> Table:
+        """Membangun ulang dan mengembalikan tabel peluang arbitrase"""
+        if opportunities is None:
+            opportunities = self.arbitrage.get_opportunities()
+        return self._build_opportunities_table(opportunities)
+    
+    def _generate_status_panel(self, status_key: Optional[tuple] = None) -> Panel:
+        """Membuat panel status (tanpa jam, yang punya region layout sendiri)"""
+        if status_key is None:
+            status_key = self._status_key()
         
-        binance_stale = self.binance.is_stale()
-        kucoin_stale = self.kucoin.is_stale()
+        (binance_connected, kucoin_connected, binance_stale, kucoin_stale,
+         binance_symbols, kucoin_symbols, common_pairs, idr_rate) = status_key
+        
+        binance_status = "✅ Terhubung" if binance_connected else "❌ Terputus"
+        kucoin_status = "✅ Terhubung" if kucoin_connected else "❌ Terputus"
         
         binance_data_status = "❌ Data kedaluwarsa" if binance_stale else "✅ Data terkini"
         kucoin_data_status = "❌ Data kedaluwarsa" if kucoin_stale else "✅ Data terkini"
         
-        binance_symbols = len(self.binance.symbols)
-        kucoin_symbols = len(self.kucoin.symbols)
-        common_pairs = len(self.arbitrage.normalized_pairs)
-        
         status_text = Text.assemble(
             Text("Status Koneksi:\n", style="bold"),
-            Text(f"Binance: {binance_status}\n", style="green" if self.binance.is_connected() else "red"),
-            Text(f"KuCoin: {kucoin_status}\n\n", style="green" if self.kucoin.is_connected() else "red"),
+            Text(f"Binance: {binance_status}\n", style="green" if binance_connected else "red"),
+            Text(f"KuCoin: {kucoin_status}\n\n", style="green" if kucoin_connected else "red"),
             
             Text("Status Data:\n", style="bold"),
             Text(f"Binance: {binance_data_status}\n", style="green" if not binance_stale else "red"),
@@ -148,10 +217,7 @@ class ArbitrageUI:
             Text(f"Pasangan umum: {common_pairs}\n\n"),
             
             Text("Kurs:\n", style="bold"),
-            Text(f"IDR/USD: {self.idr_rate:,.2f}\n\n"),
-            
-            Text("Waktu:\n", style="bold"),
-            Text(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            Text(f"IDR/USD: {idr_rate:,.2f}")
         )
         
         return Panel(
@@ -161,16 +227,71 @@ class ArbitrageUI:
             box=box.SIMPLE
         )
     
-    def update_layout(self) -> None:
-        """Update layout dengan data terkini"""
-        self.layout["header"].update(self._generate_header())
-        self.layout["opportunities"].update(self._generate_opportunities_table())
-        self.layout["status"].update(self._generate_status_panel())
+    def _generate_clock(self) -> Text:
+        """Membuat baris jam di bawah panel status"""
+        return Text.assemble(("Waktu: ", "bold"), datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    
+    def _opportunities_key(self, opportunities: Sequence[Dict]) -> tuple:
+        """Sidik jari murah dari peluang yang ditampilkan"""
+        return tuple(opportunity_row_key(opp) for opp in opportunities[:UI_MAX_OPPORTUNITIES])
+    
+    def _status_key(self) -> tuple:
+        """Sidik jari dari data yang ditampilkan di panel status"""
+        return (
+            self.binance.is_connected(),
+            self.kucoin.is_connected(),
+            self.binance.is_stale(),
+            self.kucoin.is_stale(),
+            len(self.binance.symbols),
+            len(self.kucoin.symbols),
+            len(self.arbitrage.normalized_pairs),
+            self.idr_rate,
+        )
+    
+    def notify_data_changed(self) -> None:
+        """Membangunkan loop UI karena ada data baru (aman dipanggil dari thread lain)"""
+        self._data_event.set()
+    
+    def update_layout(self) -> bool:
+        """Update layout dengan data terkini
+        
+        Tabel dan panel hanya dibangun ulang jika data yang ditampilkan berubah,
+        sehingga frame tanpa perubahan tidak membuat renderable baru.
+        
+        Returns:
+            True jika ada bagian layout yang diperbarui
+        """
+        changed = False
+        
+        # Snapshot peluang diambil sekali per frame untuk sidik jari dan tabel
+        opportunities = self.arbitrage.get_opportunities()
+        opportunities_key = self._opportunities_key(opportunities)
+        if opportunities_key != self._last_opportunities_key:
+            self._last_opportunities_key = opportunities_key
+            self.layout["opportunities"].update(self._generate_opportunities_table(opportunities))
+            changed = True
+        
+        status_key = self._status_key()
+        if status_key != self._last_status_key:
+            self._last_status_key = status_key
+            self.layout["status_body"].update(self._generate_status_panel(status_key))
+            changed = True
+        
+        # Jam (resolusi detik) ada di region satu baris sendiri, sehingga detik yang
+        # berganti tidak membuat ulang panel status
+        clock_second = int(time.time())
+        if clock_second != self._last_clock_second:
+            self._last_clock_second = clock_second
+            self.layout["clock"].update(self._generate_clock())
+            changed = True
+        
+        return changed
     
     def start(self) -> None:
         """Mulai UI dengan Live display"""
         try:
-            with Live(self.layout, refresh_per_second=1/UI_REFRESH_RATE, screen=True) as live:
+            # Refresh otomatis dimatikan: tampilan hanya digambar ulang jika layout berubah
+            with Live(self.layout, auto_refresh=False, screen=True) as live:
                 self.live = live
                 
                 # Tampilkan pesan selamat datang
@@ -179,17 +300,16 @@ class ArbitrageUI:
                 
                 # Update layout pertama kali
                 self.update_layout()
+                live.refresh()
                 
-                # Loop utama UI
+                # Loop utama UI: bangun saat ada data baru, atau paling lambat setiap
+                # UI_REFRESH_RATE detik untuk memperbarui jam di panel status
                 while self.running:
-                    # Update layout
-                    self.update_layout()
-                    
-                    # Refresh Live display
-                    live.refresh()
+                    if self._data_event.wait(timeout=UI_REFRESH_RATE):
+                        self._data_event.clear()
                     
-                    # Tunggu sebelum update berikutnya
-                    time.sleep(UI_REFRESH_RATE)
+                    if self.update_layout():
+                        live.refresh()
         
         except KeyboardInterrupt:
             logger.info("UI dihentikan oleh pengguna")
@@ -7,17 +7,36 @@ Utilitas untuk program Crypto Arbitrage Scanner
 
 import requests
 import json
+import functools
 import logging
+import math
+import operator
+import random
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson opsional: parser JSON lebih cepat langsung dari bytes respons
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 logger = logging.getLogger("crypto_arbitrage.utils")
 
+@functools.lru_cache(maxsize=4096)
 def format_currency(amount: float, currency: str = "IDR", precision: int = 2) -> str:
     """
     Format angka sebagai mata uang
 
+    Hasil di-cache (LRU terbatas); bulatkan amount ke presisi tampilan di
+    pemanggil agar nilai yang sama di setiap frame mengenai cache.
+
     Args:
         amount: Jumlah yang akan diformat
         currency: Kode mata uang (IDR, USD, dll)
@@ -33,10 +52,82 @@ def format_currency(amount: float, currency: str = "IDR", precision: int = 2) ->
     else:
         return f"{currency} {amount:,.{precision}f}"
 
+EXCHANGE_RATE_URL = "https://api.exchangerate-api.com/v4/latest/{}"
+EXCHANGE_RATE_TTL = 3600  # Umur maksimal kurs di cache dalam detik
+EXCHANGE_RATE_TIMEOUT = (3.05, 5)  # Timeout request kurs (connect, read) dalam detik
+
+# Session bersama untuk request kurs: koneksi keep-alive dipakai ulang dan error
+# sementara diulang dengan backoff sebelum jatuh ke nilai default
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"])
+    )
+))
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# Cache kurs: (mata uang asal, mata uang tujuan) -> (kurs, waktu monotonic diambil)
+_RATE_CACHE: Dict[Tuple[str, str], Tuple[float, float]] = {}
+_RATE_REFRESHING = set()  # Pasangan kurs yang sedang diperbarui di background
+_RATE_FAILURES: Dict[Tuple[str, str], int] = {}  # Jumlah kegagalan beruntun per pasangan
+_RATE_RETRY_AT: Dict[Tuple[str, str], float] = {}  # Waktu monotonic paling awal untuk mencoba lagi
+_RATE_LOCK = threading.Lock()
+
+def _default_exchange_rate(from_currency: str, to_currency: str) -> float:
+    """Nilai kurs default jika API tidak tersedia"""
+    if from_currency == "USD" and to_currency == "IDR":
+        return 15000
+    elif from_currency == "IDR" and to_currency == "USD":
+        return 1/15000
+    return 1.0
+
+def _fetch_exchange_rate(from_currency: str, to_currency: str) -> Optional[float]:
+    """
+    Mengambil kurs dari API dan menyimpannya ke cache
+
+    Returns:
+        Nilai kurs, atau None jika gagal (percobaan berikutnya ditunda dengan exponential backoff)
+    """
+    key = (from_currency, to_currency)
+    try:
+        response = _SESSION.get(EXCHANGE_RATE_URL.format(from_currency), timeout=EXCHANGE_RATE_TIMEOUT)
+        data = json_loads(response.content)
+        rate = float(data["rates"][to_currency])
+    except Exception as e:
+        logger.error(f"Error mendapatkan kurs {from_currency}/{to_currency}: {e}")
+        with _RATE_LOCK:
+            failures = _RATE_FAILURES.get(key, 0)
+            _RATE_FAILURES[key] = failures + 1
+            _RATE_RETRY_AT[key] = time.monotonic() + exponential_backoff(failures)
+        return None
+
+    with _RATE_LOCK:
+        _RATE_CACHE[key] = (rate, time.monotonic())
+        _RATE_FAILURES.pop(key, None)
+        _RATE_RETRY_AT.pop(key, None)
+    return rate
+
+def _refresh_exchange_rate(from_currency: str, to_currency: str) -> None:
+    """Memperbarui kurs di background thread lalu melepas penanda refresh"""
+    try:
+        _fetch_exchange_rate(from_currency, to_currency)
+    finally:
+        with _RATE_LOCK:
+            _RATE_REFRESHING.discard((from_currency, to_currency))
+
 def get_exchange_rate(from_currency: str, to_currency: str) -> float:
     """
     Mendapatkan kurs mata uang dari API
 
+    Kurs di-cache selama EXCHANGE_RATE_TTL. Hanya pengambilan pertama yang
+    blocking; kurs yang kedaluwarsa diperbarui di background thread sementara
+    nilai terakhir yang valid langsung dikembalikan.
+
     Args:
         from_currency: Mata uang asal
         to_currency: Mata uang tujuan
@@ -44,29 +135,41 @@ def get_exchange_rate(from_currency: str, to_currency: str) -> float:
     Returns:
         Nilai kurs
     """
-    try:
-        response = requests.get(f"https://api.exchangerate-api.com/v4/latest/{from_currency}")
-        data = response.json()
-        return data["rates"][to_currency]
-    except Exception as e:
-        logger.error(f"Error mendapatkan kurs {from_currency}/{to_currency}: {e}")
+    key = (from_currency, to_currency)
+    now = time.monotonic()
+
+    with _RATE_LOCK:
+        cached = _RATE_CACHE.get(key)
+        if cached is not None and now - cached[1] < EXCHANGE_RATE_TTL:
+            return cached[0]
+        if now < _RATE_RETRY_AT.get(key, 0):
+            # Masih dalam jeda backoff setelah kegagalan
+            return cached[0] if cached is not None else _default_exchange_rate(from_currency, to_currency)
+        if cached is not None:
+            if key not in _RATE_REFRESHING:
+                _RATE_REFRESHING.add(key)
+                threading.Thread(
+                    target=_refresh_exchange_rate,
+                    args=key,
+                    name=f"exchange-rate-{from_currency}-{to_currency}",
+                    daemon=True
+                ).start()
+            return cached[0]
+
+    # Belum ada nilai di cache: ambil secara langsung (hanya saat pertama kali)
+    rate = _fetch_exchange_rate(from_currency, to_currency)
+    if rate is None:
         # Nilai default jika API tidak tersedia
-        if from_currency == "USD" and to_currency == "IDR":
-            return 15000
-        elif from_currency == "IDR" and to_currency == "USD":
-            return 1/15000
-        return 1.0
+        return _default_exchange_rate(from_currency, to_currency)
+    return rate
 
-def calculate_profit(
-    buy_price: float,
-    sell_price: float,
-    quantity: float,
-    buy_fee_pct: float,
-    sell_fee_pct: float,
-    withdrawal_fee: float = 0
-) -> Dict[str, float]:
+def calculate_profit_batch(buy_price, sell_price, quantity, buy_fee_pct, sell_fee_pct, withdrawal_fee=0) -> Dict[str, Any]:
     """
-    Menghitung keuntungan dari arbitrase
+    Menghitung keuntungan arbitrase untuk satu atau banyak pasangan sekaligus
+
+    Hanya memakai operator aritmatika, sehingga argumen boleh berupa float atau
+    array NumPy (yang bisa di-broadcast) untuk menghitung seluruh kandidat dalam
+    satu pass vektor tanpa loop Python.
 
     Args:
         buy_price: Harga beli
@@ -77,20 +180,24 @@ def calculate_profit(
         withdrawal_fee: Biaya penarikan (dalam mata uang dasar)
 
     Returns:
-        Dictionary berisi keuntungan kotor dan bersih
+        Dictionary berisi keuntungan kotor, bersih, dan ROI (tipe mengikuti input)
     """
+    # Nilai beli dan jual dihitung sekali lalu dipakai ulang
+    cost = quantity * buy_price
+    revenue = quantity * sell_price
+
     # Biaya trading
-    buy_fee = (quantity * buy_price) * (buy_fee_pct / 100)
-    sell_fee = (quantity * sell_price) * (sell_fee_pct / 100)
+    buy_fee = cost * (buy_fee_pct / 100)
+    sell_fee = revenue * (sell_fee_pct / 100)
 
     # Keuntungan kotor (tanpa biaya penarikan)
-    gross_profit = (quantity * sell_price) - (quantity * buy_price) - buy_fee - sell_fee
+    gross_profit = revenue - cost - buy_fee - sell_fee
 
     # Keuntungan bersih (dengan biaya penarikan)
     net_profit = gross_profit - withdrawal_fee
 
     # ROI
-    roi = (net_profit / (quantity * buy_price)) * 100
+    roi = (net_profit / cost) * 100
 
     return {
         "gross_profit": gross_profit,
@@ -98,6 +205,30 @@ def calculate_profit(
         "roi": roi
     }
 
+def calculate_profit(
+    buy_price: float,
+    sell_price: float,
+    quantity: float,
+    buy_fee_pct: float,
+    sell_fee_pct: float,
+    withdrawal_fee: float = 0
+) -> Dict[str, float]:
+    """
+    Menghitung keuntungan dari arbitrase
+
+    Args:
+        buy_price: Harga beli
+        sell_price: Harga jual
+        quantity: Jumlah yang dibeli/dijual
+        buy_fee_pct: Persentase biaya pembelian
+        sell_fee_pct: Persentase biaya penjualan
+        withdrawal_fee: Biaya penarikan (dalam mata uang dasar)
+
+    Returns:
+        Dictionary berisi keuntungan kotor dan bersih
+    """
+    return calculate_profit_batch(buy_price, sell_price, quantity, buy_fee_pct, sell_fee_pct, withdrawal_fee)
+
 def find_common_networks(
     asset: str,
     binance_networks: Dict[str, List[str]],
@@ -122,6 +253,11 @@ def find_common_networks(
 
     return list(binance_asset_networks & kucoin_asset_networks)
 
+# Quote asset Binance beserta panjang suffix-nya; dicek dari suffix terpanjang
+BINANCE_QUOTE_SUFFIXES = {"USDT": 4, "BUSD": 4, "BTC": 3, "ETH": 3, "BNB": 3, "USD": 3}
+
+# Simbol bursa jarang berubah antar siklus polling, jadi hasil normalisasi di-cache
+@functools.lru_cache(maxsize=8192)
 def normalize_symbol(symbol: str, exchange: str) -> str:
     """
     Menormalisasi nama simbol untuk konsistensi antar bursa
@@ -135,11 +271,11 @@ def normalize_symbol(symbol: str, exchange: str) -> str:
     """
     if exchange == "binance":
         # Binance format: BTCUSDT
-        common_quotes = ["USDT", "BUSD", "BTC", "ETH", "BNB", "USD"]
-        for quote in common_quotes:
-            if symbol.endswith(quote):
-                base = symbol[:-len(quote)]
-                return f"{base}/{quote}"
+        # Dua lookup dict pada suffix 4 dan 3 huruf, bukan endswith untuk setiap quote
+        for length in (4, 3):
+            quote = symbol[-length:]
+            if BINANCE_QUOTE_SUFFIXES.get(quote) == length:
+                return f"{symbol[:-length]}/{quote}"
 
         # Fallback jika tidak ada quote yang cocok
         if len(symbol) > 3:
@@ -150,8 +286,7 @@ def normalize_symbol(symbol: str, exchange: str) -> str:
     elif exchange == "kucoin":
         # KuCoin format: BTC-USDT
         if "-" in symbol:
-            base, quote = symbol.split("-")
-            return f"{base}/{quote}"
+            return symbol.replace("-", "/", 1)
 
     # Jika tidak bisa dinormalisasi, kembalikan simbol asli
     return symbol
@@ -192,18 +327,20 @@ def get_min_withdrawal_fee_network(
     if not networks or asset not in withdrawal_fees:
         return "", 0
 
-    min_fee = float('inf')
-    best_network = networks[0]
+    # Kumpulkan semua (jaringan, biaya) sekali, lalu pilih biaya terendah dengan min() bawaan;
+    # urutan iterasi sama seperti sebelumnya sehingga biaya yang sama tetap memilih jaringan pertama
+    exchange_fees = withdrawal_fees[asset].values()
+    candidates = [
+        (network, fees[network])
+        for network in networks
+        for fees in exchange_fees
+        if network in fees
+    ]
 
-    for network in networks:
-        for exchange in withdrawal_fees[asset]:
-            if network in withdrawal_fees[asset][exchange]:
-                fee = withdrawal_fees[asset][exchange][network]
-                if fee < min_fee:
-                    min_fee = fee
-                    best_network = network
+    if not candidates:
+        return networks[0], float('inf')
 
-    return best_network, min_fee
+    return min(candidates, key=operator.itemgetter(1))
 
 
 def safe_float(value: Any, default: float = 0.0) -> float:
@@ -217,6 +354,18 @@ def safe_float(value: Any, default: float = 0.0) -> float:
     Returns:
         Nilai float
     """
+    # Jalur cepat untuk tipe yang paling sering muncul (float dari JSON, int, string angka)
+    value_type = value.__class__
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value_type is str:
+        try:
+            return float(value)
+        except ValueError:
+            return default
+
     try:
         return float(value)
     except (ValueError, TypeError):
@@ -258,19 +407,44 @@ def exponential_backoff(retry_count: int, base_delay: float = 1.0, max_delay: fl
     Returns:
         Delay dalam detik
     """
-    delay = min(max_delay, base_delay * (2 ** retry_count))
-    # Tambahkan jitter untuk menghindari thundering herd
-    jitter = delay * 0.1 * (time.time() % 1)
+    # Geser bit dibatasi 30 agar tidak membuat integer besar untuk retry_count yang tinggi
+    delay = min(max_delay, base_delay * float(1 << min(retry_count, 30)))
+    # Tambahkan jitter acak untuk menghindari thundering herd
+    jitter = delay * 0.1 * random.random()
     return delay + jitter
 
 
-def validate_arbitrage_opportunity(opportunity: Dict[str, Any], max_roi: float = 100.0) -> Tuple[bool, str]:
+@functools.lru_cache(maxsize=2048)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Mengurai timestamp berformat '%Y-%m-%d %H:%M:%S'
+
+    Timestamp yang sama divalidasi berulang kali, jadi hasilnya di-cache. Format
+    standar diurai langsung per posisi karakter (jauh lebih cepat dari strptime);
+    bentuk lain tetap lewat strptime.
+    """
+    if (len(timestamp) == 19 and timestamp[4] == timestamp[7] == "-" and timestamp[10] == " "
+            and timestamp[13] == timestamp[16] == ":"):
+        return datetime(
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+        )
+    return datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+
+
+def validate_arbitrage_opportunity(
+    opportunity: Dict[str, Any],
+    max_roi: float = 100.0,
+    now: Optional[datetime] = None
+) -> Tuple[bool, str]:
     """
     Memvalidasi peluang arbitrase
 
     Args:
         opportunity: Data peluang arbitrase
         max_roi: ROI maksimum yang dianggap valid
+        now: Waktu acuan; pemanggil yang memvalidasi banyak peluang sekaligus cukup
+            membaca jam sekali dan meneruskannya (default: datetime.now())
 
     Returns:
         (valid, alasan)
@@ -288,13 +462,43 @@ def validate_arbitrage_opportunity(opportunity: Dict[str, Any], max_roi: float =
         return False, "Profit negatif"
 
     # Cek timestamp (tidak lebih dari 5 menit)
-    opp_time = datetime.strptime(opportunity["timestamp"], "%Y-%m-%d %H:%M:%S")
-    if (datetime.now() - opp_time) > timedelta(minutes=5):
+    opp_time = _parse_timestamp(opportunity["timestamp"])
+    if now is None:
+        now = datetime.now()
+    if (now - opp_time) > timedelta(minutes=5):
         return False, "Data sudah kedaluwarsa"
 
     return True, "Valid"
 
 
+def _fill_order_book(orders: List, quantity: float, to_float) -> Tuple[float, float]:
+    """
+    Menelusuri level order book hingga quantity terpenuhi
+
+    Returns:
+        Tuple (jumlah_terisi, nilai_total)
+    """
+    total_quantity = 0.0
+    total_value = 0.0
+
+    for price, qty in orders:
+        price = to_float(price)
+        qty = to_float(qty)
+
+        if total_quantity + qty >= quantity:
+            # Hanya ambil sebagian dari level harga ini
+            remaining = quantity - total_quantity
+            total_value += price * remaining
+            total_quantity += remaining
+            break
+        else:
+            # Ambil semua dari level harga ini
+            total_value += price * qty
+            total_quantity += qty
+
+    return total_quantity, total_value
+
+
 def calculate_accurate_slippage(order_book: Dict, quantity: float, side: str) -> float:
     """
     Menghitung slippage berdasarkan order book
@@ -315,23 +519,12 @@ def calculate_accurate_slippage(order_book: Dict, quantity: float, side: str) ->
     if not orders:
         return 0.0
 
-    total_quantity = 0.0
-    total_value = 0.0
-
-    for price, qty in orders:
-        price = safe_float(price)
-        qty = safe_float(qty)
-
-        if total_quantity + qty >= quantity:
-            # Hanya ambil sebagian dari level harga ini
-            remaining = quantity - total_quantity
-            total_value += price * remaining
-            total_quantity += remaining
-            break
-        else:
-            # Ambil semua dari level harga ini
-            total_value += price * qty
-            total_quantity += qty
+    # Konversi langsung dengan float() tanpa pemanggilan safe_float per level;
+    # hanya jika ada nilai yang tidak valid, ulangi dengan safe_float
+    try:
+        total_quantity, total_value = _fill_order_book(orders, quantity, float)
+    except (ValueError, TypeError):
+        total_quantity, total_value = _fill_order_book(orders, quantity, safe_float)
 
     # Jika tidak cukup likuiditas di order book
     if total_quantity < quantity:
@@ -341,20 +534,23 @@ def calculate_accurate_slippage(order_book: Dict, quantity: float, side: str) ->
     return total_value / total_quantity
 
 
-def is_opportunity_expired(timestamp: str, max_age_seconds: int = 300) -> bool:
+def is_opportunity_expired(timestamp: str, max_age_seconds: int = 300, now: Optional[datetime] = None) -> bool:
     """
     Memeriksa apakah peluang arbitrase sudah kedaluwarsa
 
     Args:
         timestamp: Timestamp dalam format '%Y-%m-%d %H:%M:%S'
         max_age_seconds: Maksimal umur peluang dalam detik
+        now: Waktu acuan (default: datetime.now())
 
     Returns:
         True jika sudah kedaluwarsa, False jika belum
     """
     try:
-        opp_time = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-        age_seconds = (datetime.now() - opp_time).total_seconds()
+        opp_time = _parse_timestamp(timestamp)
+        if now is None:
+            now = datetime.now()
+        age_seconds = (now - opp_time).total_seconds()
         return age_seconds > max_age_seconds
     except Exception:
         # Jika format timestamp tidak valid, anggap sudah kedaluwarsa
@@ -370,9 +566,11 @@ def validate_price_data(price: float, min_price: float = 0.0) -> bool:
         min_price: Harga minimal yang dianggap valid
 
     Returns:
-        True jika valid, False jika tidak
+        True jika valid, False jika tidak (termasuk NaN dan tak hingga)
     """
-    return isinstance(price, (int, float)) and price > min_price
+    # Jalur cepat untuk float (kasus umum) sebelum isinstance; perbandingan berantai
+    # sekaligus menolak NaN dan inf tanpa konversi ke float
+    return (price.__class__ is float or isinstance(price, (int, float))) and min_price < price < math.inf
 
 
 def setup_logging(log_file: str = "arbitrage.log", console_level: int = logging.INFO, file_level: int = logging.DEBUG) -> logging.Logger: